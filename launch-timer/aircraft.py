@@ -3,8 +3,11 @@
 T-38 aircraft animation for flyby sequences - PIXEL ART STYLE.
 """
 
-import random
-import time
+import clock
+import quality
+import rng
+
+_rng = rng.stream('aircraft')
 
 
 class T38Aircraft:
@@ -20,13 +23,13 @@ class T38Aircraft:
         self.aircraft_ids = []
         self.trail_ids = []
         # Set first flyby to happen 45-60 seconds after initialization
-        current_time = time.time() * 1000
-        self.next_flyby_time = current_time + random.randint(45000, 60000)
+        current_time = clock.time_ms()
+        self.next_flyby_time = current_time + _rng.randint(45000, 60000)
         self.last_update_time = 0
         
     def should_start_flyby(self, current_time):
         """Check if it's time to start a new flyby."""
-        actual_current_time = time.time() * 1000
+        actual_current_time = clock.time_ms()
         if not self.active and actual_current_time >= self.next_flyby_time:
             return True
         return False
@@ -36,10 +39,10 @@ class T38Aircraft:
         self.active = True
         
         # Random direction
-        self.direction = random.choice([-1, 1])
+        self.direction = _rng.choice([-1, 1])
         
         # Random height in upper sky area (well above launch tower at y=140)
-        self.y = random.randint(60, 120)
+        self.y = _rng.randint(60, 120)
         
         # Start position off screen
         if self.direction == 1:  # Left to right
@@ -611,8 +614,8 @@ class T38Aircraft:
     
     def draw_trail(self):
         """Draw a contrail/exhaust trail behind the aircraft."""
-        # Clear old trail segments (keep only last 30)
-        while len(self.trail_ids) > 30:
+        # Clear old trail segments (keep only the last few, 30 at full quality)
+        while len(self.trail_ids) > quality.settings['trail_segments']:
             old_trail = self.trail_ids.pop(0)
             try:
                 self.canvas.delete(old_trail)
@@ -640,16 +643,15 @@ class T38Aircraft:
         if not self.active:
             return
         
-        # Move aircraft
-        self.x += self.speed * self.direction
+        # Move aircraft (drawn once per flyby; its items move as one tag)
+        dx = self.speed * self.direction
+        self.x += dx
+        self.canvas.move('aircraft', dx, 0)
         
         # Draw trail occasionally
-        if random.random() < 0.3:
+        if _rng.random() < 0.3:
             self.draw_trail()
         
-        # Redraw aircraft at new position
-        self.draw_aircraft()
-        
         # Check if aircraft has left the screen
         if self.direction == 1 and self.x > 900:
             self.end_flyby()
@@ -663,8 +665,8 @@ class T38Aircraft:
         self.clear_trail()
         
         # Schedule next flyby in 45-60 seconds from NOW
-        current_time = time.time() * 1000
-        self.next_flyby_time = current_time + random.randint(45000, 60000)
+        current_time = clock.time_ms()
+        self.next_flyby_time = current_time + _rng.randint(45000, 60000)
         self.last_update_time = 0
     
     def clear_aircraft(self):
@@ -3,25 +3,89 @@
 API client for fetching rocket launch data.
 """
 
-import requests
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import datetime
+import clock
+import logs
+import tracing
+
+log = logs.get_logger('api')
+
+
+def http_get_json(url, timeout=10, headers=None):
+    """Default transport: GET a URL and decode the JSON body."""
+    # Imported on first use: requests takes longer to import than the
+    # whole display takes to paint its first frame
+    import requests
+    response = requests.get(url, timeout=timeout, headers=headers)
+    response.raise_for_status()
+    return response.json()
+
+
+# Transport used for every API request. Swapped out by the scenario
+# simulator and benchmarks to feed synthetic or recorded payloads.
+_transport = http_get_json
+
+# Per-endpoint request statistics ('launches', 'weather'). Requests run on
+# the BackgroundTasks worker threads, so every update holds stats_lock;
+# readers on other threads take a copy with fetch_stats().
+stats_lock = threading.Lock()
+fetch_counts = {}         # requests made
+fetch_errors = {}         # requests that raised
+fetch_seconds = {}        # total request latency in seconds
+last_success = {}         # clock.time() of the last successful request
+
+
+def set_transport(transport):
+    """Install a transport callable(url, timeout, headers) and return the old one."""
+    global _transport
+    previous = _transport
+    _transport = transport
+    return previous
+
+
+def fetch_stats():
+    """Copies of (fetch_counts, fetch_errors, fetch_seconds, last_success)."""
+    with stats_lock:
+        return dict(fetch_counts), dict(fetch_errors), dict(fetch_seconds), dict(last_success)
+
+
+def _add(stats, endpoint, amount):
+    with stats_lock:
+        stats[endpoint] = stats.get(endpoint, 0) + amount
+
+
+def get_json(endpoint, url, timeout=10, headers=None):
+    """Fetch JSON from a URL through the active transport."""
+    _add(fetch_counts, endpoint, 1)
+    started = time.perf_counter()
+    try:
+        with tracing.recorder.span(f"fetch.{endpoint}", 'network', url=url):
+            data = _transport(url, timeout=timeout, headers=headers)
+    except Exception:
+        _add(fetch_errors, endpoint, 1)
+        raise
+    finally:
+        _add(fetch_seconds, endpoint, time.perf_counter() - started)
+    with stats_lock:
+        last_success[endpoint] = clock.time()
+    return data
 
 
 def fetch_launches(num_launches=5):
     """Fetch the next upcoming rocket launches.
     
     Always fetches fresh data from the API.
-    Returns launches that haven't completed yet.
+    Returns launches that haven't completed yet, or None when the
+    request failed (so an outage is not mistaken for an empty schedule).
     """
     url = f"https://fdo.rocketlaunch.live/json/launches/next/{num_launches}"
     
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_json('launches', url, timeout=10)
         launches = data.get('result', [])
         
-        print(f"\n=== API returned {len(launches)} launches ===")
         
         # Filter to only upcoming launches (not already completed)
         filtered_launches = []
@@ -40,31 +104,28 @@ def fetch_launches(num_launches=5):
             # Get launch time
             launch_time_str = launch.get('t0') or launch.get('win_open')
             
-            print(f"\n{name}")
-            print(f"  Status: {status_name} (id={status_id})")
-            print(f"  Result: {result}")
-            print(f"  T0: {launch_time_str}")
+            log.debug("Launch %s: status=%s (id=%s) result=%s t0=%s",
+                      name, status_name, status_id, result, launch_time_str)
             
             # Skip if launch has a POSITIVE result (1, 2, 3 = already completed)
             if result is not None and result > 0:
-                print(f"  -> SKIPPING (already completed with result={result})")
+                log.debug("Skipping %s (already completed with result=%s)", name, result)
                 continue
             
             # Skip if status is "Launch Successful" 
             if status_id == 3:
-                print(f"  -> SKIPPING (status indicates completed)")
+                log.debug("Skipping %s (status indicates completed)", name)
                 continue
             
             # This is an upcoming launch
-            print(f"  -> KEEPING (upcoming)")
             filtered_launches.append(launch)
         
-        print(f"\n=== Filtered to {len(filtered_launches)} upcoming launches ===\n")
+        log.info("API returned %d launches, %d upcoming", len(launches), len(filtered_launches))
         return filtered_launches
         
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching data: {e}")
-        return []
+    except OSError as e:  # requests' exceptions derive from IOError
+        log.warning("Error fetching launches: %s", e)
+        return None
 
 
 def get_countdown(launch_time_iso):
@@ -74,7 +135,7 @@ def get_countdown(launch_time_iso):
     
     try:
         launch_time = datetime.fromisoformat(launch_time_iso.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
+        now = clock.utcnow()
         delta = launch_time - now
         
         if delta.total_seconds() < 0:
@@ -92,4 +153,15 @@ def get_countdown(launch_time_iso):
             'total_seconds': delta.total_seconds()
         }
     except:
-        return None
\ No newline at end of file
+        return None
+
+def seconds_until(launch_time_iso):
+    """Seconds from now until launch (negative once T-0 has passed)."""
+    if not launch_time_iso:
+        return None
+    
+    try:
+        launch_time = datetime.fromisoformat(launch_time_iso.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return (launch_time - clock.utcnow()).total_seconds()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Background calls for blocking work (network fetches).
+
+Tk may only be touched from the main thread, so a call runs on a worker
+thread and its result is handed back through a queue that the Tk loop
+polls; the callback always runs on the Tk thread:
+
+    tasks = BackgroundTasks(root)
+    tasks.run(lambda: fetch_launches(5), self.on_launches)
+
+With threaded=False (headless tools on a simulated clock) calls run from
+after_idle instead, so runs stay deterministic.
+"""
+
+import queue
+import threading
+
+import logs
+
+log = logs.get_logger('background')
+
+
+class BackgroundTasks:
+    """Runs callables off the Tk thread and delivers results back to it."""
+
+    def __init__(self, root, threaded=True, poll_ms=50):
+        self.root = root
+        self.threaded = threaded
+        self.poll_ms = poll_ms
+        self.results = queue.Queue()
+        self.running = 0
+        self._poll_job = None
+
+    def run(self, func, on_done, name=None):
+        """Call func() in the background, then on_done(result) on the Tk thread."""
+        if not self.threaded:
+            self.root.after_idle(lambda: on_done(func()))
+            return
+        self.running += 1
+        thread = threading.Thread(target=self._call, args=(func, on_done),
+                                  name=name or 'background', daemon=True)
+        thread.start()
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_ms, self.poll)
+
+    def _call(self, func, on_done):
+        try:
+            result = func()
+        except Exception:
+            log.exception("Background call failed")
+            result = None
+        self.results.put((on_done, result))
+
+    def poll(self):
+        """Deliver finished results (Tk thread); keeps polling while calls are running."""
+        self._poll_job = None
+        while True:
+            try:
+                on_done, result = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.running -= 1
+            on_done(result)
+        if self.running:
+            self._poll_job = self.root.after(self.poll_ms, self.poll)
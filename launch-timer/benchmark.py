@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the draw functions, animation ticks and data layer.
+
+Runs headless (no display server needed) on the in-memory canvas from
+headless.py and a simulated clock fixed at night, so every draw path
+(stars, spotlight beams) is exercised. For each case it reports per-call
+latency, canvas operations and memory allocations.
+
+Usage:
+    python benchmark.py                          # run and print results
+    python benchmark.py --save baseline.json     # record a baseline
+    python benchmark.py --compare baseline.json  # fail on regressions
+    python benchmark.py --filter rockets. -n 100
+"""
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import api_client
+import clock
+import logs
+import landscape
+import rng
+import rockets
+import ui_elements
+from flipbook import Flipbook
+from flocking import Flock
+from gator import Gator, FRAME_MS
+from headless import HeadlessRoot, HeadlessCanvas
+from launch_animation import LaunchAnimation
+from weather import WeatherSystem
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+BENCH_START = datetime(2026, 3, 14, 21, 30)  # Local night time
+
+# Values for required draw_* parameters (matched by parameter name)
+DEFAULT_ARGS = {
+    'x': 300,
+    'y': 200,
+    'vehicle_name': 'Falcon 9',
+    'smoke_frame': 40,
+    'countdown': {'days': 0, 'hours': 1, 'minutes': 23, 'seconds': 45, 'total_seconds': 5025},
+}
+
+# Per-function argument overrides so the expensive branches are measured
+CASE_KWARGS = {
+    'landscape.draw_car_vertical': {'x': 300, 'y': 450},
+    'rockets.draw_rocket_on_pad': {'pad_x': 620, 'pad_y': 340},
+}
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name)) as f:
+        return json.load(f)
+
+
+def fixture_transport(url, timeout=10, headers=None):
+    """api_client transport serving the recorded payloads."""
+    if 'wttr.in' in url:
+        return load_fixture('wttr_cape_canaveral.json')
+    return load_fixture('launches_next5.json')
+
+
+class Case:
+    """A benchmark case: a callable run per iteration on a headless canvas."""
+
+    def __init__(self, name, setup):
+        self.name = name
+        self.setup = setup  # () -> (run, canvas, reset)
+
+
+def new_canvas():
+    root = HeadlessRoot(clock.get_clock())
+    return root, HeadlessCanvas(root)
+
+
+def draw_case(module, func):
+    """Case that draws a function onto a fresh canvas each iteration."""
+    name = f"{module.__name__}.{func.__name__}"
+    launch_data = load_fixture('launches_next5.json')['result'][1]
+    values = dict(DEFAULT_ARGS, launch_data=launch_data)
+
+    kwargs = {}
+    params = list(inspect.signature(func).parameters.values())[1:]
+    for param in params:
+        if param.default is inspect.Parameter.empty:
+            if param.name not in values:
+                raise ValueError(f"{name}: no benchmark value for parameter '{param.name}'")
+            kwargs[param.name] = values[param.name]
+    kwargs.update(CASE_KWARGS.get(name, {}))
+
+    def setup():
+        root, canvas = new_canvas()
+
+        def run():
+            func(canvas, **kwargs)
+
+        def reset():
+            canvas.delete('all')
+            root.cancel_all()
+
+        return run, canvas, reset
+
+    return Case(name, setup)
+
+
+def draw_cases():
+    cases = []
+    for module in (landscape, rockets, ui_elements):
+        for func_name, func in inspect.getmembers(module, inspect.isfunction):
+            # Step generators are covered by the draw_* function that drains them
+            if (func_name.startswith('draw_') and func.__module__ == module.__name__
+                    and not inspect.isgeneratorfunction(func)):
+                cases.append(draw_case(module, func))
+    return cases
+
+
+def display_tick_cases():
+    """Cases for each animate_* tick of a headless LaunchPadDisplay."""
+    from main import LaunchPadDisplay
+
+    root, canvas = new_canvas()
+    app = LaunchPadDisplay(root, canvas=canvas, animate=False, work_budget_chunks=4)
+    # Let the startup fetches and the streamed scene finish first
+    root.run_for(1)
+    root.cancel_all()
+
+    names = sorted(name for name in dir(app) if name.startswith('animate_'))
+    names.append('update_countdown')
+    cases = []
+    for method_name in names:
+        def setup(method_name=method_name):
+            method = getattr(app, method_name)
+
+            def run():
+                method()
+
+            def reset():
+                root.cancel_all()
+                # Keep a flyby on screen so the aircraft tick does real work
+                if method_name == 'animate_aircraft' and not app.aircraft.active:
+                    app.aircraft.start_flyby()
+
+            return run, canvas, reset
+
+        cases.append(Case(f"display.{method_name}", setup))
+    return cases
+
+
+def launch_cases():
+    """LaunchAnimation frames at peak venting and peak flame."""
+
+    def make_setup(start_frame, wrap_frame):
+        def setup():
+            root, canvas = new_canvas()
+            rockets.draw_rocket_on_pad(canvas, 'Falcon 9', pad_x=620, pad_y=340)
+            canvas.addtag_withtag('rocket', 'all')
+            anim = LaunchAnimation(canvas, rocket_tag='rocket', initial_x=620,
+                                   initial_y=340, vehicle_name='Falcon 9')
+            anim.is_launching = True
+            anim.launch_frame = start_frame
+            anim.flame_intensity = min(1.0, start_frame / 150)
+            for _ in range(30):
+                anim.animate_launch()
+            root.cancel_all()
+
+            def run():
+                anim.animate_launch()
+
+            def reset():
+                root.cancel_all()
+                if anim.launch_frame >= wrap_frame:
+                    anim.launch_frame = start_frame
+                # Hold the rocket near the pad so it never completes
+                if anim.current_y < 100:
+                    anim.current_y = anim.initial_y
+
+            return run, canvas, reset
+        return setup
+
+    return [
+        Case('launch.animate_launch.venting', make_setup(110, 148)),
+        Case('launch.animate_launch.peak_flame', make_setup(160, 10 ** 9)),
+    ]
+
+
+def weather_cases():
+    def setup():
+        root, canvas = new_canvas()
+        weather = WeatherSystem(canvas)
+        weather.weather_condition = 'thunderstorm'
+        for _ in range(60):  # Fill the rain up to its steady state
+            weather.update()
+
+        def run():
+            weather.update()
+
+        def reset():
+            pass
+
+        return run, canvas, reset
+
+    return [Case('weather.update.thunderstorm', setup)]
+
+
+def flock_cases():
+    """A 120-bird flock already in flight, ticked at full frame rate."""
+    def setup():
+        root, canvas = new_canvas()
+        flock = Flock(canvas)
+        flock.populate(120)
+        for _ in range(300):  # Let the flocks form and fly on screen
+            flock.tick(target=120)
+
+        def run():
+            flock.tick(target=120)
+
+        def reset():
+            pass
+
+        return run, canvas, reset
+
+    return [Case('flocking.tick.120', setup)]
+
+
+def sprite_cases():
+    """Per-frame updates of the precreated sprites (gator, spotlights)."""
+    def gator_setup():
+        root, canvas = new_canvas()
+        gator = Gator(canvas)
+        gator.update(gator.update(0))  # Skip to the start of the surfacing
+
+        def run():
+            delay = gator.update(FRAME_MS)
+            if delay != FRAME_MS:
+                gator.update(delay)  # Skip the still stages: only moving frames count
+
+        def reset():
+            pass
+
+        return run, canvas, reset
+
+    def spotlight_setup():
+        root, canvas = new_canvas()
+        spotlights = Flipbook(canvas, landscape.SPOTLIGHT_REEL, tag='spotlights')
+        poses = ['on', 'bright']
+
+        def run():
+            poses.reverse()
+            spotlights.show(poses[0])
+
+        def reset():
+            pass
+
+        return run, canvas, reset
+
+    return [Case('gator.update.moving', gator_setup), Case('flipbook.spotlights.show', spotlight_setup)]
+
+
+def data_cases():
+    def fetch_setup(fetch):
+        def setup():
+            root, canvas = new_canvas()
+
+            def run():
+                fetch()
+
+            def reset():
+                pass
+
+            return run, canvas, reset
+        return setup
+
+    weather = WeatherSystem(None)
+    return [
+        Case('api.fetch_launches', fetch_setup(lambda: api_client.fetch_launches(5))),
+        Case('weather.fetch_weather', fetch_setup(weather.fetch_weather)),
+    ]
+
+
+def all_cases():
+    return draw_cases() + display_tick_cases() + launch_cases() + weather_cases() + flock_cases() + sprite_cases() + data_cases()
+
+
+def measure(case, iterations, alloc_iterations=10, warmup=3):
+    """Time one case and count its canvas operations and allocations."""
+    rng.seed(1234)
+    run, canvas, reset = case.setup()
+
+    for _ in range(warmup):
+        reset()
+        run()
+
+    times = []
+    ops = 0
+    creates = 0
+    for _ in range(iterations):
+        reset()
+        ops_before = sum(canvas.ops.values())
+        creates_before = canvas.ops['create']
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+        ops += sum(canvas.ops.values()) - ops_before
+        creates += canvas.ops['create'] - creates_before
+
+    # Allocations are measured in a separate pass so tracing doesn't skew timing
+    peaks = []
+    retained = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            reset()
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            run()
+            after, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(after - before)
+    finally:
+        tracemalloc.stop()
+
+    times.sort()
+    return {
+        'iterations': iterations,
+        'median_ms': statistics.median(times) * 1000,
+        'p95_ms': times[min(len(times) - 1, int(len(times) * 0.95))] * 1000,
+        'canvas_ops': ops / iterations,
+        'canvas_creates': creates / iterations,
+        'alloc_peak_kb': statistics.median(peaks) / 1024,
+        'alloc_retained_kb': statistics.median(retained) / 1024,
+    }
+
+
+def run_benchmarks(name_filter=None, iterations=50):
+    """Run every (matching) case under the fixed night clock and fixtures."""
+    sim_clock = clock.SimulatedClock(start=BENCH_START, speed=0)
+    previous_clock = clock.set_clock(sim_clock)
+    previous_transport = api_client.set_transport(fixture_transport)
+    rng.seed(1234)  # The display built for the tick cases draws from the streams too
+    results = {}
+    try:
+        for case in all_cases():
+            if name_filter and name_filter not in case.name:
+                continue
+            results[case.name] = measure(case, iterations)
+    finally:
+        api_client.set_transport(previous_transport)
+        clock.set_clock(previous_clock)
+    return results
+
+
+def compare(results, baseline, threshold, min_delta_ms=0.05):
+    """Return a list of regression messages against a baseline."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if (current['median_ms'] > base['median_ms'] * (1 + threshold)
+                and current['median_ms'] - base['median_ms'] > min_delta_ms):
+            regressions.append(f"{name}: median {base['median_ms']:.3f}ms -> {current['median_ms']:.3f}ms")
+        if current['canvas_ops'] > base['canvas_ops'] * (1 + threshold) + 1:
+            regressions.append(f"{name}: canvas ops {base['canvas_ops']:.1f} -> {current['canvas_ops']:.1f}")
+        if current['alloc_peak_kb'] > base['alloc_peak_kb'] * (1 + threshold) + 1:
+            regressions.append(f"{name}: alloc peak {base['alloc_peak_kb']:.1f}KB -> {current['alloc_peak_kb']:.1f}KB")
+    return regressions
+
+
+def print_results(results):
+    header = f"{'case':<48} {'median ms':>10} {'p95 ms':>9} {'ops':>8} {'creates':>8} {'alloc KB':>9}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        print(f"{name:<48} {r['median_ms']:>10.3f} {r['p95_ms']:>9.3f} {r['canvas_ops']:>8.1f} "
+              f"{r['canvas_creates']:>8.1f} {r['alloc_peak_kb']:>9.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark draw, animation and data functions")
+    parser.add_argument('--filter', help="Only run cases whose name contains this text")
+    parser.add_argument('-n', '--iterations', type=int, default=50)
+    parser.add_argument('--save', help="Save results as a JSON baseline")
+    parser.add_argument('--compare', help="Compare against a JSON baseline and fail on regressions")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed relative slowdown before a case counts as regressed (default 0.25)")
+    args = parser.parse_args(argv)
+    # Log records still go through level checks, but nothing is written
+    logs.setup_logging('WARNING', log_path=None, console=False)
+
+    results = run_benchmarks(args.filter, args.iterations)
+    print_results(results)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'meta': {
+                    'python': platform.python_version(),
+                    'machine': platform.machine(),
+                    'created': datetime.now().isoformat(timespec='seconds'),
+                    'iterations': args.iterations,
+                },
+                'results': results,
+            }, f, indent=2)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+One-time calibration of the visual quality presets per machine.
+
+On the first boot (or with --recalibrate) the display runs a short
+headless stress scene before opening its window: the launch flame at
+its peak, a thunderstorm's rain and a T-38 flyby, all on one in-memory
+canvas. The scene is timed at every quality level and the result is
+stored as a machine profile:
+
+    {"quality": "medium", "tick_ms": 30, "frame_ms": {"high": 18.2, ...}}
+
+Later boots start at the profiled quality level and tick rate right
+away; the quality governor still adapts from there. The headless canvas
+only measures the Python side of a frame (Tk still has to render the
+items), so a level fits when its p90 stays within half the tick.
+
+    python calibration.py               # calibrate and print the profile
+    python calibration.py --save p.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+import clock
+import logs
+import power
+import quality
+import rockets
+from aircraft import T38Aircraft
+from headless import HeadlessRoot, HeadlessCanvas
+from landscape import draw_background
+from launch_animation import LaunchAnimation
+from perf import percentile
+from snapshot import write_json
+from weather import WeatherSystem
+
+log = logs.get_logger('calibration')
+
+
+PROFILE_VERSION = 1
+CALIBRATION_START = datetime(2026, 3, 14, 21, 30)  # Night, so the spotlights are drawn too
+
+# Share of the tick a calibrated frame may use (the rest is left for Tk)
+FRAME_BUDGET = 0.5
+# Slowest tick a profile may ask for (ms)
+MAX_TICK_MS = 60
+
+
+def machine_key():
+    """Identifies the hardware a profile was measured on."""
+    return f"{platform.node()}:{platform.machine()}:{os.cpu_count()}:{platform.python_version()}"
+
+
+class StressScene:
+    """Peak flame, thunderstorm rain and a flyby on a headless canvas."""
+
+    def __init__(self):
+        self.root = HeadlessRoot(clock.get_clock())
+        self.canvas = HeadlessCanvas(self.root)
+        draw_background(self.canvas)
+        rockets.draw_rocket_on_pad(self.canvas, 'Falcon 9', pad_x=620, pad_y=340)
+        self.canvas.addtag_withtag('rocket', 'all')
+        self.launch = LaunchAnimation(self.canvas, rocket_tag='rocket', initial_x=620,
+                                      initial_y=340, vehicle_name='Falcon 9')
+        self.launch.is_launching = True
+        self.weather = WeatherSystem(self.canvas)
+        self.weather.weather_condition = 'thunderstorm'
+        self.aircraft = T38Aircraft(self.canvas)
+
+    def reset(self):
+        """Back to the start of peak flame with full rain and a fresh flyby."""
+        self.launch.launch_frame = 160
+        self.launch.flame_intensity = 1.0
+        self.launch.current_y = self.launch.initial_y
+        if not self.aircraft.active:
+            self.aircraft.start_flyby()
+
+    def frame(self):
+        self.launch.animate_launch()
+        self.weather.update()
+        if not self.aircraft.active:
+            self.aircraft.start_flyby()
+        self.aircraft.update(power.TICK_MS)
+        # The scene's own timers are not wanted; each frame is driven from here
+        self.root.cancel_all()
+        # Hold the rocket near the pad so the flame stays at its peak
+        if self.launch.current_y < 100:
+            self.launch.current_y = self.launch.initial_y
+
+
+def measure_level(scene, level, frames=60, warmup=20):
+    """p90 frame time (ms) of the stress scene at a quality level."""
+    quality.settings.update(quality.LEVELS[level])
+    scene.reset()
+    for _ in range(warmup):
+        scene.frame()
+    times = []
+    for _ in range(frames):
+        started = time.perf_counter()
+        scene.frame()
+        times.append((time.perf_counter() - started) * 1000)
+    return percentile(times, 90)
+
+
+def calibrate(frames=60):
+    """Time the stress scene at every level and build a profile."""
+    sim_clock = clock.SimulatedClock(start=CALIBRATION_START, speed=0)
+    previous_clock = clock.set_clock(sim_clock)
+    previous_settings = dict(quality.settings)
+    try:
+        scene = StressScene()
+        frame_ms = {quality.LEVEL_NAMES[level]: measure_level(scene, level, frames)
+                    for level in range(len(quality.LEVELS))}
+    finally:
+        quality.settings.update(previous_settings)
+        clock.set_clock(previous_clock)
+
+    budget = power.TICK_MS * FRAME_BUDGET
+    fitting = [name for name in quality.LEVEL_NAMES if frame_ms[name] <= budget]
+    if fitting:
+        level_name = fitting[0]
+        tick_ms = power.TICK_MS
+    else:
+        # Even minimal detail is too slow for the nominal tick: tick slower instead
+        level_name = quality.LEVEL_NAMES[-1]
+        tick_ms = min(MAX_TICK_MS, math.ceil(frame_ms[level_name] / FRAME_BUDGET))
+    return {
+        'version': PROFILE_VERSION,
+        'machine': machine_key(),
+        'calibrated_at': datetime.now().isoformat(timespec='seconds'),
+        'quality': level_name,
+        'tick_ms': tick_ms,
+        'frame_ms': {name: round(ms, 3) for name, ms in frame_ms.items()},
+    }
+
+
+def read_profile(path):
+    """Load a profile measured on this machine (None if missing or for other hardware)."""
+    try:
+        with open(path) as f:
+            profile = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        log.warning("Ignoring unreadable machine profile %s: %s", path, e)
+        return None
+    if not isinstance(profile, dict) or profile.get('version') != PROFILE_VERSION:
+        return None
+    if profile.get('machine') != machine_key() or profile.get('quality') not in quality.LEVEL_NAMES:
+        log.info("Machine profile %s is for other hardware; recalibrating", path)
+        return None
+    return profile
+
+
+def load_or_calibrate(path, recalibrate=False):
+    """The machine profile at `path`, calibrating (and saving) it if needed."""
+    profile = None if recalibrate else read_profile(path)
+    if profile is None:
+        started = time.perf_counter()
+        profile = calibrate()
+        log.info("Calibrated in %.1fs: quality %s, tick %dms (p90 frame %s)",
+                 time.perf_counter() - started, profile['quality'], profile['tick_ms'],
+                 ', '.join(f"{name} {ms:.1f}ms" for name, ms in profile['frame_ms'].items()))
+        write_json(path, profile)
+    return profile
+
+
+def apply_profile(profile, app):
+    """Start the quality governor and loop rate at the profiled values."""
+    if quality.governor.adaptive:  # --quality pins the level instead
+        quality.governor.set_level(quality.LEVEL_NAMES.index(profile['quality']), 'machine profile')
+    app.power.set_tick_ms(profile['tick_ms'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate quality presets for this machine")
+    parser.add_argument('-n', '--frames', type=int, default=60, help="Timed frames per level")
+    parser.add_argument('--save', help="Write the profile to this file")
+    args = parser.parse_args(argv)
+    logs.setup_logging('WARNING', log_path=None, console=False)
+
+    profile = calibrate(args.frames)
+    print(json.dumps(profile, indent=2))
+    if args.save:
+        write_json(args.save, profile)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
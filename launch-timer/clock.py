@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Clock service shared by the whole display.
+
+Every module asks this module for the time instead of calling
+datetime.now() / time.time() directly. The active clock can be swapped
+for a SimulatedClock so a full day cycle or launch countdown can be
+run in seconds.
+"""
+
+import time as _time
+from datetime import datetime, timezone
+
+
+class SystemClock:
+    """Wall clock time, sampled once per tick."""
+
+    def __init__(self):
+        self._tick_time = None
+
+    def read(self):
+        """Read the underlying time source (epoch seconds)."""
+        return _time.time()
+
+    def tick(self):
+        """Sample the time source so every reader in this tick agrees."""
+        self._tick_time = self.read()
+        return self._tick_time
+
+    def time(self):
+        """Current time in epoch seconds (the last tick sample if any)."""
+        if self._tick_time is not None:
+            return self._tick_time
+        return self.read()
+
+
+class SimulatedClock(SystemClock):
+    """Clock that runs at any speed factor and can be advanced by hand.
+
+    Args:
+        start: Epoch seconds (or datetime) the simulation starts at
+        speed: Simulated seconds per real second (0 = only moves on advance())
+    """
+
+    def __init__(self, start=None, speed=1.0):
+        super().__init__()
+        if start is None:
+            start = _time.time()
+        elif isinstance(start, datetime):
+            start = start.timestamp()
+        self._base = float(start)
+        self._real_base = _time.monotonic()
+        self.speed = speed
+
+    def read(self):
+        elapsed = _time.monotonic() - self._real_base
+        return self._base + elapsed * self.speed
+
+    def set_speed(self, speed):
+        """Change the speed factor without jumping the simulated time."""
+        self._base = self.read()
+        self._real_base = _time.monotonic()
+        self.speed = speed
+
+    def advance(self, seconds):
+        """Jump the simulated time forward by a number of seconds."""
+        self._base += seconds
+        if self._tick_time is not None:
+            self._tick_time += seconds
+
+    def set_time(self, when):
+        """Jump the simulated time to an absolute epoch time or datetime."""
+        if isinstance(when, datetime):
+            when = when.timestamp()
+        self._base = float(when)
+        self._real_base = _time.monotonic()
+        if self._tick_time is not None:
+            self._tick_time = self._base
+
+
+_clock = SystemClock()
+
+
+def get_clock():
+    """Return the active clock."""
+    return _clock
+
+
+def set_clock(clock):
+    """Install a new active clock and return the previous one."""
+    global _clock
+    previous = _clock
+    _clock = clock
+    return previous
+
+
+def tick():
+    """Sample the active clock once for the current tick."""
+    return _clock.tick()
+
+
+def time():
+    """Current time in epoch seconds."""
+    return _clock.time()
+
+
+def time_ms():
+    """Current time in epoch milliseconds."""
+    return _clock.time() * 1000
+
+
+def now():
+    """Current local time as a naive datetime."""
+    return datetime.fromtimestamp(_clock.time())
+
+
+def utcnow():
+    """Current UTC time as an aware datetime."""
+    return datetime.fromtimestamp(_clock.time(), timezone.utc)
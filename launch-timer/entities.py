@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Column storage for the ambient moving entities (birds, cars, rain).
+
+An EntityStore keeps one list per field instead of one dict per
+entity: positions, velocities and any extra columns the kind needs.
+An entity is a row index. A tick updates whole columns in one pass and
+then issues one canvas move per moving entity, addressed by the group
+tag its items were given on creation (so a six-item car is one `move`,
+not six):
+
+    cars = EntityStore(canvas, 'car', ('state', 'base_speed'))
+    row = cars.add(-50, 429, vx=1.0, items=draw_car(canvas, -50, 429),
+                   state='approaching', base_speed=1.0)
+    cars.advance(scale)           # x += vx * scale for every row
+
+Rows are removed by swapping the last row into the hole, so row
+numbers are only stable until the next remove.
+"""
+
+import itertools
+
+
+class EntityStore:
+    """Struct-of-arrays store for one kind of canvas entity."""
+
+    def __init__(self, canvas, kind, columns=()):
+        self.canvas = canvas
+        self.kind = kind
+        self.columns = ('x', 'y', 'vx', 'vy', 'handle') + tuple(columns)
+        for name in self.columns:
+            setattr(self, name, [])
+        self._serial = itertools.count()
+
+    def __len__(self):
+        return len(self.x)
+
+    def add(self, x, y, vx=0.0, vy=0.0, items=(), **values):
+        """Append an entity and return its row.
+
+        `items` is a single canvas item id (moved directly) or a sequence
+        of ids, which get a shared group tag.
+        """
+        values.update(x=x, y=y, vx=vx, vy=vy, handle=self._group(items))
+        for name in self.columns:
+            getattr(self, name).append(values.get(name))
+        return len(self.x) - 1
+
+    def _group(self, items):
+        if isinstance(items, int):
+            return items
+        tag = f"{self.kind}_{next(self._serial)}"
+        for item in items:
+            self.canvas.addtag_withtag(tag, item)
+        return tag
+
+    def set_items(self, row, items):
+        """Replace a row's canvas items (for redraws that change shape)."""
+        self.canvas.delete(self.handle[row])
+        self.handle[row] = self._group(items)
+
+    def remove(self, row):
+        """Delete a row's items and drop the row (the last row takes its place)."""
+        self.canvas.delete(self.handle[row])
+        for name in self.columns:
+            column = getattr(self, name)
+            column[row] = column[-1]
+            column.pop()
+
+    def clear(self):
+        for handle in self.handle:
+            self.canvas.delete(handle)
+        for name in self.columns:
+            getattr(self, name).clear()
+
+    def advance(self, scale=1):
+        """Move every row by its velocity (times scale), one canvas move per mover."""
+        self.x[:] = [x + vx * scale for x, vx in zip(self.x, self.vx)]
+        self.y[:] = [y + vy * scale for y, vy in zip(self.y, self.vy)]
+        move = self.canvas.move
+        for handle, vx, vy in zip(self.handle, self.vx, self.vy):
+            if vx or vy:
+                move(handle, vx * scale, vy * scale)
+
+    def move_to(self, row, x, y):
+        """Place a row at (x, y), reusing its canvas items."""
+        self.canvas.move(self.handle[row], x - self.x[row], y - self.y[row])
+        self.x[row] = x
+        self.y[row] = y
+
+    def rows_beyond(self, column, limit):
+        """Rows whose value in `column` is above limit, highest row first (safe to remove)."""
+        values = getattr(self, column)
+        return [row for row in range(len(values) - 1, -1, -1) if values[row] > limit]
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Flipbook sprites: every pose drawn once, switched by showing and hiding.
+
+A Reel describes a sprite: its frames (name, draw function, duration)
+and optionally a base drawn under every frame. Reels hold no canvas
+items, so one reel is shared by every sprite that plays it. A Flipbook
+is one sprite on the canvas: it draws all the reel's frames when it is
+created, hides all but the current one, and from then on a pose change
+is two `itemconfig` calls (hide the old frame's tag, show the new one's)
+however many items the poses have.
+
+Draw functions take the canvas and return the ids they created, drawn
+at the reel's reference point; a Flipbook at (x, y) is moved there
+once, after drawing. A duration of None holds the frame until show()
+is called; durations are in whatever unit advance() is called with
+(frames for the birds, milliseconds for the gator).
+
+    FLAP = Reel([('up', draw_wings_up, 8), ('down', draw_wings_down, 8)])
+    bird = Flipbook(canvas, FLAP, x=-50, y=120)
+    bird.advance(1)          # every frame; flips after 8
+    bird.move(dx, dy)        # moves every pose together
+"""
+
+import itertools
+
+_serial = itertools.count()
+
+
+class Reel:
+    """Frames of a sprite, shared by every Flipbook that plays it."""
+
+    def __init__(self, frames, base=None, loop=True):
+        self.names = [name for name, draw, duration in frames]
+        self.draws = [draw for name, draw, duration in frames]
+        self.durations = [duration for name, draw, duration in frames]
+        self.base = base
+        self.loop = loop
+
+    def __len__(self):
+        return len(self.names)
+
+    def index(self, frame):
+        """Frame index of a frame name (or index)."""
+        return frame if isinstance(frame, int) else self.names.index(frame)
+
+
+class Flipbook:
+    """One sprite playing a Reel; all its poses exist, one is visible."""
+
+    def __init__(self, canvas, reel, x=0, y=0, frame=0, elapsed=0, tag=None):
+        self.canvas = canvas
+        self.reel = reel
+        self.tag = tag or f"flipbook_{next(_serial)}"
+        self.frame = reel.index(frame)
+        self.elapsed = elapsed
+        self.items = []
+        if reel.base:
+            self._build(reel.base, None, hidden=False)
+        for index, draw in enumerate(reel.draws):
+            self._build(draw, self.frame_tag(index), hidden=index != self.frame)
+        if x or y:
+            canvas.move(self.tag, x, y)
+
+    def _build(self, draw, frame_tag, hidden):
+        canvas = self.canvas
+        for item in draw(canvas):
+            canvas.addtag_withtag(self.tag, item)
+            if frame_tag:
+                canvas.addtag_withtag(frame_tag, item)
+            if hidden:
+                canvas.itemconfig(item, state='hidden')
+            self.items.append(item)
+
+    def frame_tag(self, index):
+        return f"{self.tag}_{index}"
+
+    @property
+    def name(self):
+        return self.reel.names[self.frame]
+
+    def show(self, frame):
+        """Switch to a frame (name or index) and restart its duration."""
+        self.elapsed = 0
+        return self._switch(self.reel.index(frame))
+
+    def _switch(self, index):
+        if index == self.frame:
+            return False
+        self.canvas.itemconfig(self.frame_tag(self.frame), state='hidden')
+        self.canvas.itemconfig(self.frame_tag(index), state='normal')
+        self.frame = index
+        return True
+
+    def advance(self, elapsed=1):
+        """Play on by `elapsed`; True if the visible pose changed."""
+        durations = self.reel.durations
+        last = len(durations) - 1
+        index = self.frame
+        self.elapsed += elapsed
+        while durations[index] is not None and self.elapsed >= durations[index]:
+            if index == last and not self.reel.loop:
+                break
+            self.elapsed -= durations[index]
+            index = 0 if index == last else index + 1
+        return self._switch(index)
+
+    def remaining(self):
+        """Time left on the current frame (None if it is held)."""
+        duration = self.reel.durations[self.frame]
+        return None if duration is None else max(0, duration - self.elapsed)
+
+    def move(self, dx, dy):
+        self.canvas.move(self.tag, dx, dy)
+
+    def delete(self):
+        self.canvas.delete(self.tag)
+        self.items = []
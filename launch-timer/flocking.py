@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Flocking birds (boids) with a spatial hash for neighbour lookups.
+
+Each tick every bird steers by the classic three rules over the birds
+within NEIGHBOUR_RADIUS (separation, alignment, cohesion), plus a drift
+towards the cruising speed so flocks keep crossing the sky left to
+right, and a push back into the flight band. Neighbours come from a
+uniform grid rebuilt once per tick: a bird only looks at the 3x3 cells
+around it, so the tick stays linear in the number of birds as long as
+flocks keep their spacing.
+
+Every bird is a Flipbook of FLAP_REEL: both wing poses are drawn once,
+when it is added, and a flap hides one and shows the other. Birds that
+leave the screen on the right come back on the left instead of being
+redrawn.
+
+    flock = Flock(canvas)
+    flock.populate(24)
+    flock.tick(scale=1, target=24)     # every frame
+"""
+
+import math
+from functools import partial
+
+import rng
+from entities import EntityStore
+from flipbook import Flipbook, Reel
+from landscape import draw_bird
+
+_rng = rng.stream('birds')
+
+
+NEIGHBOUR_RADIUS = 40
+SEPARATION_RADIUS = 14
+FLOCK_SIZE = 16      # Largest flock spawned at once
+
+COHESION = 0.004
+ALIGNMENT = 0.05
+SEPARATION = 0.6
+CRUISE_SPEED = 1.3
+CRUISE_PULL = 0.02
+
+BAND_TOP = 70        # Flight band (y)
+BAND_BOTTOM = 290
+BAND_PUSH = 0.03
+MAX_SPEED_X = (0.6, 2.0)
+MAX_SPEED_Y = 0.6
+
+FLAP_FRAMES = 8      # Frames per wing position
+FLAP_REEL = Reel([('up', partial(draw_bird, x=0, y=0, flap_up=True), FLAP_FRAMES),
+                  ('down', partial(draw_bird, x=0, y=0, flap_up=False), FLAP_FRAMES)])
+
+
+class SpatialHash:
+    """Rows of the entities in each cell of a uniform grid."""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def rebuild(self, xs, ys):
+        cells = {}
+        size = self.cell_size
+        for row, (x, y) in enumerate(zip(xs, ys)):
+            key = (math.floor(x / size), math.floor(y / size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [row]
+            else:
+                bucket.append(row)
+        self.cells = cells
+
+    def near(self, x, y):
+        """Rows in the cell of (x, y) and the eight around it."""
+        cx = math.floor(x / self.cell_size)
+        cy = math.floor(y / self.cell_size)
+        cells = self.cells
+        for key in ((cx - 1, cy - 1), (cx, cy - 1), (cx + 1, cy - 1),
+                    (cx - 1, cy), (cx, cy), (cx + 1, cy),
+                    (cx - 1, cy + 1), (cx, cy + 1), (cx + 1, cy + 1)):
+            bucket = cells.get(key)
+            if bucket:
+                yield from bucket
+
+
+class Flock:
+    """All birds on screen, in one EntityStore."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.birds = EntityStore(canvas, 'bird', ('flipbook',))
+        self.grid = SpatialHash(NEIGHBOUR_RADIUS)
+
+    def __len__(self):
+        return len(self.birds)
+
+    def populate(self, count):
+        """Start with flocks lined up off screen to the left."""
+        x = -60
+        while len(self.birds) < count:
+            size = min(FLOCK_SIZE, count - len(self.birds))
+            self.spawn_flock(size, x)
+            x -= 150
+
+    def spawn_flock(self, size, x):
+        """Add a loose group of birds behind x, heading right."""
+        center_y = _rng.uniform(BAND_TOP + 30, BAND_BOTTOM - 30)
+        spread = 12 * math.sqrt(size)
+        heading = _rng.uniform(-0.15, 0.15)
+        for _ in range(size):
+            self.add_bird(x - _rng.uniform(0, 2 * spread), center_y + _rng.uniform(-spread, spread),
+                          _rng.uniform(1.1, 1.5), heading + _rng.uniform(-0.05, 0.05))
+
+    def add_bird(self, x, y, vx, vy):
+        # Start each bird at a random point of the flap so they don't beat in step
+        flipbook = Flipbook(self.canvas, FLAP_REEL, x, y, elapsed=_rng.uniform(0, FLAP_FRAMES))
+        self.birds.add(x, y, vx, vy, flipbook.items, flipbook=flipbook)
+
+    def tick(self, scale=1, target=0):
+        """Steer, move and flap every bird; keep the count near target."""
+        birds = self.birds
+        self.steer()
+        birds.advance(scale)
+        self.flap(scale)
+
+        # Off the right edge: back in on the left, unless there are too many
+        for row in birds.rows_beyond('x', 850):
+            if len(birds) > target:
+                birds.remove(row)
+            else:
+                birds.move_to(row, birds.x[row] - 920, birds.y[row])
+
+        # Quality went up: bring in a new flock once the left edge is clear
+        if len(birds) < target and min(birds.x, default=850) > 60:
+            self.spawn_flock(min(FLOCK_SIZE, target - len(birds)), -60)
+
+    def steer(self):
+        """One pass of the boids rules over the grid."""
+        birds = self.birds
+        xs, ys, vxs, vys = birds.x, birds.y, birds.vx, birds.vy
+        self.grid.rebuild(xs, ys)
+        near = self.grid.near
+        radius2 = NEIGHBOUR_RADIUS * NEIGHBOUR_RADIUS
+        separation2 = SEPARATION_RADIUS * SEPARATION_RADIUS
+        new_vx = []
+        new_vy = []
+        for row, (x, y, vx, vy) in enumerate(zip(xs, ys, vxs, vys)):
+            count = 0
+            sum_dx = sum_dy = sum_vx = sum_vy = push_x = push_y = 0.0
+            for other in near(x, y):
+                if other == row:
+                    continue
+                dx = xs[other] - x
+                dy = ys[other] - y
+                d2 = dx * dx + dy * dy
+                if d2 < radius2:
+                    count += 1
+                    sum_dx += dx
+                    sum_dy += dy
+                    sum_vx += vxs[other]
+                    sum_vy += vys[other]
+                    if d2 < separation2:
+                        push_x -= dx / (d2 + 1)
+                        push_y -= dy / (d2 + 1)
+            if count:
+                vx += (COHESION * sum_dx / count + ALIGNMENT * (sum_vx / count - vx)
+                       + SEPARATION * push_x)
+                vy += (COHESION * sum_dy / count + ALIGNMENT * (sum_vy / count - vy)
+                       + SEPARATION * push_y)
+            vx += (CRUISE_SPEED - vx) * CRUISE_PULL
+            if y < BAND_TOP:
+                vy += BAND_PUSH
+            elif y > BAND_BOTTOM:
+                vy -= BAND_PUSH
+            new_vx.append(min(MAX_SPEED_X[1], max(MAX_SPEED_X[0], vx)))
+            new_vy.append(min(MAX_SPEED_Y, max(-MAX_SPEED_Y, vy)))
+        birds.vx[:] = new_vx
+        birds.vy[:] = new_vy
+
+    def flap(self, scale):
+        """Flip the wing pose of the birds whose flap ran out."""
+        for flipbook in self.birds.flipbook:
+            flipbook.advance(scale)
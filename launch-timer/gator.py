@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+The alligator in the pond by the launch pad.
+
+Every part (ridges, head, eyes, nostrils, ripple) is drawn once, fully
+surfaced and hidden. A frame only moves each part to its offset for the
+current phase and shows or hides it when it crosses its threshold
+(gator_pose in landscape.py), so surfacing never creates an item. The
+pond itself belongs to the background.
+
+The gator stays under water for most of a cycle, then surfaces, rests
+and dives. It is only animated at FRAME_MS while it is surfacing or
+diving; otherwise update() asks to be called again when the current
+stage ends.
+"""
+
+from landscape import draw_gator_parts, gator_pose
+
+
+FRAME_MS = 50
+
+# (duration ms, phase at start, phase at end)
+CYCLE = (
+    (24000, 0.0, 0.0),   # Under water
+    (1500, 0.0, 1.0),    # Surfacing
+    (4000, 1.0, 1.0),    # Resting at the surface
+    (1500, 1.0, 0.0),    # Diving
+)
+
+
+class Gator:
+    """The pond's alligator: precreated parts moved and shown by phase."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.tags = {}
+        self.offsets = {}
+        self.visible = {}
+        for part, items in draw_gator_parts(canvas).items():
+            tag = f"gator_{part}"
+            for item in items:
+                canvas.addtag_withtag(tag, item)
+            canvas.itemconfig(tag, state='hidden')
+            self.tags[part] = tag
+            self.offsets[part] = 0
+            self.visible[part] = False
+        self.stage = 0
+        self.elapsed = 0
+        self.phase = 0.0
+
+    def set_phase(self, phase):
+        """Move and show the parts for a phase (0 under water, 1 fully up)."""
+        self.phase = phase
+        for part, (offset, visible) in gator_pose(phase).items():
+            tag = self.tags[part]
+            if offset != self.offsets[part]:
+                self.canvas.move(tag, 0, offset - self.offsets[part])
+                self.offsets[part] = offset
+            if visible != self.visible[part]:
+                self.canvas.itemconfig(tag, state='normal' if visible else 'hidden')
+                self.visible[part] = visible
+
+    def update(self, elapsed):
+        """Play on by `elapsed` ms; return the delay (ms) until the next frame."""
+        self.elapsed += elapsed
+        while self.elapsed >= CYCLE[self.stage][0]:
+            self.elapsed -= CYCLE[self.stage][0]
+            self.stage = (self.stage + 1) % len(CYCLE)
+        duration, start, end = CYCLE[self.stage]
+        progress = self.elapsed / duration
+        self.set_phase(start + (end - start) * progress)
+        if start == end:
+            return int(duration - self.elapsed)
+        return FRAME_MS
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Headless stand-ins for the Tk root window and canvas.
+
+HeadlessRoot runs `after` callbacks on a SimulatedClock instead of a real
+event loop, so hours of display time can be replayed in seconds without a
+display server. HeadlessCanvas keeps the canvas item model (ids, tags,
+coords, options) in memory and counts every canvas operation.
+"""
+
+import heapq
+from collections import Counter
+
+import clock
+
+
+class HeadlessRoot:
+    """Event loop driven by a simulated clock."""
+
+    def __init__(self, sim_clock=None):
+        if sim_clock is None:
+            sim_clock = clock.SimulatedClock(speed=0)
+        self.clock = sim_clock
+        self._timers = []  # heap of (due_ms, seq, job_id)
+        self._jobs = {}    # job_id -> (callback, args)
+        self._seq = 0
+        self.callbacks_run = 0
+
+    # --- window methods used by LaunchPadDisplay (no-ops) ---
+    def title(self, *args):
+        pass
+
+    def geometry(self, *args):
+        pass
+
+    def configure(self, **kwargs):
+        pass
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def winfo_ismapped(self):
+        return True
+
+    # --- scheduling ---
+    def after(self, ms, func=None, *args):
+        """Schedule func after ms simulated milliseconds."""
+        self._seq += 1
+        job_id = f"after#{self._seq}"
+        due = self.clock.time() * 1000 + max(0, ms)
+        heapq.heappush(self._timers, (due, self._seq, job_id))
+        self._jobs[job_id] = (func, args)
+        return job_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, job_id):
+        self._jobs.pop(job_id, None)
+
+    def pending(self):
+        """Number of scheduled callbacks that have not run yet."""
+        return len(self._jobs)
+
+    def cancel_all(self):
+        """Drop every scheduled callback."""
+        self._timers = []
+        self._jobs = {}
+
+    def run_until(self, end_time):
+        """Run callbacks in time order until the clock reaches end_time (epoch s)."""
+        end_ms = end_time * 1000
+        while self._timers and self._timers[0][0] <= end_ms:
+            due, _, job_id = heapq.heappop(self._timers)
+            job = self._jobs.pop(job_id, None)
+            if job is None:
+                continue
+            if due / 1000 > self.clock.time():
+                self.clock.set_time(due / 1000)
+            self.clock.tick()
+            func, args = job
+            func(*args)
+            self.callbacks_run += 1
+        self.clock.set_time(max(end_time, self.clock.time()))
+        self.clock.tick()
+
+    def run_for(self, seconds):
+        """Run callbacks for a number of simulated seconds."""
+        self.run_until(self.clock.time() + seconds)
+
+    def jump(self, seconds):
+        """Skip ahead without simulating the frames in between.
+
+        The clock jumps forward and every callback that fell due in the
+        skipped span runs once, so periodic chains resume from the new time.
+        """
+        target = self.clock.time() + seconds
+        self.clock.set_time(target)
+        self.run_until(target)
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def mainloop(self):
+        raise RuntimeError("HeadlessRoot has no mainloop - use run_for()")
+
+    def destroy(self):
+        self.cancel_all()
+
+
+def _flatten(coords):
+    flat = []
+    for value in coords:
+        if isinstance(value, (list, tuple)):
+            flat.extend(_flatten(value))
+        else:
+            flat.append(float(value))
+    return flat
+
+
+def _normalize_tags(tags):
+    if tags is None:
+        return ()
+    if isinstance(tags, str):
+        return tuple(tags.split())
+    return tuple(str(tag) for tag in tags)
+
+
+class HeadlessCanvas:
+    """In-memory canvas item model with per-operation counters."""
+
+    def __init__(self, root, width=800, height=600, **kwargs):
+        self.root = root
+        self.width = width
+        self.height = height
+        self._items = {}   # id -> item dict, in stacking order
+        self._tags = {}    # tag -> {id: None}, in creation order
+        self._next_id = 1
+        self.ops = Counter()
+
+    # --- item creation ---
+    def _create(self, kind, coords, options):
+        self.ops['create'] += 1
+        self.ops[f'create_{kind}'] += 1
+        item_id = self._next_id
+        self._next_id += 1
+        tags = _normalize_tags(options.pop('tags', None))
+        self._items[item_id] = {
+            'type': kind,
+            'coords': _flatten(coords),
+            'options': options,
+            'tags': list(tags),
+        }
+        for tag in tags:
+            self._tags.setdefault(tag, {})[item_id] = None
+        return item_id
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rectangle', coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create('oval', coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._create('line', coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create('polygon', coords, options)
+
+    def create_arc(self, *coords, **options):
+        return self._create('arc', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', coords, options)
+
+    def create_image(self, *coords, **options):
+        return self._create('image', coords, options)
+
+    # --- lookup ---
+    def _resolve(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self._items else []
+        if isinstance(tag_or_id, str) and tag_or_id.isdigit():
+            return self._resolve(int(tag_or_id))
+        if tag_or_id == 'all':
+            return list(self._items)
+        return list(self._tags.get(tag_or_id, ()))
+
+    def find_withtag(self, tag_or_id):
+        self.ops['find'] += 1
+        return tuple(self._resolve(tag_or_id))
+
+    def find_all(self):
+        self.ops['find'] += 1
+        return tuple(self._items)
+
+    def gettags(self, item_id):
+        item = self._items.get(item_id)
+        return tuple(item['tags']) if item else ()
+
+    def type(self, item_id):
+        item = self._items.get(item_id)
+        return item['type'] if item else None
+
+    def itemcget(self, item_id, option):
+        item = self._items.get(item_id)
+        if not item:
+            return ''
+        return item['options'].get(option, '')
+
+    # --- mutation ---
+    def delete(self, *tags_or_ids):
+        self.ops['delete'] += 1
+        for tag_or_id in tags_or_ids:
+            for item_id in self._resolve(tag_or_id):
+                item = self._items.pop(item_id, None)
+                if item is None:
+                    continue
+                for tag in item['tags']:
+                    members = self._tags.get(tag)
+                    if members is not None:
+                        members.pop(item_id, None)
+                        if not members:
+                            del self._tags[tag]
+
+    def move(self, tag_or_id, dx, dy):
+        self.ops['move'] += 1
+        for item_id in self._resolve(tag_or_id):
+            coords = self._items[item_id]['coords']
+            for i in range(0, len(coords) - 1, 2):
+                coords[i] += dx
+                coords[i + 1] += dy
+
+    def coords(self, tag_or_id, *new_coords):
+        ids = self._resolve(tag_or_id)
+        if not new_coords:
+            self.ops['coords_get'] += 1
+            return list(self._items[ids[0]]['coords']) if ids else []
+        self.ops['coords_set'] += 1
+        for item_id in ids[:1]:
+            self._items[item_id]['coords'] = _flatten(new_coords)
+        return None
+
+    def itemconfig(self, tag_or_id, **options):
+        self.ops['itemconfig'] += 1
+        for item_id in self._resolve(tag_or_id):
+            self._items[item_id]['options'].update(options)
+
+    itemconfigure = itemconfig
+
+    def addtag_withtag(self, new_tag, tag_or_id):
+        for item_id in self._resolve(tag_or_id):
+            item = self._items[item_id]
+            if new_tag not in item['tags']:
+                item['tags'].append(new_tag)
+                self._tags.setdefault(new_tag, {})[item_id] = None
+
+    def dtag(self, tag_or_id, tag_to_delete=None):
+        if tag_to_delete is None:
+            tag_to_delete = tag_or_id
+        for item_id in self._resolve(tag_or_id):
+            item = self._items[item_id]
+            if tag_to_delete in item['tags']:
+                item['tags'].remove(tag_to_delete)
+                members = self._tags.get(tag_to_delete)
+                if members is not None:
+                    members.pop(item_id, None)
+                    if not members:
+                        del self._tags[tag_to_delete]
+
+    def _restack(self, ids, anchor_ids, after):
+        """Move ids next to the anchor items (above the topmost / below the lowest)."""
+        moving = {item_id: self._items.pop(item_id) for item_id in ids if item_id in self._items}
+        order = list(self._items)
+        anchor_ids = set(anchor_ids)
+        anchors = [item_id for item_id in order if item_id in anchor_ids]
+        if not anchors:
+            index = len(order) if after else 0
+        elif after:
+            index = order.index(anchors[-1]) + 1
+        else:
+            index = order.index(anchors[0])
+        order[index:index] = list(moving)
+        moving.update(self._items)
+        self._items = {item_id: moving[item_id] for item_id in order}
+
+    def tag_raise(self, tag_or_id, above=None):
+        self.ops['restack'] += 1
+        ids = self._resolve(tag_or_id)
+        if above is None:
+            for item_id in ids:
+                self._items[item_id] = self._items.pop(item_id)
+        else:
+            self._restack(ids, self._resolve(above), after=True)
+
+    lift = tag_raise
+
+    def tag_lower(self, tag_or_id, below=None):
+        self.ops['restack'] += 1
+        ids = self._resolve(tag_or_id)
+        if below is None:
+            lowered = {item_id: self._items.pop(item_id) for item_id in ids}
+            lowered.update(self._items)
+            self._items = lowered
+        else:
+            self._restack(ids, self._resolve(below), after=False)
+
+    def bbox(self, tag_or_id):
+        xs, ys = [], []
+        for item_id in self._resolve(tag_or_id):
+            coords = self._items[item_id]['coords']
+            xs.extend(coords[0::2])
+            ys.extend(coords[1::2])
+        if not xs:
+            return None
+        return (int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys)))
+
+    # --- widget methods used by the display ---
+    def pack(self, **kwargs):
+        pass
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def after(self, ms, func=None, *args):
+        return self.root.after(ms, func, *args)
+
+    def after_idle(self, func, *args):
+        return self.root.after_idle(func, *args)
+
+    def after_cancel(self, job_id):
+        self.root.after_cancel(job_id)
+
+    def item_count(self):
+        return len(self._items)
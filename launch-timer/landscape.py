@@ -5,13 +5,15 @@ Enhanced VAB building with more details based on reference image.
 """
 
 import random
-from datetime import datetime
+from functools import partial
+
+import clock
+from flipbook import Reel
 
 
 def get_sky_colors():
     """Get sky and ocean colors based on current time of day."""
-    now = datetime.now()
-    hour = now.hour
+    hour = clock.now().hour
     
     # 10am-4pm: Day (blue sky)
     if 10 <= hour < 16:
@@ -49,28 +51,30 @@ def get_sky_colors():
 
 def draw_stars(canvas):
     """Draw stars for nighttime."""
-    random.seed(42)
+    # Own generator with a fixed seed: the same sky every night, and the
+    # animation streams are left alone
+    stars_rng = random.Random(42)
     for _ in range(60):
-        x = random.randint(0, 800)
-        y = random.randint(0, 340)
-        size = random.choice([1, 2])
-        brightness = random.choice(['#ffffff', '#ffff99', '#aaaaaa'])
+        x = stars_rng.randint(0, 800)
+        y = stars_rng.randint(0, 340)
+        size = stars_rng.choice([1, 2])
+        brightness = stars_rng.choice(['#ffffff', '#ffff99', '#aaaaaa'])
         canvas.create_oval(x, y, x+size, y+size, fill=brightness, outline='', tags='stars')
 
 
 def draw_pixel_grass(canvas):
     """Draw pixel grass details on the ground."""
-    random.seed(123)
+    grass_rng = random.Random(123)
     grass_colors = ['#4a7c2a', '#6a9c4a', '#5a8c3a', '#3a6c1a']
     
     # Draw grass blades throughout the grassy area
     for i in range(400):  # Increased from 100 to 400 for better coverage
-        x = random.randint(0, 800)
-        y = random.randint(368, 495)  # Cover the whole grass area
-        color = random.choice(grass_colors)
+        x = grass_rng.randint(0, 800)
+        y = grass_rng.randint(368, 495)  # Cover the whole grass area
+        color = grass_rng.choice(grass_colors)
         
         # Mix of different grass styles
-        style = random.randint(1, 4)
+        style = grass_rng.randint(1, 4)
         if style == 1:
             # Single vertical blade
             canvas.create_line(x, y, x, y-3, fill=color, width=1)
@@ -119,6 +123,46 @@ def draw_roads(canvas):
         )
 
 
+# Visitor parking below the road: left edge of the first stall, top of the
+# first row, stalls per row and rows (filled by traffic.Traffic)
+PARKING_LOTS = (
+    {'x': 26, 'y': 446, 'stalls': 16, 'rows': 3},
+    {'x': 262, 'y': 446, 'stalls': 17, 'rows': 3},
+)
+STALL_WIDTH = 13
+STALL_DEPTH = 16
+
+
+def parking_stalls(lot):
+    """Top-left corner of each stall of a lot (where draw_car_vertical draws)."""
+    return [(lot['x'] + col * STALL_WIDTH, lot['y'] + row * STALL_DEPTH)
+            for row in range(lot['rows']) for col in range(lot['stalls'])]
+
+
+def parking_entrance_x(lot):
+    """x of the driveway between a lot and the road."""
+    return lot['x'] + lot['stalls'] * STALL_WIDTH // 2
+
+
+def draw_parking_lots(canvas):
+    """Draw the visitor lots below the road (the cars are drawn by traffic.Traffic)."""
+    for lot in PARKING_LOTS:
+        left = lot['x'] - 5
+        right = lot['x'] + lot['stalls'] * STALL_WIDTH - 2
+        bottom = lot['y'] + lot['rows'] * STALL_DEPTH - 2
+        canvas.create_rectangle(left, lot['y'] - 3, right, bottom, fill='#4a4a4a', outline='', tags='parking')
+        # Driveway up to the road
+        entrance_x = parking_entrance_x(lot)
+        canvas.create_rectangle(entrance_x - 8, 436, entrance_x + 8, lot['y'] - 3,
+                                fill='#3a3a3a', outline='', tags='parking')
+        # Stall lines
+        for row in range(lot['rows']):
+            y = lot['y'] + row * STALL_DEPTH
+            for col in range(lot['stalls'] + 1):
+                x = lot['x'] - 4 + col * STALL_WIDTH
+                canvas.create_line(x, y, x, y + 12, fill='#7a7a7a', width=1, tags='parking')
+
+
 def draw_back_fence(canvas):
     """Draw the top fence that goes behind the launch pad."""
     fence_color = '#8a8a8a'
@@ -704,11 +748,15 @@ def draw_launch_tower(canvas):
             )
 
 
-def draw_pond_with_gator(canvas, gator_visible=False, gator_animation_phase=0):
-    """Draw a small pond with occasional alligator."""
+POND_X = 735
+POND_Y = 380
+
+
+def draw_pond(canvas):
+    """Draw a small pond (the gator is a separate sprite)."""
     # Move pond up to area between buildings and launch pad
-    pond_x = 735
-    pond_y = 380
+    pond_x = POND_X
+    pond_y = POND_Y
     
     # Pond water - dark blue/green
     canvas.create_oval(pond_x, pond_y, pond_x+60, pond_y+25, fill='#2a5a4a', outline='#1a4a3a', width=2, tags='pond')
@@ -719,129 +767,147 @@ def draw_pond_with_gator(canvas, gator_visible=False, gator_animation_phase=0):
     
     # Lily pad
     canvas.create_oval(pond_x+15, pond_y+5, pond_x+22, pond_y+10, fill='#4a7a3a', outline='#3a6a2a', tags='pond')
-    
-    # Alligator (only if visible)
-    if gator_visible and gator_animation_phase > 0:
-        gator_x = pond_x + 35
-        gator_y = pond_y + 12
-        
-        # Calculate vertical offset based on animation phase
-        submerge_offset = int(8 * (1 - gator_animation_phase))
-        
-        # Calculate opacity/visibility for parts based on phase
-        show_eyes = gator_animation_phase > 0.3
-        show_full_head = gator_animation_phase > 0.5
-        show_ridges = gator_animation_phase > 0.2
-        
-        # Back ridges poking out of water
-        if show_ridges:
-            ridge_offset = int(submerge_offset * 0.5)
-            canvas.create_oval(gator_x-12, gator_y+3+ridge_offset, gator_x-8, gator_y+6+ridge_offset, 
-                             fill='#3a5a3a', outline='#2a4a2a', tags='gator')
-            canvas.create_oval(gator_x-18, gator_y+5+ridge_offset, gator_x-14, gator_y+8+ridge_offset, 
-                             fill='#3a5a3a', outline='#2a4a2a', tags='gator')
-        
-        # Gator head
-        if show_full_head:
-            canvas.create_oval(gator_x-8, gator_y-3+submerge_offset, gator_x+8, gator_y+5+submerge_offset, 
-                             fill='#3a5a3a', outline='#2a4a2a', tags='gator')
-            
-            # Snout
-            canvas.create_oval(gator_x+5, gator_y+submerge_offset, gator_x+10, gator_y+3+submerge_offset, 
-                             fill='#4a6a4a', outline='#2a4a2a', tags='gator')
-        
-        # Eyes and nostrils
-        if show_eyes:
-            eye_offset = int(submerge_offset * 0.7)
-            
-            # Eyes (yellow/orange)
-            canvas.create_oval(gator_x-4, gator_y-2+eye_offset, gator_x-1, gator_y+1+eye_offset, 
-                             fill='#ffa500', outline='#000000', tags='gator')
-            canvas.create_oval(gator_x+1, gator_y-2+eye_offset, gator_x+4, gator_y+1+eye_offset, 
-                             fill='#ffa500', outline='#000000', tags='gator')
-            
-            # Pupils
-            canvas.create_oval(gator_x-3, gator_y-1+eye_offset, gator_x-2, gator_y+eye_offset, 
-                             fill='#000000', outline='', tags='gator')
-            canvas.create_oval(gator_x+2, gator_y-1+eye_offset, gator_x+3, gator_y+eye_offset, 
-                             fill='#000000', outline='', tags='gator')
-            
-            # Nostrils
-            if show_full_head:
-                canvas.create_oval(gator_x+7, gator_y+1+eye_offset, gator_x+8, gator_y+2+eye_offset, 
-                                 fill='#1a1a1a', outline='', tags='gator')
-        
+
+
+def gator_pose(gator_animation_phase):
+    """Vertical offset and visibility of each gator part, by phase (0 under water, 1 fully up)."""
+    # Calculate vertical offset based on animation phase
+    submerge_offset = int(8 * (1 - gator_animation_phase))
+    eye_offset = int(submerge_offset * 0.7)
+    
+    # Calculate visibility for parts based on phase
+    show_eyes = gator_animation_phase > 0.3
+    show_full_head = gator_animation_phase > 0.5
+    show_ridges = gator_animation_phase > 0.2
+    
+    return {
+        'ridges': (int(submerge_offset * 0.5), show_ridges),
+        'head': (submerge_offset, show_full_head),
+        'eyes': (eye_offset, show_eyes),
+        'nostrils': (eye_offset, show_eyes and show_full_head),
         # Extra ripples when gator is moving
-        if 0.1 < gator_animation_phase < 0.9:
-            canvas.create_arc(gator_x-15, gator_y+submerge_offset, gator_x+15, gator_y+15+submerge_offset, 
-                            start=0, extent=180, outline='#4a7a6a', width=2, tags='gator', style='arc')
+        'ripple': (submerge_offset, 0.1 < gator_animation_phase < 0.9),
+    }
 
 
-def draw_spotlights(canvas, vehicle_name=None):
-    """Draw spotlights on the ground - always visible, but only lit at night."""
-    from datetime import datetime
+def draw_gator_parts(canvas):
+    """Draw every part of the alligator fully surfaced and return IDs by part."""
+    gator_x = POND_X + 35
+    gator_y = POND_Y + 12
+    parts = {}
+    
+    # Back ridges poking out of water
+    parts['ridges'] = [
+        canvas.create_oval(gator_x-12, gator_y+3, gator_x-8, gator_y+6, fill='#3a5a3a', outline='#2a4a2a', tags='gator'),
+        canvas.create_oval(gator_x-18, gator_y+5, gator_x-14, gator_y+8, fill='#3a5a3a', outline='#2a4a2a', tags='gator'),
+    ]
     
-    hour = datetime.now().hour
-    # Check if it's nighttime (6pm-6am)
-    is_night = hour >= 18 or hour < 6
+    # Gator head and snout
+    parts['head'] = [
+        canvas.create_oval(gator_x-8, gator_y-3, gator_x+8, gator_y+5, fill='#3a5a3a', outline='#2a4a2a', tags='gator'),
+        canvas.create_oval(gator_x+5, gator_y, gator_x+10, gator_y+3, fill='#4a6a4a', outline='#2a4a2a', tags='gator'),
+    ]
+    
+    # Eyes (yellow/orange) and pupils
+    parts['eyes'] = [
+        canvas.create_oval(gator_x-4, gator_y-2, gator_x-1, gator_y+1, fill='#ffa500', outline='#000000', tags='gator'),
+        canvas.create_oval(gator_x+1, gator_y-2, gator_x+4, gator_y+1, fill='#ffa500', outline='#000000', tags='gator'),
+        canvas.create_oval(gator_x-3, gator_y-1, gator_x-2, gator_y, fill='#000000', outline='', tags='gator'),
+        canvas.create_oval(gator_x+2, gator_y-1, gator_x+3, gator_y, fill='#000000', outline='', tags='gator'),
+    ]
     
+    # Nostrils
+    parts['nostrils'] = [
+        canvas.create_oval(gator_x+7, gator_y+1, gator_x+8, gator_y+2, fill='#1a1a1a', outline='', tags='gator'),
+    ]
+    
+    # Ripple around the gator
+    parts['ripple'] = [
+        canvas.create_arc(gator_x-15, gator_y, gator_x+15, gator_y+15, start=0, extent=180,
+                          outline='#4a7a6a', width=2, tags='gator', style='arc'),
+    ]
+    return parts
+
+
+SPOTLIGHT_X = (620 - 80, 620 + 68)  # Left and right of the rocket
+SPOTLIGHT_GROUND_Y = 385
+
+
+def is_dark_rocket(vehicle_name):
+    """True for rockets (Electron) that need the brighter spotlights."""
+    return bool(vehicle_name and 'electron' in vehicle_name.lower())
+
+
+def spotlight_pose(vehicle_name=None):
+    """Spotlight frame for the time of day: 'off', 'on', or 'bright' for dark rockets."""
+    hour = clock.now().hour
+    # Check if it's nighttime (6pm-6am)
+    if not (hour >= 18 or hour < 6):
+        return 'off'
+    return 'bright' if is_dark_rocket(vehicle_name) else 'on'
+
+
+def draw_spotlight_housings(canvas):
+    """Draw the two spotlight housings (always visible) and return IDs."""
+    ground_y = SPOTLIGHT_GROUND_Y
+    spotlight_ids = []
+    for spotlight_x in SPOTLIGHT_X:
+        # Spotlight housing
+        spotlight_ids.append(canvas.create_rectangle(spotlight_x, ground_y, spotlight_x+12, ground_y+8, fill='#505050', outline='', tags='spotlight'))
+        spotlight_ids.append(canvas.create_rectangle(spotlight_x+2, ground_y+8, spotlight_x+10, ground_y+12, fill='#404040', outline='', tags='spotlight'))
+        # Spotlight lens/front
+        spotlight_ids.append(canvas.create_rectangle(spotlight_x+3, ground_y+1, spotlight_x+9, ground_y+7, fill='#2a2a2a', outline='', tags='spotlight'))
+    return spotlight_ids
+
+
+def draw_spotlight_beams(canvas, bright=False):
+    """Draw the night beams and lit lenses and return IDs."""
     rocket_x = 620
     rocket_base_y = 340
     rocket_mid_y = rocket_base_y - 90
-    ground_y = 385
-    
-    # Check if rocket is dark (Electron) to make lights brighter when on
-    is_dark_rocket = vehicle_name and 'electron' in vehicle_name.lower()
-    
-    # Left spotlight structure (always visible)
-    spotlight_left_x = rocket_x - 80
-    # Spotlight housing
-    canvas.create_rectangle(spotlight_left_x, ground_y, spotlight_left_x+12, ground_y+8, fill='#505050', outline='', tags='spotlight')
-    canvas.create_rectangle(spotlight_left_x+2, ground_y+8, spotlight_left_x+10, ground_y+12, fill='#404040', outline='', tags='spotlight')
-    # Spotlight lens/front
-    canvas.create_rectangle(spotlight_left_x+3, ground_y+1, spotlight_left_x+9, ground_y+7, fill='#2a2a2a', outline='', tags='spotlight')
-    
-    # Right spotlight structure (always visible)
-    spotlight_right_x = rocket_x + 68
-    # Spotlight housing
-    canvas.create_rectangle(spotlight_right_x, ground_y, spotlight_right_x+12, ground_y+8, fill='#505050', outline='', tags='spotlight')
-    canvas.create_rectangle(spotlight_right_x+2, ground_y+8, spotlight_right_x+10, ground_y+12, fill='#404040', outline='', tags='spotlight')
-    # Spotlight lens/front
-    canvas.create_rectangle(spotlight_right_x+3, ground_y+1, spotlight_right_x+9, ground_y+7, fill='#2a2a2a', outline='', tags='spotlight')
-    
-    # Only draw light beams at night
-    if is_night:
-        # Adjust light colors based on rocket type
-        if is_dark_rocket:
-            beam_color = '#ffffee'
-            beam_outline = '#ffffaa'
-            outline_width = 3
-        else:
-            beam_color = '#ffffaa'
-            beam_outline = '#ffff66'
-            outline_width = 2
-        
-        # Left light beam
-        canvas.create_polygon(
-            spotlight_left_x+6, ground_y,
-            rocket_x-18, rocket_mid_y,
-            rocket_x-8, rocket_mid_y,
-            spotlight_left_x+8, ground_y,
-            fill=beam_color, outline=beam_outline, width=outline_width, tags='spotlight'
-        )
-        
-        # Right light beam
-        canvas.create_polygon(
-            spotlight_right_x+6, ground_y,
-            rocket_x+8, rocket_mid_y,
-            rocket_x+18, rocket_mid_y,
-            spotlight_right_x+8, ground_y,
-            fill=beam_color, outline=beam_outline, width=outline_width, tags='spotlight'
-        )
-        
-        # Bright lens when lights are on
-        canvas.create_rectangle(spotlight_left_x+3, ground_y+1, spotlight_left_x+9, ground_y+7, fill='#ffffcc', outline='', tags='spotlight')
-        canvas.create_rectangle(spotlight_right_x+3, ground_y+1, spotlight_right_x+9, ground_y+7, fill='#ffffcc', outline='', tags='spotlight')
+    ground_y = SPOTLIGHT_GROUND_Y
+    spotlight_left_x, spotlight_right_x = SPOTLIGHT_X
+    
+    # Make lights brighter for dark rockets
+    if bright:
+        beam_color = '#ffffee'
+        beam_outline = '#ffffaa'
+        outline_width = 3
+    else:
+        beam_color = '#ffffaa'
+        beam_outline = '#ffff66'
+        outline_width = 2
+    
+    beam_ids = []
+    # Left light beam
+    beam_ids.append(canvas.create_polygon(
+        spotlight_left_x+6, ground_y,
+        rocket_x-18, rocket_mid_y,
+        rocket_x-8, rocket_mid_y,
+        spotlight_left_x+8, ground_y,
+        fill=beam_color, outline=beam_outline, width=outline_width, tags='spotlight'
+    ))
+    
+    # Right light beam
+    beam_ids.append(canvas.create_polygon(
+        spotlight_right_x+6, ground_y,
+        rocket_x+8, rocket_mid_y,
+        rocket_x+18, rocket_mid_y,
+        spotlight_right_x+8, ground_y,
+        fill=beam_color, outline=beam_outline, width=outline_width, tags='spotlight'
+    ))
+    
+    # Bright lens when lights are on
+    beam_ids.append(canvas.create_rectangle(spotlight_left_x+3, ground_y+1, spotlight_left_x+9, ground_y+7, fill='#ffffcc', outline='', tags='spotlight'))
+    beam_ids.append(canvas.create_rectangle(spotlight_right_x+3, ground_y+1, spotlight_right_x+9, ground_y+7, fill='#ffffcc', outline='', tags='spotlight'))
+    return beam_ids
+
+
+SPOTLIGHT_REEL = Reel([
+    ('off', lambda canvas: [], None),
+    ('on', draw_spotlight_beams, None),
+    ('bright', partial(draw_spotlight_beams, bright=True), None),
+], base=draw_spotlight_housings)
 
 def draw_launch_pad(canvas):
     """This function is now integrated into draw_launch_tower - kept for compatibility."""
@@ -904,15 +970,19 @@ def draw_car_vertical(canvas, x, y, car_color='#3a7bc8'):
     car_ids.append(canvas.create_oval(x+5, y+8, x+8, y+11, fill='#1a1a1a', outline='', tags='car'))
     return car_ids
 
-def draw_background(canvas):
-    """Draw the complete Kennedy Space Center background."""
+def draw_background_steps(canvas):
+    """Draw the Kennedy Space Center background one layer per step.
+    
+    Generator for the work queue: each `yield` ends a chunk, and the
+    cloud groups are the generator's return value.
+    """
     colors = get_sky_colors()
     
     # Sky - changes based on time of day - ADD TAGS
     canvas.create_rectangle(0, 0, 800, 400, fill=colors['sky'], outline='', tags='sky')
     
     # Add stars if nighttime - ADD TAGS
-    hour = datetime.now().hour
+    hour = clock.now().hour
     if hour >= 18 or hour < 6:
         draw_stars(canvas)
     
@@ -930,30 +1000,47 @@ def draw_background(canvas):
     
     # Draw roads BEFORE grass so grass appears on top
     draw_roads(canvas)
+    draw_parking_lots(canvas)
+    yield
     
     # Add pixel grass details
     draw_pixel_grass(canvas)
+    yield
     
     # Draw all buildings and structures
     draw_vab_building(canvas)
+    yield
     draw_secondary_building(canvas)
     draw_operations_building(canvas)
+    yield
     
     # Draw back fence BEFORE launch tower/pad so it appears behind
     draw_back_fence(canvas)
     
     draw_launch_tower(canvas)
     draw_launch_pad(canvas)
+    yield
     
     # Draw remaining fence sides (left, right, bottom) and guard shack
     draw_security_fence_and_shack(canvas)
     
     # Draw pond (gator will be animated separately)
-    draw_pond_with_gator(canvas, gator_visible=False)
+    draw_pond(canvas)
+    yield
     
     # Draw clouds - ALREADY HAVE TAGS
     cloud1 = draw_flat_cloud(canvas, 150, 60, colors['cloud'])
     cloud2 = draw_flat_cloud(canvas, 420, 90, colors['cloud'])
     cloud3 = draw_flat_cloud(canvas, 650, 50, colors['cloud'])
     
-    return [cloud1, cloud2, cloud3]
\ No newline at end of file
+    return [cloud1, cloud2, cloud3]
+
+
+def draw_background(canvas):
+    """Draw the complete Kennedy Space Center background."""
+    steps = draw_background_steps(canvas)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
@@ -4,8 +4,14 @@ Launch animation - handles rocket liftoff sequence at T-0.
 Enhanced with realistic flame based on real fire reference.
 """
 
-import random
+import logging
 import math
+import logs
+import quality
+import rng
+
+log = logs.get_logger('launch')
+_rng = rng.stream('launch')
 
 class LaunchAnimation:
     def __init__(self, canvas, rocket_tag, initial_x, initial_y, vehicle_name=None):
@@ -72,14 +78,12 @@ class LaunchAnimation:
             # Accelerate rocket upward
             self.velocity = min(self.velocity + self.acceleration, self.max_velocity)
             
-            # Debug output every 30 frames
-            if (self.launch_frame - 150) % 30 == 0:
+            # Debug output every 30 frames (the canvas queries only run at DEBUG)
+            if (self.launch_frame - 150) % 30 == 0 and log.isEnabledFor(logging.DEBUG):
                 rocket_items = self.canvas.find_withtag(self.rocket_tag)
-                print(f"Frame {self.launch_frame}: Moving {len(rocket_items)} elements, velocity={self.velocity:.2f}, current_y={self.current_y:.2f}")
-                if len(rocket_items) > 0:
-                    # Check position of first rocket element
-                    coords = self.canvas.coords(rocket_items[0])
-                    print(f"  First element coords: {coords}")
+                log.debug("Frame %d: moving %d elements, velocity=%.2f, current_y=%.2f, first element coords=%s",
+                          self.launch_frame, len(rocket_items), self.velocity, self.current_y,
+                          self.canvas.coords(rocket_items[0]) if rocket_items else None)
             
             # Move ALL rocket elements using the tag
             move_result = self.canvas.move(self.rocket_tag, 0, -self.velocity)
@@ -130,18 +134,18 @@ class LaunchAnimation:
         self.flame_particles = new_particles
         
         # Spawn new flame particles at rocket base
-        num_particles = int(20 * self.flame_intensity)
+        num_particles = int(quality.settings['flame_particles'] * self.flame_intensity)
         for _ in range(num_particles):
             # Create particle at rocket's current base position
             particle = {
-                'x': flame_x + random.uniform(-8, 8),
+                'x': flame_x + _rng.uniform(-8, 8),
                 'y': flame_y,
-                'velocity_x': random.uniform(-0.5, 0.5),
-                'velocity_y': random.uniform(2.0, 4.5),  # Downward speed (positive = down)
+                'velocity_x': _rng.uniform(-0.5, 0.5),
+                'velocity_y': _rng.uniform(2.0, 4.5),  # Downward speed (positive = down)
                 'age': 0,
-                'lifetime': random.randint(12, 25),
-                'size': random.uniform(3, 8),
-                'type': random.choice(['core', 'core', 'mid', 'outer'])  # More core particles
+                'lifetime': _rng.randint(12, 25),
+                'size': _rng.uniform(3, 8),
+                'type': _rng.choice(['core', 'core', 'mid', 'outer'])  # More core particles
             }
             self.flame_particles.append(particle)
         
@@ -185,7 +189,7 @@ class LaunchAnimation:
             
             # Fade out near end of life
             if age_ratio > 0.85:
-                if random.random() > 0.7:  # Start becoming transparent/invisible
+                if _rng.random() > 0.7:  # Start becoming transparent/invisible
                     continue
             
             # Size decreases with age
@@ -209,12 +213,12 @@ class LaunchAnimation:
         # Add bright core glow at base
         num_core = int(8 * self.flame_intensity)
         for i in range(num_core):
-            core_x = flame_x + random.uniform(-5, 5)
-            core_y = flame_y + random.uniform(0, 8)
-            core_size = random.uniform(4, 9)
+            core_x = flame_x + _rng.uniform(-5, 5)
+            core_y = flame_y + _rng.uniform(0, 8)
+            core_size = _rng.uniform(4, 9)
             
             # Bright white/yellow core with occasional flicker
-            brightness = random.uniform(0.9, 1.0)
+            brightness = _rng.uniform(0.9, 1.0)
             if brightness > 0.95:
                 core_color = '#ffffff'
             else:
@@ -228,13 +232,13 @@ class LaunchAnimation:
             self.flame_ids.append(core_id)
         
         # Add sparks (occasional bright particles shooting downward)
-        if random.random() > 0.5:
-            num_sparks = random.randint(2, 4)
+        if _rng.random() > 0.5:
+            num_sparks = _rng.randint(2, 4)
             for _ in range(num_sparks):
-                spark_x = flame_x + random.uniform(-12, 12)
-                spark_y = flame_y + random.uniform(5, 35)
-                spark_size = random.uniform(1.5, 3)
-                spark_color = random.choice(['#ffffff', '#ffffcc', '#ffff88'])
+                spark_x = flame_x + _rng.uniform(-12, 12)
+                spark_y = flame_y + _rng.uniform(5, 35)
+                spark_size = _rng.uniform(1.5, 3)
+                spark_color = _rng.choice(['#ffffff', '#ffffcc', '#ffff88'])
                 
                 spark_id = self.canvas.create_rectangle(
                     spark_x, spark_y,
@@ -246,13 +250,13 @@ class LaunchAnimation:
         # Add heat distortion lines below rocket
         if self.launch_frame >= 150:  # Only during active burn
             for i in range(3):
-                distortion_x = flame_x + random.uniform(-15, 15)
-                distortion_y = flame_y + random.uniform(40, 70)
+                distortion_x = flame_x + _rng.uniform(-15, 15)
+                distortion_y = flame_y + _rng.uniform(40, 70)
                 wave_offset = math.sin(self.launch_frame * 0.2 + i) * 3
                 
                 distortion_id = self.canvas.create_line(
                     distortion_x + wave_offset, distortion_y,
-                    distortion_x + wave_offset + random.uniform(-2, 2), distortion_y + 8,
+                    distortion_x + wave_offset + _rng.uniform(-2, 2), distortion_y + 8,
                     fill='#ffaa44', width=1, tags='launch_flame'
                 )
                 self.flame_ids.append(distortion_id)
@@ -278,32 +282,32 @@ class LaunchAnimation:
         self.vent_particles = new_vents
         
         # Spawn new vent particles (occasional bursts)
-        if random.random() > 0.7:  # 30% chance each frame
+        if _rng.random() > 0.7:  # 30% chance each frame
             # Left side vent
-            for _ in range(random.randint(2, 4)):
+            for _ in range(_rng.randint(2, 4)):
                 vent = {
                     'x': vent_x_left,
-                    'y': vent_y + random.uniform(-3, 3),
-                    'velocity_x': random.uniform(-1.5, -0.5),  # Move left
-                    'velocity_y': random.uniform(-0.3, 0.3),  # Slight vertical drift
+                    'y': vent_y + _rng.uniform(-3, 3),
+                    'velocity_x': _rng.uniform(-1.5, -0.5),  # Move left
+                    'velocity_y': _rng.uniform(-0.3, 0.3),  # Slight vertical drift
                     'age': 0,
-                    'lifetime': random.randint(20, 35),
-                    'size': random.uniform(2, 5),
-                    'color': random.choice(['#ffffff', '#f5f5f5', '#eeeeee', '#e8e8e8'])
+                    'lifetime': _rng.randint(20, 35),
+                    'size': _rng.uniform(2, 5),
+                    'color': _rng.choice(['#ffffff', '#f5f5f5', '#eeeeee', '#e8e8e8'])
                 }
                 self.vent_particles.append(vent)
             
             # Right side vent
-            for _ in range(random.randint(2, 4)):
+            for _ in range(_rng.randint(2, 4)):
                 vent = {
                     'x': vent_x_right,
-                    'y': vent_y + random.uniform(-3, 3),
-                    'velocity_x': random.uniform(0.5, 1.5),  # Move right
-                    'velocity_y': random.uniform(-0.3, 0.3),  # Slight vertical drift
+                    'y': vent_y + _rng.uniform(-3, 3),
+                    'velocity_x': _rng.uniform(0.5, 1.5),  # Move right
+                    'velocity_y': _rng.uniform(-0.3, 0.3),  # Slight vertical drift
                     'age': 0,
-                    'lifetime': random.randint(20, 35),
-                    'size': random.uniform(2, 5),
-                    'color': random.choice(['#ffffff', '#f5f5f5', '#eeeeee', '#e8e8e8'])
+                    'lifetime': _rng.randint(20, 35),
+                    'size': _rng.uniform(2, 5),
+                    'color': _rng.choice(['#ffffff', '#f5f5f5', '#eeeeee', '#e8e8e8'])
                 }
                 self.vent_particles.append(vent)
         
@@ -313,7 +317,7 @@ class LaunchAnimation:
             
             # Fade out near end of life
             if age_ratio > 0.7:
-                if random.random() > 0.5:  # Start becoming transparent
+                if _rng.random() > 0.5:  # Start becoming transparent
                     continue
             
             # Size increases slightly as gas expands
@@ -346,7 +350,7 @@ class LaunchAnimation:
         # Delete rocket
         self.canvas.delete(self.rocket_tag)
         
-        print("Launch complete!")
+        log.info("Launch complete!")
         
         if self.on_complete_callback:
             self.on_complete_callback()
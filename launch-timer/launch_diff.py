@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Diff engine for the upcoming launch list.
+
+diff_launches() compares the previous and new API launch lists field by
+field and returns typed change events, so the display only redraws what
+a change actually affects. An unchanged poll produces no events.
+"""
+
+
+# Change event kinds
+NEW_FIRST_LAUNCH = 'new_first_launch'   # a different launch is now first in the list
+TIME_SLIPPED = 'time_slipped'           # T-0 moved
+STATUS_CHANGED = 'status_changed'       # launch_description or status changed
+RESULT_POSTED = 'result_posted'         # result went from unknown to a value (or changed)
+DETAILS_CHANGED = 'details_changed'     # name, vehicle, provider or pad changed
+LAUNCH_REMOVED = 'launch_removed'       # launch dropped out of the list
+
+# Fields drawn on the info sign
+SIGN_FIELDS = {'name', 'vehicle', 'provider', 'pad', 'launch_description'}
+
+
+def get_launch_time(launch):
+    """T-0 of a launch record (falls back to the window open time)."""
+    return launch.get('t0') or launch.get('win_open')
+
+
+def get_launch_status(launch):
+    """Status text of a launch (launch_description can be a string or dict)."""
+    launch_desc = launch.get('launch_description', '')
+    if isinstance(launch_desc, dict):
+        return launch_desc.get('description', '')
+    return launch_desc
+
+
+def _nested_name(launch, field):
+    value = launch.get(field)
+    if isinstance(value, dict):
+        if field == 'pad':
+            return (value.get('name'), value.get('location', {}).get('name'))
+        return value.get('name')
+    return value
+
+
+class LaunchChange:
+    """One change between two launch lists."""
+
+    def __init__(self, kind, launch_id, launch, old=None, new=None, fields=()):
+        self.kind = kind
+        self.launch_id = launch_id
+        self.launch = launch    # New record (old record for removals)
+        self.old = old
+        self.new = new
+        self.fields = set(fields)
+
+    def __repr__(self):
+        return f"LaunchChange({self.kind}, {self.launch_id}, {self.old!r} -> {self.new!r})"
+
+
+def diff_launch(old, new):
+    """Changes between two records of the same launch."""
+    launch_id = new.get('id')
+    changes = []
+
+    old_time, new_time = get_launch_time(old), get_launch_time(new)
+    if old_time != new_time:
+        changes.append(LaunchChange(TIME_SLIPPED, launch_id, new, old_time, new_time, {'t0'}))
+
+    status_fields = set()
+    if get_launch_status(old) != get_launch_status(new):
+        status_fields.add('launch_description')
+    old_status, new_status = old.get('status') or {}, new.get('status') or {}
+    if (old_status.get('id'), old_status.get('name')) != (new_status.get('id'), new_status.get('name')):
+        status_fields.add('status')
+    if status_fields:
+        changes.append(LaunchChange(STATUS_CHANGED, launch_id, new,
+                                    (get_launch_status(old), old_status.get('name')),
+                                    (get_launch_status(new), new_status.get('name')), status_fields))
+
+    if old.get('result') != new.get('result'):
+        changes.append(LaunchChange(RESULT_POSTED, launch_id, new,
+                                    old.get('result'), new.get('result'), {'result'}))
+
+    detail_fields = {field for field in ('name', 'vehicle', 'provider', 'pad')
+                     if _nested_name(old, field) != _nested_name(new, field)}
+    if detail_fields:
+        changes.append(LaunchChange(DETAILS_CHANGED, launch_id, new,
+                                    {field: _nested_name(old, field) for field in detail_fields},
+                                    {field: _nested_name(new, field) for field in detail_fields},
+                                    detail_fields))
+    return changes
+
+
+def diff_launches(old_launches, new_launches):
+    """Typed change events between two ordered launch lists."""
+    old_launches = old_launches or []
+    new_launches = new_launches or []
+    old_by_id = {launch.get('id'): launch for launch in old_launches}
+    new_by_id = {launch.get('id'): launch for launch in new_launches}
+    changes = []
+
+    old_first = old_launches[0].get('id') if old_launches else None
+    new_first = new_launches[0].get('id') if new_launches else None
+    if new_first != old_first and new_launches:
+        changes.append(LaunchChange(NEW_FIRST_LAUNCH, new_first, new_launches[0], old_first, new_first))
+
+    for launch in new_launches:
+        launch_id = launch.get('id')
+        previous = old_by_id.get(launch_id)
+        if previous is not None:
+            changes.extend(diff_launch(previous, launch))
+
+    for launch in old_launches:
+        launch_id = launch.get('id')
+        if launch_id not in new_by_id:
+            changes.append(LaunchChange(LAUNCH_REMOVED, launch_id, launch))
+    return changes
+
+
+def changes_for(changes, launch_id, *kinds):
+    """Changes that concern one launch, optionally limited to some kinds."""
+    return [change for change in changes
+            if change.launch_id == launch_id and (not kinds or change.kind in kinds)]
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Structured logging for the display.
+
+Every module logs through a child of the 'launch_timer' logger:
+
+    log = logs.get_logger('api')
+    log.debug("Launch %s kept (status=%s)", name, status)
+
+Messages use %-style arguments, so nothing is formatted unless a handler
+actually wants the record, and hot paths log at DEBUG so they cost one
+level check by default. Structured fields go in `extra`:
+
+    log.info("Launch changed", extra={'old': old_id, 'new': new_id})
+
+setup_logging() attaches three handlers: the console, a rotating JSONL
+file and an in-memory ring buffer of recent records that can be dumped
+from the running process (the stall watchdog includes it in reports).
+"""
+
+import json
+import logging
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+
+
+ROOT_NAME = 'launch_timer'
+
+# LogRecord attributes that are not user supplied `extra` fields
+_STANDARD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+def get_logger(name):
+    """Logger for a module, e.g. get_logger('api') -> 'launch_timer.api'."""
+    return logging.getLogger(f"{ROOT_NAME}.{name}")
+
+
+def record_fields(record):
+    """Structured dict for a LogRecord (formats the message)."""
+    fields = {
+        'ts': round(record.created, 3),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created)),
+        'level': record.levelname,
+        'logger': record.name,
+        'msg': record.getMessage(),
+    }
+    for key, value in vars(record).items():
+        if key not in _STANDARD_ATTRS and not key.startswith('_'):
+            fields[key] = value
+    if record.exc_info:
+        fields['exc'] = logging.Formatter().formatException(record.exc_info)
+    return fields
+
+
+class JsonlFormatter(logging.Formatter):
+    """One JSON object per line."""
+
+    def format(self, record):
+        return json.dumps(record_fields(record), default=str)
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the most recent records in memory, formatted only when read."""
+
+    def __init__(self, capacity=2000):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def recent(self, count=None):
+        """The newest `count` records (all by default) as dicts, oldest first."""
+        records = list(self.records)
+        if count is not None:
+            records = records[-count:]
+        return [record_fields(record) for record in records]
+
+
+# Shared ring buffer, attached by setup_logging()
+ring_buffer = RingBufferHandler()
+
+
+def setup_logging(level='INFO', log_path='launch-timer.jsonl', console=True,
+                  max_bytes=1024 * 1024, backup_count=3):
+    """Configure the 'launch_timer' logger tree (safe to call again)."""
+    logger = logging.getLogger(ROOT_NAME)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        if handler is not ring_buffer:
+            handler.close()
+
+    logger.addHandler(ring_buffer)
+    if console:
+        stream = logging.StreamHandler()
+        stream.setFormatter(logging.Formatter('%(asctime)s %(levelname)-7s %(name)s: %(message)s', '%H:%M:%S'))
+        logger.addHandler(stream)
+    if log_path:
+        jsonl = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count)
+        jsonl.setFormatter(JsonlFormatter())
+        logger.addHandler(jsonl)
+    return logger
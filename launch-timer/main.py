@@ -4,40 +4,158 @@ Pixel Launch Pad Countdown Display with Kennedy Space Center Background
 Main entry point for the application.
 """
 
+import argparse
+import contextlib
 import tkinter as tk
-import random
-from api_client import fetch_launches, get_countdown
-from landscape import draw_background, draw_bird, draw_car
+import clock
+import logs
+import perf
+import power
+import quality
+import rng
+import tracing
+import snapshot
+from api_client import fetch_launches, get_countdown, seconds_until
+from background import BackgroundTasks
+from flocking import Flock
+from gator import Gator
+from traffic import Traffic
+from flipbook import Flipbook
+from landscape import draw_background_steps, spotlight_pose, SPOTLIGHT_REEL
 from rockets import draw_rocket_on_pad
 from ui_elements import (
     draw_info_sign,
     draw_countdown_display,
     draw_smoke_effect,
-    draw_attribution
+    draw_attribution,
+    UpdateBanner
 )
 from launch_animation import LaunchAnimation
+from work_queue import WorkQueue, NORMAL, BULK
+from launch_diff import (
+    diff_launches,
+    changes_for,
+    get_launch_status,
+    get_launch_time,
+    TIME_SLIPPED,
+    STATUS_CHANGED,
+    RESULT_POSTED,
+    DETAILS_CHANGED,
+    NEW_FIRST_LAUNCH,
+    LAUNCH_REMOVED,
+    SIGN_FIELDS
+)
 from aircraft import T38Aircraft
 from weather import WeatherSystem
 
+log = logs.get_logger('display')
+
 
 class LaunchPadDisplay:
-    def __init__(self, root):
+    # Launch lifecycle phases reported by get_launch_phase()
+    LAUNCH_PHASES = ('no_launch', 'countdown', 'final_hour', 'launching', 'in_flight', 'awaiting_status')
+    
+    # Timed loops and data calls -> subsystem name shown in the perf HUD
+    PERF_METHODS = {
+        'animate_clouds': 'clouds',
+        'animate_smoke': 'smoke',
+        'animate_birds': 'birds',
+        'animate_cars': 'cars',
+        'animate_gator': 'gator',
+        'animate_aircraft': 'aircraft',
+        'animate_tower_lights': 'tower_lights',
+        'animate_weather': 'weather',
+        'animate_sky_colors': 'sky_colors',
+        'update_countdown': 'countdown',
+        'fetch_and_display': 'data.fetch',
+        'safe_refresh': 'data.refresh',
+        'check_launch_status': 'data.status',
+        'load_next_launch': 'data.next_launch',
+        'refresh_weather': 'data.weather',
+        'draw_rocket_with_tag': 'redraw.rocket',
+        'stage_next_rocket': 'redraw.rocket_staged',
+        'redraw_info_sign': 'redraw.info_sign',
+    }
+    
+    def __init__(self, root, canvas=None, animate=True, show_perf=False, record_trace=False,
+                 threaded_fetch=False, snapshot_path=None, work_budget_chunks=None):
+        """
+        Build the display and start its update loops.
+        
+        Args:
+            root: Tk root (or headless.HeadlessRoot)
+            canvas: Canvas to draw on; created on the Tk root when None
+            animate: Start the decorative animation loops (scenario runs skip them)
+            show_perf: Show the performance HUD (toggle with F3) from startup
+            record_trace: Record trace events from startup (F4 dumps the buffer)
+            threaded_fetch: Run the startup and weather fetches on worker threads
+                (headless tools keep them on the simulated clock)
+            snapshot_path: Warm-start snapshot file, restored at startup before
+                the APIs answer and rewritten as the state changes (None disables it)
+            work_budget_chunks: Chunks per work queue slice instead of the time
+                budget (headless tools pass this so their runs repeat)
+        """
         self.root = root
+        
+        # Sample the clock once so everything drawn during startup agrees
+        clock.tick()
         self.root.title("Launch Countdown")
         self.root.geometry("800x600")
         self.root.configure(bg='#0a0a0a')
         
         # Create main canvas
-        self.canvas = tk.Canvas(root, width=800, height=600, bg='#87ceeb', highlightthickness=0)
-        self.canvas.pack(fill=tk.BOTH, expand=True)
+        if canvas is None:
+            canvas = tk.Canvas(root, width=800, height=600, bg='#87ceeb', highlightthickness=0)
+            canvas.pack(fill=tk.BOTH, expand=True)
+            has_controls = True
+        else:
+            has_controls = False
+        self.canvas = canvas
+        self.mark_startup('window')
         
-        # Launch data
+        # Launch data (launches is the queue of upcoming launches from the last
+        # fetch, launch_data its shown entry)
+        self.launches = []
         self.launch_data = None
         self.launch_time = None
         self.vehicle_name = None
+        
+        # Next launch's rocket, drawn hidden in idle time (tag 'rocket_staged')
+        self.staged_vehicle = None
+        
+        # Expensive redraws run in budgeted slices between frames
+        self.work = WorkQueue(root, budget_chunks=work_budget_chunks)
+        
+        # Network fetches run off the Tk thread; results come back on it
+        self.background = BackgroundTasks(root, threaded=threaded_fetch)
+        self.snapshot_path = snapshot_path
+        self.saved_snapshot = None
+        self.snapshot_job = None
+        self.restored_weather = None
+        
+        # Pending lifecycle jobs (after ids) so each chain runs only once
+        self.refresh_job = None
+        self.status_check_job = None
+        self.sky_colors_job = None
+        self.t0_check_pending = False
+        self.status_fetch_pending = False
+        self.next_launch_job = None
+        
+        # Stall watchdog (started by main(); beaten from tick_clock)
+        self.watchdog = None
+        
+        # Loop rate of the decorative animations (started with them)
+        self.power = power.PowerMode(self)
 
+        if record_trace:
+            tracing.recorder.start()
+        
+        # Register timed methods (wrapped only while the perf HUD is enabled)
+        perf.registry.instrument(self, self.PERF_METHODS)
+        
         self.weather = WeatherSystem(self.canvas)
-        self.weather.fetch_weather()  # Initial weather fetch
+        perf.registry.instrument(self.weather, {'apply_weather': 'data.weather'})
+        self.background.run(self.weather.request_weather, self.on_weather_fetched, name='fetch_weather')
 
         # Animation variables
         self.smoke_frame = 0
@@ -48,43 +166,72 @@ class LaunchPadDisplay:
         self.launch_animator = None
         self.rocket_ids = []
         
-        # Gator animation
-        self.gator_visible = False
-        self.gator_timer = 0
+        # Gator in the pond (the pond is part of the background)
+        self.gator = Gator(self.canvas)
+        
+        # Spotlights, drawn once the rocket is up
+        self.spotlights = None
         
         # T-38 Aircraft
         self.aircraft = T38Aircraft(self.canvas)
         
         # Birds
-        self.birds = []
         self.spawn_birds()
         
         # Cars
-        self.cars = []
         self.spawn_cars()
         
-        # Draw background scene and get cloud references
-        self.clouds = draw_background(self.canvas)
+        # Stream the background scene in over the first frames (clouds are
+        # filled in by the last chunk)
+        self.clouds = []
+        self.work.submit(self.stream_background(), BULK, name='background')
         
         # Create test launch button
-        self.test_button = tk.Button(
-            root,
-            text="TEST LAUNCH",
-            command=self.test_launch,
-            bg='#ff6600',
-            fg='#ffffff',
-            font=('Courier', 10, 'bold'),
-            padx=10,
-            pady=5
-        )
-        self.test_button.place(x=10, y=10)
-        
-        # Fetch and display launch data
-        self.fetch_and_display(is_initial=True)
+        if has_controls:
+            self.test_button = tk.Button(
+                root,
+                text="TEST LAUNCH",
+                command=self.test_launch,
+                bg='#ff6600',
+                fg='#ffffff',
+                font=('Courier', 10, 'bold'),
+                padx=10,
+                pady=5
+            )
+            self.test_button.place(x=10, y=10)
+        
+        # "Data updated" banner, shown when the launch data actually changes
+        self.update_banner = UpdateBanner(self.canvas)
+        
+        # Performance overlay
+        self.perf_hud = perf.PerfHUD(self.canvas, self.root)
+        self.perf_hud.extra_lines.append(self.particle_summary)
+        self.perf_hud.extra_lines.append(self.work_summary)
+        self.perf_hud.extra_lines.append(quality.governor.summary)
+        self.perf_hud.extra_lines.append(self.power.summary)
+        self.root.bind('<F3>', self.perf_hud.toggle)
+        self.root.bind('<F4>', self.dump_trace)
+        if show_perf:
+            self.perf_hud.show()
+        
+        # Restore the last known state right away, then revalidate in the background
+        if snapshot_path:
+            self.restore_snapshot(snapshot.read_snapshot(snapshot_path))
+            self.snapshot_job = self.root.after(60000, self.check_snapshot)
+        self.fetch_launches_in_background()
+        
+        # Runs once Tk has drawn the first frame
+        self.root.after_idle(self.mark_startup, 'first_paint')
         
         # Start countdown update loop
         self.update_countdown()
         
+        self.tick_clock()
+        self.animate_sky_colors()
+        self.refresh_weather_job = self.root.after(3600000, self.refresh_weather)
+        if not animate:
+            return
+        
         # Start animation loops
         self.animate_clouds()
         self.animate_smoke()
@@ -93,60 +240,50 @@ class LaunchPadDisplay:
         self.animate_gator()
         self.animate_aircraft()
         self.animate_tower_lights()
-        self.animate_sky_colors()
         self.animate_weather()
-        self.refresh_weather()  # Start weather refresh cycle
+        self.power.start()
 
     
-    def fetch_and_display(self, is_initial=True):
-        """Fetch launch data and display it."""
-        print("Fetching fresh launch data...")
-        launches = fetch_launches(5)
-        
+    def fetch_and_display(self, is_initial=True, launches=()):
+        """Display a launch list fetched in the background."""
         if not launches:
-            print("ERROR: No upcoming launches found!")
+            log.error("No upcoming launches found!")
+            self.canvas.delete('no_launches')
             self.canvas.create_text(400, 50, text="NO UPCOMING LAUNCHES",
-                                   font=('Courier', 16, 'bold'), fill='#ff4444')
+                                   font=('Courier', 16, 'bold'), fill='#ff4444', tags='no_launches')
             # Retry in 60 seconds
-            self.root.after(60000, lambda: self.fetch_and_display(is_initial=False))
+            self.root.after(60000, self.fetch_launches_in_background)
             return
         
+        self.canvas.delete('no_launches')
+        
         # Use the first upcoming launch
+        self.queue_launches(launches)
         self.launch_data = launches[0]
-        self.launch_time = self.launch_data.get('t0') or self.launch_data.get('win_open')
+        self.launch_time = get_launch_time(self.launch_data)
         self.vehicle_name = self.launch_data.get('vehicle', {}).get('name', 'Unknown')
         
-        print(f"\n=== SELECTED LAUNCH ===")
-        print(f"Name: {self.launch_data.get('name')}")
-        print(f"Vehicle: {self.vehicle_name}")
-        print(f"Status: {self.launch_data.get('status', {}).get('name')}")
-        print(f"Launch time: {self.launch_time}")
-        print(f"======================\n")
+        log.info("Selected launch: %s (%s), status %s, T-0 %s",
+                 self.launch_data.get('name'), self.vehicle_name,
+                 self.launch_data.get('status', {}).get('name'), self.launch_time,
+                 extra={'launch_id': self.launch_data.get('id')})
         
         # Only draw rocket and create animator if it's the initial load
-        # or if we're explicitly refreshing after a launch
-        if is_initial:
+        # or if we're explicitly refreshing after a launch (or it never got drawn)
+        if is_initial or self.launch_animator is None:
             # Draw rocket on pad
             self.draw_rocket_with_tag()
             
             # Create launch animator
-            self.launch_animator = LaunchAnimation(
-                self.canvas,
-                rocket_tag='rocket',
-                initial_x=620,
-                initial_y=340,
-                vehicle_name=self.vehicle_name
-            )
+            self.create_launch_animator()
         
         # Clear and redraw info sign
-        self.canvas.delete('info_sign')
-        draw_info_sign(self.canvas, self.launch_data, self.vehicle_name)
+        self.redraw_info_sign()
+        self.canvas.delete('attribution')
         draw_attribution(self.canvas)
         
-        # Draw spotlights AFTER rocket so they appear on top
-        from landscape import draw_spotlights
-        self.canvas.delete('spotlight')
-        draw_spotlights(self.canvas, self.vehicle_name)
+        # Raise spotlights AFTER rocket so they appear on top
+        self.show_spotlights()
         
         # Schedule next data refresh in 5 minutes ONLY if we're not close to launch
         if not is_initial:  # Don't schedule on initial load
@@ -157,18 +294,75 @@ class LaunchPadDisplay:
             seconds_to_launch = countdown.get('total_seconds', 0)
             # Only schedule refresh if launch is more than 10 minutes away
             if seconds_to_launch > 600:
-                print(f"Scheduling data refresh in 5 minutes (launch is {seconds_to_launch/60:.1f} minutes away)")
-                self.root.after(300000, self.safe_refresh)
+                log.debug("Scheduling data refresh in 5 minutes (launch is %.1f minutes away)", seconds_to_launch / 60)
+                self.schedule_refresh(300000)
             else:
-                print(f"Not scheduling refresh - launch is only {seconds_to_launch/60:.1f} minutes away")
+                log.debug("Not scheduling refresh - launch is only %.1f minutes away", seconds_to_launch / 60)
+    
+    def schedule_refresh(self, delay_ms):
+        """(Re)schedule the periodic data refresh, keeping a single chain."""
+        if self.refresh_job is not None:
+            self.root.after_cancel(self.refresh_job)
+        self.refresh_job = self.root.after(delay_ms, self.safe_refresh)
+    
+    def schedule_status_check(self, delay_ms):
+        """(Re)schedule a launch status check, keeping a single pending check."""
+        if self.status_check_job is not None:
+            self.root.after_cancel(self.status_check_job)
+        self.status_check_job = self.root.after(delay_ms, self.check_launch_status)
+    
+    def schedule_next_launch_retry(self, launch_id, delay_ms=60000):
+        """(Re)schedule a retry for the launch after `launch_id`, keeping a single pending retry."""
+        if self.next_launch_job is not None:
+            self.root.after_cancel(self.next_launch_job)
+        self.next_launch_job = self.root.after(delay_ms, self.on_next_launch_retry, launch_id)
+    
+    def redraw_info_sign(self):
+        """Clear and redraw the launch info sign on the next work slice."""
+        self.work.submit(self.draw_info_sign, NORMAL, name='info_sign')
+    
+    def draw_info_sign(self):
+        self.canvas.delete('info_sign')
+        draw_info_sign(self.canvas, self.launch_data, self.vehicle_name)
+    
+    def stream_background(self):
+        """Work queue job drawing the background one layer per chunk.
+        
+        Each layer goes above the scenery drawn so far but below everything
+        else, so the scene can fill in underneath the rocket and overlays.
+        """
+        steps = draw_background_steps(self.canvas)
+        while True:
+            with tracing.recorder.span('draw_background', 'redraw'):
+                with tagged_items(self.canvas, 'scenery_chunk'):
+                    try:
+                        next(steps)
+                        finished = False
+                    except StopIteration as done:
+                        self.clouds = done.value
+                        self.mark_startup('scene')
+                        finished = True
+                if self.canvas.find_withtag('scenery'):
+                    self.canvas.tag_raise('scenery_chunk', 'scenery')
+                else:
+                    self.canvas.tag_lower('scenery_chunk')
+                self.canvas.addtag_withtag('scenery', 'scenery_chunk')
+                self.canvas.dtag('scenery_chunk', 'scenery_chunk')
+            if finished:
+                # Bring the new sky, clouds and stars in line with the weather
+                self.animate_sky_colors()
+                return
+            yield
     
     def safe_refresh(self):
         """Safely refresh data only if conditions are right."""
+        self.refresh_job = None
+        
         # Don't refresh if we're currently launching
         if self.launch_animator and self.launch_animator.is_launching:
-            print("Skipping refresh - launch in progress")
+            log.debug("Skipping refresh - launch in progress")
             # Try again in 2 minutes
-            self.root.after(120000, self.safe_refresh)
+            self.schedule_refresh(120000)
             return
         
         # Check if we're still far from launch
@@ -177,104 +371,251 @@ class LaunchPadDisplay:
             if countdown and countdown != "LAUNCHED":
                 seconds_to_launch = countdown.get('total_seconds', 0)
                 if seconds_to_launch < 300:  # Less than 5 minutes
-                    print(f"Skipping refresh - too close to launch ({seconds_to_launch/60:.1f} minutes)")
+                    log.debug("Skipping refresh - too close to launch (%.1f minutes)", seconds_to_launch / 60)
                     # Try again in 1 minute
-                    self.root.after(60000, self.safe_refresh)
+                    self.schedule_refresh(60000)
                     return
         
-        print("Performing safe data refresh...")
-        # Fetch fresh data
-        launches = fetch_launches(5)
-        
-        if not launches:
-            print("No launches found during refresh")
-            self.root.after(300000, self.safe_refresh)
+        log.debug("Performing safe data refresh...")
+        self.background.run(lambda: fetch_launches(5), self.on_refresh_fetched, name='refresh_launches')
+    
+    def on_refresh_fetched(self, launches):
+        """Periodic refresh fetch finished (Tk thread)."""
+        if launches is None:
+            log.warning("Launch API unavailable - retrying refresh in 1 minute")
+            self.schedule_refresh(60000)
             return
+        if not launches:
+            log.warning("No launches found during refresh")
+        elif self.launch_animator and self.launch_animator.is_launching:
+            # Lifted off while the fetch was out; the status checks take over
+            log.debug("Dropping refresh - launch in progress")
+        else:
+            self.apply_fetched_launches(launches)
         
+        # Schedule next refresh
+        self.schedule_refresh(300000)
+    
+    def apply_fetched_launches(self, launches):
+        """Show a freshly fetched launch list: switch launches when ours was
+        removed or another launch moved ahead of it, otherwise apply only what
+        changed (nothing when the list is unchanged)."""
         current_launch_id = self.launch_data.get('id') if self.launch_data else None
-        new_launch = launches[0]
-        new_launch_id = new_launch.get('id')
+        changes = diff_launches(self.launches, launches)
+        self.queue_launches(launches)
         
-        if new_launch_id != current_launch_id:
+        overtaken = [change for change in changes
+                     if change.kind == NEW_FIRST_LAUNCH and change.launch_id != current_launch_id]
+        removed = changes_for(changes, current_launch_id, LAUNCH_REMOVED)
+        updated_launch = next((launch for launch in launches if launch.get('id') == current_launch_id), None)
+        
+        # A launch missing from both lists gets no removal event; treat it as removed too
+        if overtaken or removed or updated_launch is None:
             # Launch has changed! Need full refresh
-            print(f"Launch has changed! Old: {current_launch_id}, New: {new_launch_id}")
-            self.load_next_launch()
+            new_launch_id = launches[0].get('id')
+            log.info("Launch has changed! Old: %s, New: %s", current_launch_id, new_launch_id)
+            tracing.recorder.instant('launch.changed', old=current_launch_id, new=new_launch_id)
+            self.load_next_launch(launches)
         else:
-            # Same launch - check if launch time changed
-            old_time = self.launch_time
-            new_time = new_launch.get('t0') or new_launch.get('win_open')
-            
-            if new_time != old_time:
-                print(f"⚠️ LAUNCH TIME CHANGED!")
-                print(f"   Old time: {old_time}")
-                print(f"   New time: {new_time}")
-                self.launch_time = new_time
-            
-            # Update launch data
-            self.launch_data = new_launch
-            
-            # Refresh info sign with updated data
-            self.canvas.delete('info_sign')
-            draw_info_sign(self.canvas, self.launch_data, self.vehicle_name)
-            
-            print("Data refreshed successfully")
-            
-            # Schedule next refresh
-            self.root.after(300000, self.safe_refresh)
+            # Same launch - apply only what changed
+            self.apply_launch_changes(updated_launch, changes_for(changes, current_launch_id))
+            log.debug("Data refreshed successfully (%d changes)", len(changes))
     
-    def load_next_launch(self):
-        """Load the next launch after current one completes."""
-        print("Loading next launch...")
-        
-        # Clean up current rocket
-        self.canvas.delete('launch_flame')
-        self.canvas.delete('rocket')
-        
-        # Fetch fresh data and display
-        self.fetch_and_display(is_initial=True)
+    def fetch_launches_in_background(self):
+        """Fetch the launch list off the Tk thread (at startup and while it is empty)."""
+        self.background.run(lambda: fetch_launches(5), self.on_launches_fetched, name='fetch_launches')
     
-    def draw_rocket_with_tag(self):
-        """Draw the rocket with a 'rocket' tag on all elements."""
-        import rockets
-        
-        # Temporarily modify the rocket drawing to add tags
-        original_create_rectangle = self.canvas.create_rectangle
-        original_create_polygon = self.canvas.create_polygon
-        original_create_oval = self.canvas.create_oval
-        
-        def tagged_rectangle(*args, **kwargs):
-            if 'tags' in kwargs:
-                kwargs['tags'] = (kwargs['tags'], 'rocket')
-            else:
-                kwargs['tags'] = 'rocket'
-            return original_create_rectangle(*args, **kwargs)
-        
-        def tagged_polygon(*args, **kwargs):
-            if 'tags' in kwargs:
-                kwargs['tags'] = (kwargs['tags'], 'rocket')
-            else:
-                kwargs['tags'] = 'rocket'
-            return original_create_polygon(*args, **kwargs)
-        
-        def tagged_oval(*args, **kwargs):
-            if 'tags' in kwargs:
-                kwargs['tags'] = (kwargs['tags'], 'rocket')
-            else:
-                kwargs['tags'] = 'rocket'
-            return original_create_oval(*args, **kwargs)
-        
-        # Temporarily replace canvas methods
-        self.canvas.create_rectangle = tagged_rectangle
-        self.canvas.create_polygon = tagged_polygon
-        self.canvas.create_oval = tagged_oval
-        
-        # Draw the rocket (now all elements will have 'rocket' tag)
-        rockets.draw_rocket_on_pad(self.canvas, self.vehicle_name, pad_x=620, pad_y=340)
-        
-        # Restore original methods
-        self.canvas.create_rectangle = original_create_rectangle
-        self.canvas.create_polygon = original_create_polygon
-        self.canvas.create_oval = original_create_oval
+    def on_launches_fetched(self, launches):
+        """Startup launch fetch finished (Tk thread)."""
+        self.mark_startup('launch_data')
+        if self.launch_data is None:
+            self.fetch_and_display(is_initial=True, launches=launches or [])
+        elif launches:
+            # Revalidating a restored snapshot
+            self.apply_fetched_launches(launches)
+            self.schedule_refresh(300000)
+        else:
+            log.warning("Launch API unavailable at startup - keeping the restored launch")
+            self.schedule_refresh(60000)
+    
+    def on_weather_fetched(self, weather_info):
+        """Weather fetch finished (Tk thread): bring the sky up to date."""
+        self.mark_startup('weather')
+        self.weather.apply_weather(weather_info)
+        if weather_info is None and self.restored_weather:
+            # Keep the restored weather rather than falling back to clear skies
+            self.weather.current_weather, self.weather.weather_condition = self.restored_weather
+        self.animate_sky_colors()
+        self.request_snapshot()
+    
+    def restore_snapshot(self, saved):
+        """Show the state from a warm-start snapshot (before anything is fetched)."""
+        perf.count_cache('snapshot', saved is not None)
+        if not saved:
+            return
+        weather = saved.get('weather') or {}
+        if weather.get('current'):
+            self.weather.current_weather = weather['current']
+            self.weather.weather_condition = weather.get('condition', 'clear')
+            self.restored_weather = (self.weather.current_weather, self.weather.weather_condition)
+        perf.count_cache('scene_key', saved.get('scene_key') == snapshot.scene_key(self.weather.weather_condition))
+        
+        launch = saved.get('launch')
+        if not launch:
+            return
+        self.launch_data = launch
+        self.launch_time = saved.get('launch_time') or get_launch_time(launch)
+        self.vehicle_name = launch.get('vehicle', {}).get('name', 'Unknown')
+        self.queue_launches(saved.get('launches') or [launch])
+        log.info("Restored snapshot: %s (%s), T-0 %s, %d queued",
+                 launch.get('name'), self.vehicle_name, self.launch_time, len(self.launches),
+                 extra={'launch_id': launch.get('id')})
+        
+        if get_launch_status(launch) != 'In Flight':
+            self.draw_rocket_with_tag()
+            self.create_launch_animator()
+        self.redraw_info_sign()
+        draw_attribution(self.canvas)
+        self.show_spotlights()
+    
+    def request_snapshot(self):
+        """Save the snapshot once the current update has finished."""
+        if self.snapshot_path:
+            self.work.submit(self.save_snapshot, BULK, name='snapshot')
+    
+    def check_snapshot(self):
+        """Once a minute, catch changes made outside request_snapshot()."""
+        self.save_snapshot()
+        self.snapshot_job = self.root.after(60000, self.check_snapshot)
+    
+    def save_snapshot(self):
+        """Write the warm-start snapshot if the state changed since the last write."""
+        current = snapshot.capture(self)
+        if current != self.saved_snapshot and snapshot.write_snapshot(self.snapshot_path, current):
+            self.saved_snapshot = current
+    
+    def mark_startup(self, phase):
+        """Record a startup milestone and report once the display is complete."""
+        if phase in perf.startup.phases:
+            return
+        ms = perf.startup.mark(phase)
+        tracing.recorder.instant(f'startup.{phase}', 'startup', ms=round(ms, 1))
+        log.debug("Startup: %s at %.0fms", phase, ms)
+        if perf.startup.reached('first_paint', 'scene', 'launch_data', 'weather'):
+            log.info("Startup phases: %s", perf.startup.summary(),
+                     extra={'startup_ms': {name: round(value, 1) for name, value in perf.startup.phases.items()}})
+    
+    def apply_launch_changes(self, launch, changes):
+        """Update the shown launch and redraw only what the changes affect.
+        
+        Args:
+            launch: New record of the shown launch
+            changes: launch_diff events for that launch
+        """
+        self.launch_data = launch
+        if changes:
+            self.request_snapshot()
+        for change in changes:
+            log.info("Launch %s: %s %r -> %r", change.launch_id, change.kind, change.old, change.new,
+                     extra={'change': change.kind})
+            tracing.recorder.instant(f'launch.{change.kind}', old=str(change.old), new=str(change.new))
+            if change.kind == TIME_SLIPPED:
+                # The countdown picks the new T-0 up on its next tick
+                self.launch_time = change.new
+                self.restore_rocket_after_slip()
+        
+        vehicle_changed = changes_for(changes, launch.get('id'), DETAILS_CHANGED)
+        if any('vehicle' in change.fields for change in vehicle_changed):
+            self.vehicle_name = launch.get('vehicle', {}).get('name', 'Unknown')
+            if not (self.launch_animator and self.launch_animator.is_launching):
+                self.rebuild_rocket()
+        
+        if any(change.fields & SIGN_FIELDS for change in changes):
+            self.redraw_info_sign()
+        
+        banner_titles = {
+            TIME_SLIPPED: "T-0 CHANGED",
+            STATUS_CHANGED: "STATUS CHANGED",
+            RESULT_POSTED: "RESULT POSTED",
+            DETAILS_CHANGED: "DATA UPDATED",
+        }
+        titles = [banner_titles[change.kind] for change in changes if change.kind in banner_titles]
+        if titles:
+            self.update_banner.show(titles[0] if len(set(titles)) == 1 else "DATA UPDATED")
+    
+    def restore_rocket_after_slip(self):
+        """Put the rocket back on the pad if it already flew at the old T-0."""
+        seconds_to_launch = seconds_until(self.launch_time)
+        if seconds_to_launch is None or seconds_to_launch <= 0:
+            return
+        if self.launch_animator and self.launch_animator.is_launching:
+            return
+        if self.canvas.find_withtag('rocket') or get_launch_status(self.launch_data) == 'In Flight':
+            return
+        log.info("T-0 moved after liftoff - putting the rocket back on the pad")
+        self.rebuild_rocket()
+        # The countdown is running again; stop polling for a result
+        if self.status_check_job is not None:
+            self.root.after_cancel(self.status_check_job)
+            self.status_check_job = None
+    
+    def draw_rocket_with_tag(self, tag='rocket', vehicle_name=None, hidden=False):
+        """Draw a rocket with `tag` on all of its elements.
+        
+        Args:
+            tag: Tag added to every rocket element
+            vehicle_name: Vehicle to draw (defaults to the current vehicle)
+            hidden: Create the elements hidden (used to pre-stage the next rocket)
+        """
+        with tagged_items(self.canvas, tag, hidden):
+            draw_rocket_on_pad(self.canvas, vehicle_name or self.vehicle_name, pad_x=620, pad_y=340)
+    
+    def create_launch_animator(self):
+        """Create the launch animator for the rocket currently on the pad."""
+        self.launch_animator = LaunchAnimation(
+            self.canvas,
+            rocket_tag='rocket',
+            initial_x=620,
+            initial_y=340,
+            vehicle_name=self.vehicle_name
+        )
+        perf.registry.instrument(self.launch_animator, {'animate_launch': 'launch'})
+    
+    def get_launch_phase(self):
+        """Current phase of the launch lifecycle (one of LAUNCH_PHASES)."""
+        if self.launch_animator and self.launch_animator.is_launching:
+            return 'launching'
+        if not self.launch_data or not self.launch_time:
+            return 'no_launch'
+        if get_launch_status(self.launch_data) == 'In Flight':
+            return 'in_flight'
+        seconds_to_launch = seconds_until(self.launch_time)
+        if seconds_to_launch is None or seconds_to_launch <= 0:
+            return 'awaiting_status'
+        if seconds_to_launch <= 3600:
+            return 'final_hour'
+        return 'countdown'
+    
+    def dump_trace(self, event=None):
+        """Write the trace buffer to disk, starting the recorder if it is off."""
+        if not tracing.recorder.enabled:
+            log.info("Trace recording started - press F4 again to dump")
+            tracing.recorder.start()
+            return
+        tracing.recorder.dump()
+    
+    def particle_summary(self):
+        """One-line count of the particle systems for the perf HUD."""
+        animator = self.launch_animator
+        flame = len(animator.flame_particles) if animator else 0
+        vent = len(animator.vent_particles) if animator else 0
+        return (f"flame {flame}  vent {vent}  rain {len(self.weather.rain_drops)}  "
+                f"jet {'on' if self.aircraft.active else 'off'}  "
+                f"cars {len(self.traffic)} (+{self.traffic.parked()} parked)")
+    
+    def work_summary(self):
+        """Work queue line for the perf HUD."""
+        return f"work {len(self.work)} jobs  {self.work.slices} slices  {self.work.chunks} chunks"
     
     def interpolate_color(self, color1, color2, ratio):
         """Interpolate between two hex colors."""
@@ -297,8 +638,7 @@ class LaunchPadDisplay:
     
     def get_current_sky_colors_with_transition(self):
         """Get current sky colors with smooth transitions between times."""
-        from datetime import datetime
-        now = datetime.now()
+        now = clock.now()
         hour = now.hour
         minute = now.minute
         
@@ -406,12 +746,13 @@ class LaunchPadDisplay:
                 self.canvas.itemconfig(item, state='hidden')
         
         # Update spotlights
-        from landscape import draw_spotlights
-        self.canvas.delete('spotlight')
-        draw_spotlights(self.canvas, self.vehicle_name)
+        self.show_spotlights()
         
-        # Check again in 30 seconds
-        self.root.after(30000, self.animate_sky_colors)
+        # Check again in 30 seconds (refresh_weather also calls this, so
+        # replace the pending check instead of starting a second chain)
+        if self.sky_colors_job is not None:
+            self.root.after_cancel(self.sky_colors_job)
+        self.sky_colors_job = self.root.after(30000, self.animate_sky_colors)
 
 # Add this new method to update weather effects every frame:
     def animate_weather(self):
@@ -420,18 +761,26 @@ class LaunchPadDisplay:
         self.root.after(50, self.animate_weather)
     def refresh_weather(self):
         """Refresh weather data every 15 minutes."""
-        print("Refreshing weather data...")
-        self.weather.fetch_weather()
-        
-        # Update sky colors immediately
-        self.animate_sky_colors()
+        log.debug("Refreshing weather data...")
+        # Update sky colors as soon as the fetch returns
+        self.background.run(self.weather.request_weather, self.on_weather_fetched, name='fetch_weather')
         
         # Schedule next refresh in 60 minutes
-        self.root.after(3600000, self.refresh_weather)
+        self.refresh_weather_job = self.root.after(3600000, self.refresh_weather)
+    
+    def tick_clock(self):
+        """Sample the shared clock once per frame for every animation loop."""
+        clock.tick()
+        perf.registry.frame()
+        quality.governor.frame()
+        tracing.recorder.tick()
+        if self.watchdog:
+            self.watchdog.beat()
+        self.root.after(int(30 * self.power.scale), self.tick_clock)
     
     def animate_clouds(self):
         """Animate clouds moving horizontally."""
-        self.canvas.move('cloud', 0.3, 0)
+        self.canvas.move('cloud', 0.3 * self.power.scale, 0)
         
         for cloud_group in self.clouds:
             if cloud_group:
@@ -440,18 +789,19 @@ class LaunchPadDisplay:
                     for cloud_id in cloud_group:
                         self.canvas.move(cloud_id, -900, 0)
         
-        self.root.after(50, self.animate_clouds)
+        self.root.after(int(50 * self.power.scale), self.animate_clouds)
     
     def animate_smoke(self):
         """Animate smoke rising from rocket base."""
         is_launching = self.launch_animator and self.launch_animator.is_launching
-        draw_smoke_effect(self.canvas, self.smoke_frame, self.launch_data, is_launching=is_launching)
-        self.smoke_frame += 1
-        self.root.after(100, self.animate_smoke)
+        draw_smoke_effect(self.canvas, self.smoke_frame, self.launch_data, is_launching=is_launching,
+                          puffs=quality.settings['smoke_puffs'])
+        self.smoke_frame += self.power.scale
+        self.root.after(int(100 * self.power.scale), self.animate_smoke)
     
     def animate_tower_lights(self):
         """Animate the blinking white lights on the launch tower."""
-        self.light_blink_counter += 1
+        self.light_blink_counter += self.power.scale
         
         # Blink every 30 frames (~1 second at 30ms intervals)
         if self.light_blink_counter >= 30:
@@ -468,252 +818,88 @@ class LaunchPadDisplay:
                     # Turn off (dark gray)
                     self.canvas.itemconfig(light_id, fill='#3a3a3a', outline='#2a2a2a')
         
-        self.root.after(30, self.animate_tower_lights)
+        self.root.after(int(30 * self.power.scale), self.animate_tower_lights)
     
     def animate_aircraft(self):
         """Animate T-38 aircraft flyby."""
-        import time
-        current_time = time.time() * 1000
+        current_time = clock.time_ms()
         
         # Check if it's time to start a new flyby
         if self.aircraft.should_start_flyby(current_time):
             self.aircraft.start_flyby()
+            self.power.update()  # back to full rate for the flyby
         
         # Update aircraft if active
         if self.aircraft.active:
             self.aircraft.update(33)
         
-        self.root.after(33, self.animate_aircraft)
+        self.root.after(int(33 * self.power.scale), self.animate_aircraft)
     
     def spawn_birds(self):
-        """Create initial birds at random positions off-screen."""
-        used_y_positions = []
-        for i in range(3):
-            x = -100 - (i * 150)
-            
-            while True:
-                y = random.randint(80, 280)
-                if not any(abs(y - used_y) < 40 for used_y in used_y_positions):
-                    used_y_positions.append(y)
-                    break
-            
-            speed_x = random.uniform(0.8, 1.8)
-            speed_y = random.uniform(-0.15, 0.15)
-            bird_ids = draw_bird(self.canvas, x, y, flap_up=True)
-            self.birds.append({
-                'ids': bird_ids,
-                'speed_x': speed_x,
-                'speed_y': speed_y,
-                'y': y,
-                'x': x,
-                'flap_up': True,
-                'flap_counter': 0,
-                'min_y': 60,
-                'max_y': 300
-            })
+        """Create the flock, lined up off-screen to the left."""
+        self.flock = Flock(self.canvas)
+        self.birds = self.flock.birds
+        self.flock.populate(quality.settings['birds'])
     
     def animate_birds(self):
-        """Animate birds flying across the screen with flapping wings."""
-        for bird in self.birds:
-            bird['flap_counter'] += 1
-            if bird['flap_counter'] >= 8:
-                bird['flap_counter'] = 0
-                bird['flap_up'] = not bird['flap_up']
-                
-                if bird['ids']:
-                    coords = self.canvas.coords(bird['ids'][0])
-                    if coords:
-                        current_x = coords[0]
-                        current_y = bird['y']
-                        
-                        for bird_id in bird['ids']:
-                            self.canvas.delete(bird_id)
-                        
-                        bird['ids'] = draw_bird(self.canvas, current_x, current_y, bird['flap_up'])
-            
-            for bird_id in bird['ids']:
-                self.canvas.move(bird_id, bird['speed_x'], bird['speed_y'])
-            
-            bird['y'] += bird['speed_y']
-            bird['x'] += bird['speed_x']
-            
-            if bird['y'] <= bird['min_y'] or bird['y'] >= bird['max_y']:
-                bird['speed_y'] = -bird['speed_y']
-            
-            if bird['x'] > 850:
-                for bird_id in bird['ids']:
-                    self.canvas.delete(bird_id)
-                
-                used_y_positions = [b['y'] for b in self.birds if b != bird]
-                while True:
-                    new_y = random.randint(80, 280)
-                    if not any(abs(new_y - used_y) < 40 for used_y in used_y_positions):
-                        break
-                
-                new_x = -50
-                new_speed_x = random.uniform(0.8, 1.8)
-                new_speed_y = random.uniform(-0.15, 0.15)
-                bird['ids'] = draw_bird(self.canvas, new_x, new_y, bird['flap_up'])
-                bird['speed_x'] = new_speed_x
-                bird['speed_y'] = new_speed_y
-                bird['y'] = new_y
-                bird['x'] = new_x
-        
-        self.root.after(50, self.animate_birds)
+        """Fly the flock across the screen with flapping wings."""
+        self.flock.tick(self.power.scale, quality.settings['birds'])
+        self.root.after(int(50 * self.power.scale), self.animate_birds)
 
    
     
     def spawn_cars(self):
-        """Create initial cars that will drive on the road and stop at gate."""
-        car_colors = ['#3a7bc8', '#d44444', '#f5f5f5', '#2a2a2a', '#ffd93d', '#4a9d5f']
-        road_y = 429
-        
-        # Gate location (at the guard shack, just before fence)
-        self.gate_x = 490
-        self.gate_timer = 0  # Timer for gate openings
-        self.gate_open_interval = 3000  # Open gate every 3 seconds (in ms)
-        self.last_gate_open = 0
-        
-        for i in range(6):
-            # All cars approach from the left
-            x = -50 - (i * 80)  # Spread them out initially
-            
-            speed = random.uniform(0.8, 1.2)
-            color = random.choice(car_colors)
-            
-            car_ids = draw_car(self.canvas, x, road_y, color)
-            self.cars.append({
-                'ids': car_ids,
-                'speed': speed,
-                'base_speed': speed,
-                'color': color,
-                'x': x,
-                'y': road_y,
-                'state': 'approaching',  # approaching, waiting, entering, driving
-                'wait_start': 0
-            })
+        """Create the road traffic; the parked cars are drawn in idle time."""
+        self.traffic = Traffic(self.canvas)
+        self.cars = self.traffic.cars
+        self.traffic.spawn(quality.settings['cars'])
+        self.work.submit(self.traffic.build_lots(), BULK, name='parking')
     
     def animate_cars(self):
-        """Animate cars with gate queue system."""
-        import time
-        current_time = time.time() * 1000
-        road_y = 429
-        
-        # Check if gate should open (every 3 seconds)
-        if current_time - self.last_gate_open >= self.gate_open_interval:
-            self.last_gate_open = current_time
-            # Let the first waiting car through
-            for car in self.cars:
-                if car['state'] == 'waiting':
-                    car['state'] = 'entering'
-                    car['wait_start'] = current_time
-                    break
-        
-        # Calculate how many cars are currently waiting
-        waiting_cars = [c for c in self.cars if c['state'] == 'waiting']
-        
-        for car in self.cars:
-            if car['state'] == 'approaching':
-                # Car is driving toward the gate
-                # Check if there are cars waiting ahead
-                cars_ahead = [c for c in self.cars if c['state'] in ['waiting', 'approaching'] and c['x'] < car['x'] and c['x'] > car['x'] - 100]
-                
-                if cars_ahead:
-                    # Stop behind the car ahead (maintain 15 pixel gap)
-                    closest_car = max(cars_ahead, key=lambda c: c['x'])
-                    stop_position = closest_car['x'] - 15
-                    
-                    if car['x'] >= stop_position:
-                        car['speed'] = 0
-                        car['state'] = 'waiting'
-                    else:
-                        car['speed'] = car['base_speed']
-                        for car_id in car['ids']:
-                            self.canvas.move(car_id, car['speed'], 0)
-                        car['x'] += car['speed']
-                else:
-                    # No cars ahead, check distance to gate
-                    if car['x'] >= self.gate_x - 20:
-                        # Reached gate, stop and wait
-                        car['speed'] = 0
-                        car['state'] = 'waiting'
-                    else:
-                        # Keep driving toward gate
-                        car['speed'] = car['base_speed']
-                        for car_id in car['ids']:
-                            self.canvas.move(car_id, car['speed'], 0)
-                        car['x'] += car['speed']
-            
-            elif car['state'] == 'waiting':
-                # Car is stopped at gate or in queue
-                # Don't move, just wait
-                pass
-            
-            elif car['state'] == 'entering':
-                # Gate opened, car is entering (drives for 2 seconds then goes to 'driving')
-                if current_time - car['wait_start'] < 2000:
-                    # Drive through gate for 2 seconds
-                    car['speed'] = car['base_speed']
-                    for car_id in car['ids']:
-                        self.canvas.move(car_id, car['speed'], 0)
-                    car['x'] += car['speed']
-                else:
-                    # Done entering, now freely driving
-                    car['state'] = 'driving'
-            
-            elif car['state'] == 'driving':
-                # Car is past the gate, driving freely
-                car['speed'] = car['base_speed']
-                for car_id in car['ids']:
-                    self.canvas.move(car_id, car['speed'], 0)
-                car['x'] += car['speed']
-                
-                # Check if car went off screen
-                if car['x'] > 850:
-                    # Respawn car on the left
-                    for car_id in car['ids']:
-                        self.canvas.delete(car_id)
-                    
-                    new_x = -50
-                    new_speed = random.uniform(0.8, 1.2)
-                    car['ids'] = draw_car(self.canvas, new_x, road_y, car['color'])
-                    car['speed'] = new_speed
-                    car['base_speed'] = new_speed
-                    car['x'] = new_x
-                    car['state'] = 'approaching'
-        
-        self.root.after(50, self.animate_cars)
+        """Animate the gate queue, visitor parking and departures."""
+        seconds_to_launch = seconds_until(self.launch_time) if self.launch_time else None
+        self.traffic.tick(self.power.scale, seconds_to_launch, road_cars=quality.settings['cars'])
+        self.root.after(int(50 * self.power.scale), self.animate_cars)
     
-    def animate_gator(self):
-        """Animate alligator appearing and disappearing from pond."""
-        from landscape import draw_pond_with_gator
-        
-        self.gator_timer += 1
-        
-        if self.gator_timer >= 30:
-            self.gator_visible = True
-            self.gator_timer = 0
-        
-        if self.gator_timer < 5:
-            show_gator = True
-        else:
-            show_gator = False
-        
-        self.canvas.delete('pond', 'gator')
-        draw_pond_with_gator(self.canvas, gator_visible=show_gator)
-        
-        self.root.after(1000, self.animate_gator)
+    def animate_gator(self, elapsed=0):
+        """Animate the alligator surfacing and diving in the pond."""
+        delay = self.gator.update(elapsed)
+        self.root.after(delay, self.animate_gator, delay)
+    
+    def show_spotlights(self):
+        """Light the spotlights for the time of day and vehicle, above the rocket."""
+        if self.spotlights is None:
+            self.spotlights = Flipbook(self.canvas, SPOTLIGHT_REEL, tag='spotlights')
+        self.spotlights.show(spotlight_pose(self.vehicle_name))
+        self.canvas.tag_raise('spotlight')
     
     def check_launch_status(self):
         """Check if launch actually happened or was postponed when countdown reaches zero."""
+        self.status_check_job = None
         if not self.launch_data:
             return
         
-        print("Checking launch status...")
+        log.debug("Checking launch status...")
         
         # Re-fetch launches to get updated status
-        launches = fetch_launches(5)
+        self.status_fetch_pending = True
+        self.background.run(lambda: fetch_launches(5), self.on_status_fetched, name='check_status')
+    
+    def on_status_fetched(self, launches):
+        """Status check fetch finished (Tk thread): follow the launch to its result."""
+        self.status_fetch_pending = False
+        if not self.launch_data:
+            return
+        if launches is None:
+            # Fetch failed: that says nothing about the launch, so ask again
+            log.warning("Launch API unavailable - checking status again in 30 seconds")
+            self.schedule_status_check(30000)
+            return
         current_launch_id = self.launch_data.get('id')
+        changes = []
+        if launches:
+            changes = changes_for(diff_launches(self.launches, launches), current_launch_id)
+            self.queue_launches(launches)
         
         # Find our current launch in the results
         updated_launch = None
@@ -723,57 +909,49 @@ class LaunchPadDisplay:
                 break
         
         if updated_launch:
-            # Check status
-            # launch_description can be a string or dict
-            launch_desc = updated_launch.get('launch_description', '')
-            if isinstance(launch_desc, dict):
-                status = launch_desc.get('description', '')
-            else:
-                status = launch_desc
+            self.apply_launch_changes(updated_launch, changes)
+            status = get_launch_status(updated_launch)
             
             # Check if the launch time has changed (postponement)
-            new_launch_time = updated_launch.get('t0') or updated_launch.get('win_open')
-            
-            if new_launch_time != self.launch_time:
-                # Launch was postponed!
-                print(f"Launch postponed! New time: {new_launch_time}")
-                self.launch_time = new_launch_time
-                self.launch_data = updated_launch
-                # Update the info sign with new data
-                self.canvas.delete('info_sign')
-                draw_info_sign(self.canvas, self.launch_data, self.vehicle_name)
+            if changes_for(changes, current_launch_id, TIME_SLIPPED):
+                log.warning("Launch postponed! New time: %s", self.launch_time)
                 return
             
             # Check if in flight or completed
             if status == 'In Flight':
-                print("Launch is in flight - waiting for completion...")
+                log.info("Launch is in flight - waiting for completion...")
+                tracing.recorder.instant('launch.in_flight')
                 # Check again in 30 seconds
-                self.root.after(30000, self.check_launch_status)
+                self.schedule_status_check(30000)
                 return
             
             # Check launch result if available
             result = updated_launch.get('result')
             if result == 1:  # Success
-                print("Launch confirmed successful! Loading next launch...")
-                self.load_next_launch()
+                log.info("Launch confirmed successful! Loading next launch...")
+                self.load_next_launch(launches or None)
             elif result == 2:  # Failure
-                print("Launch failed - loading next launch...")
-                self.load_next_launch()
+                log.info("Launch failed - loading next launch...")
+                self.load_next_launch(launches or None)
             elif result == 3:  # Partial failure
-                print("Launch partial failure - loading next launch...")
-                self.load_next_launch()
+                log.info("Launch partial failure - loading next launch...")
+                self.load_next_launch(launches or None)
+            elif is_holding(updated_launch):
+                # Held past T-0: keep the launch until the hold resolves
+                log.info("Launch is in %s - checking again in 30 seconds", status)
+                self.schedule_status_check(30000)
             elif status not in ['In Flight', 'Go', 'Go for Launch']:
                 # Launch completed (no longer in flight), load next
-                print(f"Launch status: {status} - loading next launch...")
-                self.load_next_launch()
+                log.info("Launch status: %s - loading next launch...", status)
+                self.load_next_launch(launches or None)
             else:
                 # Still unclear, check again in 30 seconds
-                print("Status unclear, checking again in 30 seconds...")
-                self.root.after(30000, self.check_launch_status)
+                log.debug("Status unclear, checking again in 30 seconds...")
+                self.schedule_status_check(30000)
         else:
             # Couldn't find our launch, it might have been removed (scrubbed)
-            print("Launch data no longer available - loading next launch")
-            self.load_next_launch()
+            log.info("Launch data no longer available - loading next launch")
+            self.load_next_launch(launches or None)
     
     def update_countdown(self):
         """Update the countdown display every second."""
@@ -781,154 +959,342 @@ class LaunchPadDisplay:
             self.root.after(1000, self.update_countdown)
             return
         
+        if self.power.scale > 1:
+            # The frame tick is slowed down; sample the clock so no second is skipped
+            clock.tick()
         countdown = get_countdown(self.launch_time)
         draw_countdown_display(self.canvas, countdown, self.launch_data)
         
-        # Check if countdown reached zero
-        if countdown and countdown != "LAUNCHED":
-            if countdown['total_seconds'] <= 0 and countdown['total_seconds'] > -5:
-                # At T-0, trigger launch immediately
-                self.trigger_launch()
-            elif countdown['total_seconds'] <= -10:
-                # More than 10 seconds past T-0, check status
-                self.check_launch_status()
+        # Check if countdown reached zero (get_countdown reports "LAUNCHED"
+        # once T-0 has passed, so look at the raw seconds instead)
+        seconds_to_launch = seconds_until(self.launch_time)
+        if seconds_to_launch is not None:
+            is_launching = self.launch_animator and self.launch_animator.is_launching
+            if -5 < seconds_to_launch <= 0:
+                # At T-0, make sure the launch is still on before lifting off
+                self.confirm_launch()
+            elif (seconds_to_launch <= -10 and not is_launching and self.status_check_job is None
+                    and not self.status_fetch_pending and not self.t0_check_pending):
+                # More than 10 seconds past T-0 and nothing pending, check status
+                self.schedule_status_check(0)
         
         self.root.after(1000, self.update_countdown)
     
+    def confirm_launch(self):
+        """At T-0, fetch once to catch a hold or slip the refresh skipped, then launch.
+        
+        safe_refresh stands down for the last five minutes, so the cached
+        launch can be stale by T-0.
+        """
+        if (self.t0_check_pending or not self.launch_animator or self.launch_animator.is_launching
+                or not self.canvas.find_withtag('rocket')):
+            return
+        if is_holding(self.launch_data):
+            log.info("T-0 reached but launch is in %s - not launching", get_launch_status(self.launch_data))
+            return
+        self.t0_check_pending = True
+        self.background.run(lambda: fetch_launches(5), self.on_t0_checked, name='confirm_launch')
+    
+    def on_t0_checked(self, launches):
+        """T-0 fetch finished (Tk thread): launch unless it was held or moved."""
+        self.t0_check_pending = False
+        if launches:
+            self.apply_fetched_launches(launches)
+        else:
+            log.warning("Launch API unavailable at T-0 - going with the cached status")
+        seconds_to_launch = seconds_until(self.launch_time)
+        if is_holding(self.launch_data) or seconds_to_launch is None or seconds_to_launch > 0:
+            log.info("Launch not confirmed at T-0: status %s, T-0 %s",
+                     get_launch_status(self.launch_data), self.launch_time)
+            return
+        self.trigger_launch()
+    
     def trigger_launch(self):
         """Trigger the launch animation at T-0."""
         if self.launch_animator and not self.launch_animator.is_launching:
-            print("T-0! Launching rocket!")
+            log.info("T-0! Launching rocket!")
+            tracing.recorder.instant('launch.t0', launch=self.launch_data.get('id') if self.launch_data else None)
             # Start checking status after launch animation
             self.launch_animator.start_launch(on_complete=self.check_post_launch_status)
     
     def check_post_launch_status(self):
         """Check status after launch animation completes."""
-        print("Launch animation complete, checking status...")
+        log.info("Launch animation complete, checking status...")
+        tracing.recorder.instant('launch.animation_complete')
         # Wait a few seconds then check if we should load next launch
-        self.root.after(5000, self.check_launch_status)
+        self.schedule_status_check(5000)
     
     def test_launch(self):
         if self.launch_animator:
-            print("Test launch initiated!")
-            # Debug: check if rocket elements exist
-            rocket_items = self.canvas.find_withtag('rocket')
-            print(f"Found {len(rocket_items)} rocket elements")
+            log.info("Test launch initiated!")
+            log.debug("Found %d rocket elements", len(self.canvas.find_withtag('rocket')))
             self.launch_animator.start_launch(on_complete=self.reset_same_rocket)
         else:
-            print("No rocket to launch!")
+            log.warning("No rocket to launch!")
     
-    def reset_same_rocket(self):
-        """Reset the same rocket after a test launch."""
-        print("Resetting same rocket...")
-        
+    def rebuild_rocket(self):
+        """Redraw the rocket for the current vehicle with a fresh animator."""
         self.canvas.delete('launch_flame')
         self.canvas.delete('rocket')
         
         self.draw_rocket_with_tag()
         
-        self.launch_animator = LaunchAnimation(
-            self.canvas,
-            rocket_tag='rocket',
-            initial_x=620,
-            initial_y=340,
-            vehicle_name=self.vehicle_name
-        )
+        self.create_launch_animator()
         
-        from landscape import draw_spotlights
-        self.canvas.delete('spotlight')
-        draw_spotlights(self.canvas, self.vehicle_name)
-        
-        print("Rocket reset complete!")
+        self.show_spotlights()
     
-    def load_next_launch(self):
-        """Load the next launch after T-0 launch completes."""
-        print("Loading next launch...")
-        
-        self.canvas.delete('launch_flame')
-        self.canvas.delete('rocket')
+    def reset_same_rocket(self):
+        """Reset the same rocket after a test launch."""
+        log.debug("Resetting same rocket...")
+        self.rebuild_rocket()
+        log.info("Rocket reset complete!")
+    
+    def load_next_launch(self, launches=None):
+        """Load the next launch after T-0 launch completes.
         
-        # Fetch multiple launches to ensure we get a different one
-        launches = fetch_launches(5)
+        Args:
+            launches: Freshly fetched launch list (the launch queue is used when None)
+        """
+        log.debug("Loading next launch...")
         
-        if not launches:
-            print("No more launches available")
-            return
+        self.canvas.delete('launch_flame')
         
-        # Find a launch that's different from the current one AND not in flight
         current_launch_id = self.launch_data.get('id') if self.launch_data else None
-        next_launch = None
         
-        for launch in launches:
-            # launch_description can be a string or dict
-            launch_desc = launch.get('launch_description', '')
-            if isinstance(launch_desc, dict):
-                status = launch_desc.get('description', '')
-            else:
-                status = launch_desc
-            
-            if launch.get('id') != current_launch_id and status != 'In Flight':
-                next_launch = launch
-                break
-        
-        # If we couldn't find a different launch, just use the first non-in-flight one
-        if not next_launch:
-            for launch in launches:
-                # launch_description can be a string or dict
-                launch_desc = launch.get('launch_description', '')
-                if isinstance(launch_desc, dict):
-                    status = launch_desc.get('description', '')
-                else:
-                    status = launch_desc
-                
-                if status != 'In Flight':
-                    next_launch = launch
-                    break
+        # Take the next launch from the queue; only fetch when it has run dry
+        if launches is None:
+            queued = any(launch.get('id') != current_launch_id for launch in self.launches)
+            perf.count_cache('launch_queue', queued)
+            if not queued:
+                self.background.run(lambda: fetch_launches(5),
+                                    lambda launches: self.on_next_launches_fetched(launches, current_launch_id),
+                                    name='fetch_next_launch')
+                return
+            launches = self.launches
+        
+        next_launch = pick_next_launch(launches, current_launch_id)
+        if next_launch is None:
+            log.warning("No more launches available - checking again in 1 minute")
+            # Park the countdown: a T-0 in the past would re-arm the status check every second
+            self.launch_time = None
+            if self.status_check_job is not None:
+                self.root.after_cancel(self.status_check_job)
+                self.status_check_job = None
+            self.schedule_next_launch_retry(current_launch_id)
+            return
         
-        # Last resort - use first launch even if in flight
-        if not next_launch:
-            next_launch = launches[0]
+        self.canvas.delete('rocket')
+        if self.next_launch_job is not None:
+            self.root.after_cancel(self.next_launch_job)
+            self.next_launch_job = None
         
+        tracing.recorder.instant('launch.next', old=current_launch_id, new=next_launch.get('id'))
         self.launch_data = next_launch
-        self.launch_time = self.launch_data.get('t0') or self.launch_data.get('win_open')
+        self.launch_time = get_launch_time(self.launch_data)
         self.vehicle_name = self.launch_data.get('vehicle', {}).get('name', 'Unknown')
         
         # Check if new launch is in flight
-        # launch_description can be a string or dict
-        launch_desc = self.launch_data.get('launch_description', '')
-        if isinstance(launch_desc, dict):
-            status = launch_desc.get('description', '')
-        else:
-            status = launch_desc
+        status = get_launch_status(self.launch_data)
         
         if status != 'In Flight':
-            self.draw_rocket_with_tag()
+            self.show_next_rocket()
             
-            self.launch_animator = LaunchAnimation(
-                self.canvas,
-                rocket_tag='rocket',
-                initial_x=620,
-                initial_y=340,
-                vehicle_name=self.vehicle_name
-            )
+            self.create_launch_animator()
         else:
-            print("Next launch is also in flight - not displaying rocket")
+            log.info("Next launch is also in flight - not displaying rocket")
             self.launch_animator = None
         
-        self.canvas.delete('info_sign')
-        draw_info_sign(self.canvas, self.launch_data, self.vehicle_name)
+        self.redraw_info_sign()
+        
+        self.show_spotlights()
         
-        from landscape import draw_spotlights
-        self.canvas.delete('spotlight')
-        draw_spotlights(self.canvas, self.vehicle_name)
+        # Stage the rocket after this one
+        self.queue_launches(launches)
+        
+        # Keep the periodic refresh running for the new launch
+        self.schedule_refresh(300000)
+        
+        log.info("Next launch loaded!")
+    
+    def on_next_launches_fetched(self, launches, launch_id):
+        """Fetch for a launch queue that ran dry finished (Tk thread)."""
+        if (self.launch_data.get('id') if self.launch_data else None) != launch_id:
+            # A refresh loaded another launch while the fetch was out
+            return
+        if launches is None:
+            log.warning("Launch API unavailable - fetching the next launch again in 1 minute")
+            self.schedule_next_launch_retry(launch_id)
+            return
+        self.load_next_launch(launches)
+    
+    def on_next_launch_retry(self, launch_id):
+        """Try the next launch again, unless another one was loaded meanwhile."""
+        self.next_launch_job = None
+        if (self.launch_data.get('id') if self.launch_data else None) == launch_id:
+            self.load_next_launch()
+    
+    def queue_launches(self, launches):
+        """Replace the launch queue and re-stage the next rocket when idle."""
+        self.launches = launches
+        self.work.submit(self.stage_next_rocket, BULK, name='stage_rocket')
+        self.request_snapshot()
+    
+    def stage_next_rocket(self):
+        """Draw the rocket of the launch after the current one, hidden on the pad."""
+        current_launch_id = self.launch_data.get('id') if self.launch_data else None
+        next_launch = pick_next_launch(self.launches, current_launch_id)
+        vehicle_name = next_launch.get('vehicle', {}).get('name', 'Unknown') if next_launch else None
+        if vehicle_name == self.staged_vehicle:
+            return
         
-        print("Next launch loaded!")
+        self.canvas.delete('rocket_staged')
+        self.staged_vehicle = vehicle_name
+        if vehicle_name is None:
+            return
+        self.draw_rocket_with_tag('rocket_staged', vehicle_name, hidden=True)
+        # Keep the staged rocket where a freshly drawn one would stack (under the spotlights)
+        if self.canvas.find_withtag('spotlight'):
+            self.canvas.tag_lower('rocket_staged', 'spotlight')
+        log.debug("Staged rocket for %s (%s)", next_launch.get('name'), vehicle_name)
+    
+    def show_next_rocket(self):
+        """Put the current vehicle's rocket on the pad, reusing the staged one if it matches."""
+        staged = self.staged_vehicle == self.vehicle_name and self.canvas.find_withtag('rocket_staged')
+        perf.count_cache('rocket_prefetch', bool(staged))
+        if staged:
+            self.canvas.addtag_withtag('rocket', 'rocket_staged')
+            self.canvas.dtag('rocket_staged', 'rocket_staged')
+            self.canvas.itemconfig('rocket', state='normal')
+            self.staged_vehicle = None
+        else:
+            self.draw_rocket_with_tag()
+
+
+@contextlib.contextmanager
+def tagged_items(canvas, tag, hidden=False):
+    """Add `tag` (and optionally state='hidden') to every item created on
+    `canvas` inside the block."""
+    originals = {}
+    
+    def tagged(create):
+        def create_tagged(*args, **kwargs):
+            tags = kwargs.get('tags')
+            if tags is None:
+                kwargs['tags'] = tag
+            elif isinstance(tags, str):
+                kwargs['tags'] = (tags, tag)
+            else:
+                kwargs['tags'] = tuple(tags) + (tag,)
+            if hidden:
+                kwargs['state'] = 'hidden'
+            return create(*args, **kwargs)
+        return create_tagged
+    
+    # Temporarily replace canvas methods
+    for name in ('create_rectangle', 'create_polygon', 'create_oval', 'create_text',
+                 'create_line', 'create_arc'):
+        originals[name] = getattr(canvas, name)
+        setattr(canvas, name, tagged(originals[name]))
+    try:
+        yield
+    finally:
+        # Restore original methods
+        for name, create in originals.items():
+            setattr(canvas, name, create)
+
+
+# Statuses of a launch whose countdown is stopped
+HOLD_STATUSES = ('Hold', 'TBD', 'To Be Determined')
 
 
-def main():
+def is_holding(launch):
+    """True if the launch is in a hold or its T-0 is to be determined."""
+    return get_launch_status(launch) in HOLD_STATUSES or launch.get('status', {}).get('id') == 2
+
+
+def pick_next_launch(launches, current_launch_id):
+    """The launch to show after `current_launch_id`: a different launch, one
+    that is not in flight if possible. None when there is no other launch."""
+    others = [launch for launch in launches if launch.get('id') != current_launch_id]
+    for launch in others:
+        if get_launch_status(launch) != 'In Flight':
+            return launch
+    return others[0] if others else None
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Pixel launch pad countdown display")
+    parser.add_argument('--clock-speed', type=float, default=None,
+                        help="Run on a simulated clock at this speed factor (e.g. 60 = 1 hour per minute)")
+    parser.add_argument('--clock-start', default=None,
+                        help="ISO start time for the simulated clock (default: now)")
+    parser.add_argument('--perf', action='store_true',
+                        help="Show the performance HUD at startup (toggle with F3)")
+    parser.add_argument('--trace', action='store_true',
+                        help="Record trace events from startup (F4 dumps trace-*.json)")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="Serve Prometheus metrics on this local port")
+    parser.add_argument('--stall-threshold', type=float, default=2.0,
+                        help="Seconds without a main loop heartbeat before the watchdog logs a stall (0 disables)")
+    parser.add_argument('--watchdog-log', default='watchdog.log',
+                        help="Rotating log file for stall reports")
+    parser.add_argument('--profile-seconds', type=float, default=20,
+                        help="Length of the profile taken on SIGUSR1 (SIGUSR2 writes a canvas census)")
+    parser.add_argument('--log-level', default='INFO',
+                        help="Console/log file level (DEBUG shows per-launch and per-redraw detail)")
+    parser.add_argument('--log-file', default='launch-timer.jsonl',
+                        help="Rotating JSONL log file (empty to disable)")
+    parser.add_argument('--quality', default='auto', choices=('auto',) + quality.LEVEL_NAMES,
+                        help="Visual detail level (auto adapts to the measured frame time)")
+    parser.add_argument('--snapshot', default='launch-timer-snapshot.json',
+                        help="Warm-start snapshot restored at startup (empty to disable)")
+    parser.add_argument('--machine-profile', default='launch-timer-profile.json',
+                        help="Machine profile with the calibrated quality presets "
+                             "(calibrated on first run; empty to disable)")
+    parser.add_argument('--recalibrate', action='store_true',
+                        help="Re-run the calibration even if a machine profile exists")
+    parser.add_argument('--seed', type=int,
+                        help="Run seed for the animation's random streams (default: random, logged)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main function to run the rocket launch display."""
+    perf.startup.mark('imports')
+    args = parse_args(argv)
+    logs.setup_logging(args.log_level, log_path=args.log_file or None)
+    if args.quality != 'auto':
+        quality.governor.fix(args.quality)
+    if args.clock_speed is not None or args.clock_start:
+        start = None
+        if args.clock_start:
+            from datetime import datetime
+            start = datetime.fromisoformat(args.clock_start.replace('Z', '+00:00'))
+        speed = args.clock_speed if args.clock_speed is not None else 1.0
+        clock.set_clock(clock.SimulatedClock(start=start, speed=speed))
+        log.info("Using simulated clock (speed x%s)", speed)
+    profile = None
+    if args.machine_profile:
+        import calibration
+        profile = calibration.load_or_calibrate(args.machine_profile, recalibrate=args.recalibrate)
+    # Seeded after the calibration, which draws from the same streams
+    rng.seed(args.seed if args.seed is not None else rng.run_seed())
+    log.info("Run seed %d", rng.run_seed())
+    
     root = tk.Tk()
-    app = LaunchPadDisplay(root)
+    app = LaunchPadDisplay(root, show_perf=args.perf, record_trace=args.trace,
+                           threaded_fetch=True, snapshot_path=args.snapshot or None)
+    if profile:
+        calibration.apply_profile(profile, app)
+    if args.stall_threshold > 0:
+        from watchdog import Watchdog
+        app.watchdog = Watchdog(app, threshold=args.stall_threshold, log_path=args.watchdog_log)
+        app.watchdog.start()
+    from profiler import SignalProfiler
+    SignalProfiler(app, duration=args.profile_seconds).install()
+    if args.metrics_port is not None:
+        from metrics_server import MetricsServer
+        MetricsServer(app, port=args.metrics_port).start()
     root.mainloop()
 
 
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Local Prometheus metrics endpoint.
+
+Serves /metrics in the Prometheus text exposition format from a daemon
+thread, so scraping never blocks the Tk event loop. Canvas state can only
+be read on the Tk thread, so the display publishes a fresh gauge dict
+every few seconds and the server reads whatever was published last. The
+API request statistics are copied under their lock (fetch_stats); the
+other counters are plain dicts and numbers written by the Tk thread that
+the server only reads, so no locks are taken on the hot path.
+
+Usage:
+    python main.py --metrics-port 9108
+    curl http://127.0.0.1:9108/metrics
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import api_client
+import clock
+import logs
+import perf
+import power
+import quality
+
+log = logs.get_logger('metrics')
+
+
+# Frame interval histogram bucket bounds in milliseconds
+FRAME_BUCKETS_MS = (16, 33, 50, 66, 100, 150, 250, 500, 1000)
+
+
+def _line(name, value, labels=None):
+    if labels:
+        label_text = ','.join(f'{key}="{val}"' for key, val in labels.items())
+        return f"{name}{{{label_text}}} {value}"
+    return f"{name} {value}"
+
+
+class MetricsServer:
+    """Prometheus text endpoint for one LaunchPadDisplay."""
+
+    def __init__(self, app, port=9108, host='127.0.0.1', publish_ms=5000):
+        self.app = app
+        self.port = port
+        self.host = host
+        self.publish_ms = publish_ms
+        self.gauges = {}  # replaced wholesale by publish(), read by the server thread
+        self.httpd = None
+        self.thread = None
+
+    def start(self):
+        """Start tracking frames, publishing gauges and serving requests."""
+        if perf.registry.frame_histogram is None:
+            perf.registry.frame_histogram = perf.Histogram(FRAME_BUCKETS_MS)
+        self.publish()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = server.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # Keep scrapes out of the console
+
+        self.httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='metrics', daemon=True)
+        self.thread.start()
+        log.info("Metrics available at http://%s:%d/metrics", self.host, self.httpd.server_port)
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def publish(self):
+        """Snapshot canvas and particle gauges (runs on the Tk thread)."""
+        app = self.app
+        animator = app.launch_animator
+        self.gauges = {
+            'canvas_items': len(app.canvas.find_all()),
+            'pending_jobs': perf.pending_jobs(app.root),
+            'particles': {
+                'flame': len(animator.flame_particles) if animator else 0,
+                'vent': len(animator.vent_particles) if animator else 0,
+                'rain': len(app.weather.rain_drops),
+                'aircraft_trail': len(app.aircraft.trail_ids),
+            },
+            'launch_phase': app.get_launch_phase(),
+        }
+        app.root.after(self.publish_ms, self.publish)
+
+    def render(self):
+        """Build the exposition text (runs on the server thread)."""
+        gauges = self.gauges
+        lines = []
+
+        def metric(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        histogram = perf.registry.frame_histogram
+        if histogram is not None:
+            metric('launch_timer_frame_interval_seconds', 'histogram',
+                   'Time between frame ticks of the Tk event loop.')
+            for bound, count in histogram.cumulative():
+                le = '+Inf' if bound == float('inf') else f"{bound / 1000:g}"
+                lines.append(_line('launch_timer_frame_interval_seconds_bucket', count, {'le': le}))
+            lines.append(_line('launch_timer_frame_interval_seconds_sum', f"{histogram.sum / 1000:.6f}"))
+            lines.append(_line('launch_timer_frame_interval_seconds_count', histogram.count))
+
+        metric('launch_timer_canvas_items', 'gauge', 'Items on the display canvas.')
+        lines.append(_line('launch_timer_canvas_items', gauges.get('canvas_items', 0)))
+        metric('launch_timer_pending_jobs', 'gauge', 'Pending Tk after callbacks.')
+        lines.append(_line('launch_timer_pending_jobs', gauges.get('pending_jobs', 0)))
+        metric('launch_timer_particles', 'gauge', 'Live particles per particle system.')
+        for system, count in gauges.get('particles', {}).items():
+            lines.append(_line('launch_timer_particles', count, {'system': system}))
+
+        fetch_counts, fetch_errors, fetch_seconds, last_success = api_client.fetch_stats()
+        metric('launch_timer_fetch_requests_total', 'counter', 'API requests per endpoint.')
+        for endpoint, count in fetch_counts.items():
+            lines.append(_line('launch_timer_fetch_requests_total', count, {'endpoint': endpoint}))
+        metric('launch_timer_fetch_errors_total', 'counter', 'Failed API requests per endpoint.')
+        for endpoint in fetch_counts:
+            lines.append(_line('launch_timer_fetch_errors_total',
+                               fetch_errors.get(endpoint, 0), {'endpoint': endpoint}))
+        metric('launch_timer_fetch_seconds_total', 'counter', 'Total API request latency per endpoint.')
+        for endpoint, seconds in fetch_seconds.items():
+            lines.append(_line('launch_timer_fetch_seconds_total', f"{seconds:.6f}", {'endpoint': endpoint}))
+        metric('launch_timer_seconds_since_success', 'gauge',
+               'Seconds since the last successful request per endpoint.')
+        now = clock.time()
+        for endpoint, when in last_success.items():
+            lines.append(_line('launch_timer_seconds_since_success', f"{now - when:.1f}", {'endpoint': endpoint}))
+
+        metric('launch_timer_cache_lookups_total', 'counter', 'Cache lookups by cache and result.')
+        ratios = []
+        for name in sorted(set(perf.cache_hits) | set(perf.cache_misses)):
+            hits = perf.cache_hits.get(name, 0)
+            misses = perf.cache_misses.get(name, 0)
+            lines.append(_line('launch_timer_cache_lookups_total', hits, {'cache': name, 'result': 'hit'}))
+            lines.append(_line('launch_timer_cache_lookups_total', misses, {'cache': name, 'result': 'miss'}))
+            ratios.append((name, hits / (hits + misses) if hits + misses else 0))
+        metric('launch_timer_cache_hit_ratio', 'gauge', 'Cache hit ratio by cache.')
+        for name, ratio in ratios:
+            lines.append(_line('launch_timer_cache_hit_ratio', f"{ratio:.4f}", {'cache': name}))
+
+        watchdog = getattr(self.app, 'watchdog', None)
+        if watchdog is not None:
+            metric('launch_timer_stalls_total', 'counter', 'Main loop stalls detected by the watchdog, by cause.')
+            for cause, count in dict(watchdog.stalls).items():
+                lines.append(_line('launch_timer_stalls_total', count, {'cause': cause}))
+
+        metric('launch_timer_quality_level', 'gauge', 'Visual quality level (0 = full detail).')
+        lines.append(_line('launch_timer_quality_level', quality.governor.level))
+        metric('launch_timer_quality_changes_total', 'counter', 'Quality level changes by direction.')
+        for direction, count in dict(quality.governor.changes).items():
+            lines.append(_line('launch_timer_quality_changes_total', count, {'direction': direction}))
+
+        power_mode = getattr(self.app, 'power', None)
+        if power_mode is not None:
+            metric('launch_timer_power_mode', 'gauge', 'Animation loop rate mode (1 for the active mode).')
+            for mode in power.MODES:
+                lines.append(_line('launch_timer_power_mode', int(mode == power_mode.mode), {'mode': mode}))
+
+        metric('launch_timer_launch_phase', 'gauge', 'Current launch phase (1 for the active phase).')
+        current = gauges.get('launch_phase')
+        for phase in self.app.LAUNCH_PHASES:
+            lines.append(_line('launch_timer_launch_phase', int(phase == current), {'phase': phase}))
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Per-loop performance instrumentation and on-screen HUD.
+
+The registry times every animation loop and data call of the display
+and the gaps between frames. Timing wrappers are only installed while the
+registry is enabled or has sinks (e.g. the trace recorder); otherwise the
+original methods are restored, so instrumentation costs nothing.
+"""
+
+import bisect
+import time
+import weakref
+from collections import deque
+
+
+# Cache hit/miss counters by cache name, for the HUD and metrics endpoint
+cache_hits = {}
+cache_misses = {}
+
+
+def count_cache(name, hit):
+    """Count one lookup in a named cache."""
+    counters = cache_hits if hit else cache_misses
+    counters[name] = counters.get(name, 0) + 1
+
+
+def pending_jobs(root):
+    """Number of pending `after` callbacks on a Tk or headless root."""
+    if hasattr(root, 'pending'):
+        return root.pending()
+    return len(root.tk.splitlist(root.tk.call('after', 'info')))
+
+
+def tag_census(canvas, limit=None):
+    """Count canvas items grouped by their first tag."""
+    counts = {}
+    for item_id in canvas.find_all():
+        tags = canvas.gettags(item_id)
+        tag = tags[0] if tags else '(untagged)'
+        counts[tag] = counts.get(tag, 0) + 1
+    ranked = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
+    return dict(ranked[:limit] if limit else ranked)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a sequence (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket bounds (single writer)."""
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """[(upper bound, cumulative count)], ending with +Inf."""
+        running = 0
+        result = []
+        for bound, count in zip(self.bounds + [float('inf')], list(self.counts)):
+            running += count
+            result.append((bound, running))
+        return result
+
+
+class PerfRegistry:
+    """Collects per-subsystem tick times and frame intervals."""
+
+    def __init__(self, window=300):
+        self.enabled = False
+        self.window = window
+        self.samples = {}      # subsystem -> deque of recent ms per call
+        self.calls = {}        # subsystem -> total calls
+        self.total_ms = {}     # subsystem -> total ms
+        self.frame_times = deque(maxlen=window)  # ms between frames
+        self._last_frame = None
+        self._targets = []     # (weakref to object, {method: subsystem})
+        self.sinks = []        # callables(subsystem, started, ms) fed every timed call
+        self.frame_histogram = None  # Histogram of frame intervals in ms, when tracked
+
+    # --- instrumentation ---
+    def instrument(self, obj, methods):
+        """Register methods of obj to time, as {method_name: subsystem}."""
+        self._targets = [(ref, names) for ref, names in self._targets if ref() is not None]
+        self._targets.append((weakref.ref(obj), dict(methods)))
+        if self.active:
+            self._install(obj, methods)
+
+    @property
+    def active(self):
+        """True while timing wrappers are installed."""
+        return self.enabled or bool(self.sinks)
+
+    def _install(self, obj, methods):
+        for method_name, subsystem in methods.items():
+            if method_name in vars(obj):
+                continue  # Already wrapped
+            setattr(obj, method_name, self._wrap(subsystem, getattr(obj, method_name)))
+
+    def _uninstall(self, obj, methods):
+        for method_name in methods:
+            if method_name in vars(obj):
+                delattr(obj, method_name)
+
+    def _wrap(self, subsystem, func):
+        record = self.record
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            started = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(subsystem, (clock() - started) * 1000, started)
+
+        timed.__wrapped__ = func
+        return timed
+
+    def _refresh(self, was_active):
+        if self.active == was_active:
+            return
+        for ref, methods in self._targets:
+            obj = ref()
+            if obj is None:
+                continue
+            if self.active:
+                self._install(obj, methods)
+            else:
+                self._uninstall(obj, methods)
+
+    def enable(self):
+        """Start collecting stats: wrap every registered method."""
+        was_active = self.active
+        self.enabled = True
+        self._last_frame = None
+        self._refresh(was_active)
+
+    def disable(self):
+        """Stop collecting stats (wrappers stay while sinks remain)."""
+        was_active = self.active
+        self.enabled = False
+        self._refresh(was_active)
+
+    def add_sink(self, sink):
+        """Feed every timed call to sink(subsystem, started, ms)."""
+        was_active = self.active
+        if sink not in self.sinks:
+            self.sinks.append(sink)
+        self._refresh(was_active)
+
+    def remove_sink(self, sink):
+        was_active = self.active
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+        self._refresh(was_active)
+
+    # --- recording ---
+    def record(self, subsystem, ms, started=None):
+        """Record one timed call of a subsystem (started: perf_counter at entry)."""
+        for sink in self.sinks:
+            sink(subsystem, started, ms)
+        if not self.enabled:
+            return
+        samples = self.samples.get(subsystem)
+        if samples is None:
+            samples = self.samples[subsystem] = deque(maxlen=self.window)
+            self.calls[subsystem] = 0
+            self.total_ms[subsystem] = 0.0
+        samples.append(ms)
+        self.calls[subsystem] += 1
+        self.total_ms[subsystem] += ms
+
+    def frame(self):
+        """Mark the start of a frame (called once per frame tick)."""
+        histogram = self.frame_histogram
+        if not self.enabled and histogram is None:
+            return
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            ms = (now - self._last_frame) * 1000
+            if self.enabled:
+                self.frame_times.append(ms)
+            if histogram is not None:
+                histogram.observe(ms)
+        self._last_frame = now
+
+    # --- reporting ---
+    def fps(self):
+        if not self.frame_times:
+            return 0.0
+        return 1000 / (sum(self.frame_times) / len(self.frame_times))
+
+    def frame_percentiles(self, pcts=(50, 95, 99)):
+        frames = list(self.frame_times)
+        return {pct: percentile(frames, pct) for pct in pcts}
+
+    def subsystem_ms(self):
+        """Mean ms per call over the recent window, slowest first."""
+        means = {name: sum(samples) / len(samples)
+                 for name, samples in self.samples.items() if samples}
+        return dict(sorted(means.items(), key=lambda kv: kv[1], reverse=True))
+
+    def reset(self):
+        self.samples.clear()
+        self.calls.clear()
+        self.total_ms.clear()
+        self.frame_times.clear()
+        self._last_frame = None
+
+
+# Shared registry used by the display
+registry = PerfRegistry()
+
+
+class StartupTimer:
+    """Wall-clock milestones of the startup sequence, in ms since `started`."""
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.phases = {}  # phase -> ms, in the order reached
+
+    def mark(self, phase):
+        """Record the first time a phase is reached; returns its ms."""
+        if phase not in self.phases:
+            self.phases[phase] = (time.perf_counter() - self.started) * 1000
+        return self.phases[phase]
+
+    def reached(self, *phases):
+        return all(phase in self.phases for phase in phases)
+
+    def summary(self):
+        return ', '.join(f"{phase} {ms:.0f}ms" for phase, ms in self.phases.items())
+
+
+# Started when perf is first imported, i.e. right after tkinter
+startup = StartupTimer()
+
+
+class PerfHUD:
+    """Toggleable overlay showing FPS, frame times and per-subsystem cost.
+
+    The overlay items are created once (hidden) and only their text and
+    state change afterwards.
+    """
+
+    def __init__(self, canvas, root, registry=registry, x=8, y=48, interval_ms=500, max_rows=8):
+        self.canvas = canvas
+        self.root = root
+        self.registry = registry
+        self.interval_ms = interval_ms
+        self.max_rows = max_rows
+        self.x = x
+        self.y = y
+        self.visible = False
+        self.extra_lines = []  # callables returning extra status lines
+        self._job = None
+
+        self.background_id = canvas.create_rectangle(
+            x, y, x + 230, y + 40,
+            fill='#000000', outline='#00ff88', width=1, stipple='gray75',
+            state='hidden', tags='perf_hud'
+        )
+        self.text_id = canvas.create_text(
+            x + 6, y + 4, text='', anchor='nw',
+            font=('Courier', 8), fill='#00ff88',
+            state='hidden', tags='perf_hud'
+        )
+
+    def toggle(self, event=None):
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+
+    def show(self):
+        self.visible = True
+        self.registry.enable()
+        self.canvas.itemconfig('perf_hud', state='normal')
+        self.update()
+
+    def hide(self):
+        self.visible = False
+        self.registry.disable()
+        self.canvas.itemconfig('perf_hud', state='hidden')
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def lines(self):
+        reg = self.registry
+        pcts = reg.frame_percentiles()
+        lines = [
+            f"FPS {reg.fps():5.1f}  frame p50 {pcts[50]:5.1f} p95 {pcts[95]:5.1f} p99 {pcts[99]:5.1f}",
+            f"items {len(self.canvas.find_all()):<6} timers {pending_jobs(self.root)}",
+        ]
+        for extra in self.extra_lines:
+            lines.append(extra())
+        for name, ms in list(reg.subsystem_ms().items())[:self.max_rows]:
+            lines.append(f"{name:<16} {ms:7.2f} ms")
+        return lines
+
+    def update(self):
+        if not self.visible:
+            return
+        lines = self.lines()
+        self.canvas.itemconfig(self.text_id, text='\n'.join(lines))
+        self.canvas.coords(self.background_id, self.x, self.y,
+                           self.x + 300, self.y + 8 + 11 * len(lines))
+        self.canvas.tag_raise('perf_hud')
+        self._job = self.root.after(self.interval_ms, self.update)
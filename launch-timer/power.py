@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Power-aware frame rate for the decorative animation loops.
+
+Clouds, birds, cars, smoke, tower lights and the frame tick run at full
+rate only when something worth watching is happening: the final hour
+before T-0, the launch itself and T-38 flybys. The rest of the day they
+run at a third of the rate, and at a twentieth while the window is
+unmapped (minimized or on another desktop) or nothing is moving on
+screen. The loops stretch their `after` delays by `scale` and multiply
+their motion steps by it, so things move at the same speed on screen,
+just in fewer, larger steps.
+
+The countdown, data refresh and launch animation loops are not scaled.
+"""
+
+import logs
+import quality
+import tracing
+
+log = logs.get_logger('power')
+
+
+# Loop interval multiplier per mode
+MODES = {'full': 1, 'idle': 3, 'dormant': 20}
+
+# Launch phases that always run at full rate
+FULL_RATE_PHASES = {'final_hour', 'launching', 'in_flight', 'awaiting_status'}
+
+# Nominal frame tick interval at full rate (ms)
+TICK_MS = 30
+
+
+class PowerMode:
+    """Chooses the loop rate of a LaunchPadDisplay."""
+
+    def __init__(self, app, check_ms=1000):
+        self.app = app
+        self.check_ms = check_ms
+        self.mode = 'full'
+        self.tick_ms = TICK_MS   # full-rate tick (slower on machines that can't keep up)
+        self.scale = 1
+        self.changes = 0
+
+    def start(self):
+        """Re-check on map/unmap events and once a second."""
+        self.app.root.bind('<Map>', self.on_visibility, add='+')
+        self.app.root.bind('<Unmap>', self.on_visibility, add='+')
+        self.check()
+
+    def on_visibility(self, event=None):
+        self.update()
+
+    def check(self):
+        self.update()
+        self.app.root.after(self.check_ms, self.check)
+
+    def desired_mode(self):
+        app = self.app
+        if not app.root.winfo_ismapped():
+            return 'dormant'
+        if app.aircraft.active or app.get_launch_phase() in FULL_RATE_PHASES:
+            return 'full'
+        if not self.anything_moving():
+            return 'dormant'
+        return 'idle'
+
+    def anything_moving(self):
+        """True if a bird, car or rain drop is on screen."""
+        app = self.app
+        return (any(0 < x < 800 for x in app.birds.x)
+                or any(0 < x < 800 for x in app.cars.x)
+                or bool(app.weather.rain_drops))
+
+    def set_tick_ms(self, tick_ms):
+        """Run the full rate at a different tick (from the machine profile)."""
+        self.tick_ms = tick_ms
+        self.apply()
+
+    def update(self):
+        """Switch mode if the display's state calls for it."""
+        mode = self.desired_mode()
+        if mode == self.mode:
+            return
+        log.info("Frame rate %s -> %s (x%d intervals)", self.mode, mode, MODES[mode],
+                 extra={'power_mode': mode})
+        tracing.recorder.instant('power.mode', 'power', mode=mode)
+        self.mode = mode
+        self.changes += 1
+        self.apply()
+
+    def apply(self):
+        self.scale = MODES[self.mode] * self.tick_ms / TICK_MS
+        # The quality governor judges frame times against the new nominal tick
+        quality.governor.set_frame_ms(self.tick_ms * MODES[self.mode])
+
+    def summary(self):
+        """One line for the perf HUD."""
+        return f"power {self.mode} (x{self.scale:g})"
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+On-demand profiling of a running display via POSIX signals.
+
+    kill -USR1 <pid>   profile the live process for a fixed time, then write
+                       profile-<time>.pstats and profile-<time>.collapsed
+    kill -USR2 <pid>   write a canvas item census to census-<time>.txt
+
+While a profile runs, a sampler thread records the main thread's stack
+every few milliseconds (collapsed-stack format, ready for flamegraph.pl
+or speedscope) and cProfile records the main thread's calls. Nothing is
+installed between profiles apart from the two signal handlers.
+"""
+
+import cProfile
+import os
+import signal
+import sys
+import threading
+import time
+
+import logs
+from perf import pending_jobs, tag_census
+
+log = logs.get_logger('profiler')
+
+
+class SamplingProfiler:
+    """Samples the main thread's stack from a background thread."""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.main_thread_id = threading.main_thread().ident
+        self.stacks = {}  # "file:func;file:func" (root first) -> samples
+        self.samples = 0
+        self._stop = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name='sampler', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self.thread:
+            self.thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.main_thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            key = ';'.join(reversed(names))
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.samples += 1
+
+    def write_collapsed(self, path):
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.stacks.items(), key=lambda kv: kv[1], reverse=True):
+                f.write(f"{stack} {count}\n")
+
+
+class SignalProfiler:
+    """Signal handlers that profile or census a LaunchPadDisplay."""
+
+    def __init__(self, app, duration=20.0, out_dir='.'):
+        self.app = app
+        self.duration = duration
+        self.out_dir = out_dir
+        self.sampler = None
+        self.cprofile = None
+
+    def install(self):
+        """Install SIGUSR1/SIGUSR2 handlers (no-op where they don't exist)."""
+        if not hasattr(signal, 'SIGUSR1'):
+            log.info("Signal profiling not available on this platform")
+            return False
+        signal.signal(signal.SIGUSR1, self.on_profile_signal)
+        signal.signal(signal.SIGUSR2, self.on_census_signal)
+        log.info("Signal profiling ready: kill -USR1 %d (profile), kill -USR2 %d (canvas census)",
+                 os.getpid(), os.getpid())
+        return True
+
+    def _path(self, prefix, ext):
+        return os.path.join(self.out_dir, time.strftime(f'{prefix}-%Y%m%d-%H%M%S.{ext}'))
+
+    # Python runs signal handlers on the main thread between bytecodes, so
+    # they can safely schedule work on the Tk root.
+    def on_profile_signal(self, signum, frame):
+        self.app.root.after_idle(self.start_profile)
+
+    def on_census_signal(self, signum, frame):
+        self.app.root.after_idle(self.write_census)
+
+    def start_profile(self):
+        if self.sampler is not None:
+            log.warning("Profile already running")
+            return
+        log.info("Profiling for %.0fs...", self.duration)
+        self.sampler = SamplingProfiler()
+        self.sampler.start()
+        self.cprofile = cProfile.Profile()
+        self.cprofile.enable()
+        self.app.root.after(int(self.duration * 1000), self.finish_profile)
+
+    def finish_profile(self):
+        self.cprofile.disable()
+        self.sampler.stop()
+        pstats_path = self._path('profile', 'pstats')
+        collapsed_path = self._path('profile', 'collapsed')
+        self.cprofile.dump_stats(pstats_path)
+        self.sampler.write_collapsed(collapsed_path)
+        log.info("Profile written: %s, %s (%d samples)", pstats_path, collapsed_path, self.sampler.samples)
+        self.sampler = None
+        self.cprofile = None
+
+    def write_census(self):
+        """Write canvas item counts grouped by tag and by item type."""
+        canvas = self.app.canvas
+        by_type = {}
+        for item_id in canvas.find_all():
+            kind = canvas.type(item_id)
+            by_type[kind] = by_type.get(kind, 0) + 1
+        census = tag_census(canvas)
+        path = self._path('census', 'txt')
+        with open(path, 'w') as f:
+            f.write(f"canvas items: {sum(census.values())}\n")
+            f.write(f"pending jobs: {pending_jobs(self.app.root)}\n")
+            f.write(f"launch phase: {self.app.get_launch_phase()}\n\n")
+            f.write("by first tag:\n")
+            for tag, count in census.items():
+                f.write(f"  {tag:<24} {count}\n")
+            f.write("\nby item type:\n")
+            for kind, count in sorted(by_type.items(), key=lambda kv: kv[1], reverse=True):
+                f.write(f"  {kind:<24} {count}\n")
+        log.info("Canvas census written: %s", path)
+        return path
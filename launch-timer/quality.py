@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Adaptive visual quality.
+
+The drawing code reads its detail levers from the shared `settings`
+dict (flame particles per frame, rain spawn rate and cap, smoke puffs,
+contrail length, bird and car counts). The governor watches the frame
+interval of the display's tick loop and steps the levers down a level
+when frames run long, and back up once there is headroom again:
+
+    quality.governor.frame()              # once per frame tick
+    n = int(quality.settings['flame_particles'] * intensity)
+
+Stepping down needs two slow windows in a row; stepping up needs five
+fast ones and a clearly lower frame time, so the level does not flap
+around the threshold.
+"""
+
+import time
+
+import logs
+import tracing
+from perf import percentile
+
+log = logs.get_logger('quality')
+
+
+# Detail levels, best first
+LEVELS = (
+    {'name': 'high', 'flame_particles': 20, 'rain_spawn': 1.0, 'rain_cap': 150,
+     'smoke_puffs': 12, 'trail_segments': 30, 'birds': 3, 'cars': 6},
+    {'name': 'medium', 'flame_particles': 14, 'rain_spawn': 0.7, 'rain_cap': 100,
+     'smoke_puffs': 9, 'trail_segments': 20, 'birds': 2, 'cars': 5},
+    {'name': 'low', 'flame_particles': 9, 'rain_spawn': 0.4, 'rain_cap': 60,
+     'smoke_puffs': 6, 'trail_segments': 12, 'birds': 1, 'cars': 4},
+    {'name': 'minimal', 'flame_particles': 5, 'rain_spawn': 0.25, 'rain_cap': 30,
+     'smoke_puffs': 4, 'trail_segments': 6, 'birds': 0, 'cars': 3},
+)
+LEVEL_NAMES = tuple(level['name'] for level in LEVELS)
+
+# Current levers (updated in place, so readers may keep a reference)
+settings = dict(LEVELS[0])
+
+
+class QualityGovernor:
+    """Steps the quality level from measured frame intervals."""
+
+    def __init__(self, frame_ms=30, window=60, degrade_ratio=1.5, recover_ratio=1.15,
+                 degrade_windows=2, recover_windows=5):
+        self.frame_ms = frame_ms              # nominal tick interval
+        self.window = window                  # frames per evaluation
+        self.degrade_ratio = degrade_ratio    # p90 above frame_ms * this is slow
+        self.recover_ratio = recover_ratio    # p90 below frame_ms * this is headroom
+        self.degrade_windows = degrade_windows
+        self.recover_windows = recover_windows
+        self.adaptive = True
+        self.level = 0
+        self.changes = {'down': 0, 'up': 0}
+        self.last_p90 = 0.0
+        self._intervals = []
+        self._last_frame = None
+        self._slow = 0
+        self._fast = 0
+
+    def fix(self, name):
+        """Pin a level by name and stop adapting."""
+        self.adaptive = False
+        self.set_level(LEVEL_NAMES.index(name), 'fixed')
+
+    def set_frame_ms(self, frame_ms):
+        """Change the nominal tick interval and start a fresh window."""
+        self.frame_ms = frame_ms
+        self._intervals = []
+        self._last_frame = None
+        self._slow = self._fast = 0
+
+    def frame(self):
+        """Mark a frame tick (called once per tick)."""
+        now = time.perf_counter()
+        if self._last_frame is not None and self.adaptive:
+            self._intervals.append((now - self._last_frame) * 1000)
+            if len(self._intervals) >= self.window:
+                self.evaluate(percentile(self._intervals, 90))
+                self._intervals = []
+        self._last_frame = now
+
+    def evaluate(self, p90):
+        """Count slow/fast windows and step the level when one side wins."""
+        self.last_p90 = p90
+        if p90 > self.frame_ms * self.degrade_ratio:
+            self._slow += 1
+            self._fast = 0
+            if self._slow >= self.degrade_windows and self.level < len(LEVELS) - 1:
+                self.set_level(self.level + 1, f"p90 frame {p90:.0f}ms")
+        elif p90 < self.frame_ms * self.recover_ratio:
+            self._fast += 1
+            self._slow = 0
+            if self._fast >= self.recover_windows and self.level > 0:
+                self.set_level(self.level - 1, f"p90 frame {p90:.0f}ms")
+        else:
+            self._slow = self._fast = 0
+
+    def set_level(self, level, reason=''):
+        if level != self.level:
+            direction = 'down' if level > self.level else 'up'
+            self.changes[direction] += 1
+            log.info("Quality %s -> %s (%s)", LEVEL_NAMES[self.level], LEVEL_NAMES[level], reason,
+                     extra={'quality_level': level})
+            tracing.recorder.instant('quality.change', 'quality', level=LEVEL_NAMES[level], reason=reason)
+        self.level = level
+        self._slow = self._fast = 0
+        settings.update(LEVELS[level])
+
+    def summary(self):
+        """One line for the perf HUD."""
+        mode = 'auto' if self.adaptive else 'fixed'
+        return f"quality {settings['name']} ({mode}, p90 {self.last_p90:.0f}ms)"
+
+
+# Shared governor used by the display
+governor = QualityGovernor()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Seeded random number streams, one per subsystem.
+
+Each animated subsystem draws from its own `random.Random` stream
+derived from a single run seed, so one subsystem drawing more or fewer
+numbers (or a draw function reseeding for a fixed layout) never shifts
+another one's sequence:
+
+    _rng = rng.stream('birds')           # module level, kept for the run
+    speed = _rng.uniform(0.8, 1.8)
+
+`seed(n)` reseeds every stream in place, so the headless tools can make
+a run repeat exactly. Without it the run seed is random and logged at
+startup so a run can be reproduced with --seed.
+"""
+
+import hashlib
+import random
+
+
+_run_seed = random.SystemRandom().randrange(2 ** 32)
+_streams = {}
+
+
+def _stream_seed(name):
+    # Not hash(): string hashes are salted per process
+    digest = hashlib.sha256(f"{_run_seed}:{name}".encode()).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def stream(name):
+    """The named stream (created on first use)."""
+    rng = _streams.get(name)
+    if rng is None:
+        rng = _streams[name] = random.Random(_stream_seed(name))
+    return rng
+
+
+def seed(run_seed):
+    """Set the run seed and restart every stream from it."""
+    global _run_seed
+    _run_seed = run_seed
+    for name, rng in _streams.items():
+        rng.seed(_stream_seed(name))
+
+
+def run_seed():
+    return _run_seed
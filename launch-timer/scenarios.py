@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Launch-day scenario simulator.
+
+Generates synthetic launch schedules (holds, scrubs, slips, in-flight
+status, back-to-back launches, API outages, a list that runs dry) and
+feeds them through the API data layer into a headless LaunchPadDisplay
+running on a simulated clock. Each run
+reports how many fetches, info sign redraws and rocket rebuilds the
+launch lifecycle cost.
+
+Usage:
+    python scenarios.py                 # run every scenario
+    python scenarios.py hold scrub      # run selected scenarios
+    python scenarios.py --json out.json # also save the report
+"""
+
+import argparse
+import json
+import time as wall_time
+from datetime import datetime, timezone
+
+import requests
+
+import api_client
+import clock
+import logs
+import rng
+from headless import HeadlessRoot, HeadlessCanvas
+
+
+WEATHER_PAYLOAD = {
+    'current_condition': [{
+        'temp_F': '78', 'temp_C': '26',
+        'weatherDesc': [{'value': 'Sunny'}],
+        'weatherCode': '113',
+        'humidity': '65',
+        'windspeedMiles': '8', 'winddir16Point': 'ESE',
+        'precipMM': '0.0', 'cloudcover': '10',
+    }]
+}
+
+
+def iso(epoch):
+    """Format epoch seconds the way the launch API does."""
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime('%Y-%m-%dT%H:%MZ')
+
+
+class SyntheticLaunch:
+    """A launch record whose fields change at scheduled simulated times."""
+
+    def __init__(self, launch_id, name, vehicle, t0,
+                 provider='SpaceX', location='Cape Canaveral SFS, FL, USA'):
+        self.base = {
+            'id': launch_id,
+            'name': name,
+            'vehicle': vehicle,
+            'provider': provider,
+            'location': location,
+            't0': t0,
+            'launch_description': 'Go',
+            'status_id': 1,
+            'result': None,
+            'removed': False,
+        }
+        self.events = []  # (at, changes)
+
+    def at(self, when, **changes):
+        """Apply field changes once the simulated time reaches `when`."""
+        self.events.append((when, changes))
+        self.events.sort(key=lambda event: event[0])
+        return self
+
+    def state(self, now):
+        """Field values as of simulated time `now`."""
+        fields = dict(self.base)
+        for when, changes in self.events:
+            if when > now:
+                break
+            fields.update(changes)
+        return fields
+
+    def to_api(self, now):
+        """API record as of `now`, or None once the launch has been removed."""
+        fields = self.state(now)
+        if fields['removed']:
+            return None
+        status_names = {1: 'Go', 2: 'TBD', 3: 'Launch Successful', 4: 'Launch Failure'}
+        return {
+            'id': fields['id'],
+            'name': fields['name'],
+            'sort_date': str(int(fields['t0'])),
+            't0': iso(fields['t0']),
+            'win_open': iso(fields['t0']),
+            'vehicle': {'name': fields['vehicle']},
+            'provider': {'name': fields['provider']},
+            'pad': {'location': {'name': fields['location']}},
+            'status': {'id': fields['status_id'], 'name': status_names.get(fields['status_id'], 'Unknown')},
+            'result': fields['result'],
+            'launch_description': fields['launch_description'],
+        }
+
+
+class Scenario:
+    """A named launch schedule replayed against the display."""
+
+    def __init__(self, name, start, duration, launches, description='', outages=None):
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.launches = launches
+        self.description = description
+        self.outages = outages or []  # (start, end) epoch ranges where the API is down
+
+    def api_result(self, now, limit=5):
+        """Upcoming launches the API would return at `now`."""
+        records = [launch.to_api(now) for launch in self.launches]
+        records = [record for record in records if record]
+        records.sort(key=lambda record: record['t0'])
+        return records[:limit]
+
+    def transport(self, url, timeout=10, headers=None):
+        """api_client transport serving this scenario's payloads."""
+        now = clock.time()
+        if any(start <= now < end for start, end in self.outages):
+            raise requests.exceptions.ConnectionError(f"simulated outage for {url}")
+        if 'wttr.in' in url:
+            return WEATHER_PAYLOAD
+        limit = int(url.rstrip('/').rsplit('/', 1)[-1])
+        return {'result': self.api_result(now, limit)}
+
+
+def completed(launch, t0, flight_time=480, result=1, linger=1800):
+    """Add the usual in-flight -> result -> drop-off sequence to a launch."""
+    launch.at(t0, launch_description='In Flight')
+    launch.at(t0 + flight_time, launch_description='Success' if result == 1 else 'Failure',
+              result=result, status_id=3 if result == 1 else 4)
+    launch.at(t0 + flight_time + linger, removed=True)
+    return launch
+
+
+def build_scenarios(start=None):
+    """Build the standard set of launch-day scenarios."""
+    if start is None:
+        start = datetime(2026, 3, 14, 20, 0, tzinfo=timezone.utc).timestamp()
+    minute = 60
+    hour = 3600
+    scenarios = {}
+
+    # Nominal countdown, liftoff and handover to the next launch
+    t0 = start + 15 * minute
+    scenarios['nominal'] = Scenario('nominal', start, 45 * minute, [
+        completed(SyntheticLaunch('n1', 'Starlink Group 10-1', 'Falcon 9', t0), t0),
+        SyntheticLaunch('n2', 'GPS III SV09', 'Falcon 9', start + 6 * hour),
+    ], "Countdown to liftoff, success posted 8 minutes later")
+
+    # Hold at T-5 minutes, recycle to a new T-0
+    t0 = start + 15 * minute
+    new_t0 = start + 40 * minute
+    hold = SyntheticLaunch('h1', 'Atlas V | USSF-51', 'Atlas V 551', t0, provider='ULA')
+    hold.at(t0 - 5 * minute, launch_description='Hold')
+    hold.at(t0 - 1 * minute, t0=new_t0, launch_description='Go')
+    completed(hold, new_t0)
+    scenarios['hold'] = Scenario('hold', start, 70 * minute, [
+        hold,
+        SyntheticLaunch('h2', 'Transporter-14', 'Falcon 9', start + 8 * hour),
+    ], "Hold at T-5m, recycled to a new T-0 25 minutes later")
+
+    # Hold called at T-1 minute and still in force well past the old T-0
+    t0 = start + 15 * minute
+    new_t0 = start + 45 * minute
+    held = SyntheticLaunch('x1', 'Vulcan | USSF-106', 'Vulcan', t0, provider='ULA')
+    held.at(t0 - 1 * minute, launch_description='Hold')
+    held.at(t0 + 20 * minute, t0=new_t0, launch_description='Go')
+    completed(held, new_t0)
+    scenarios['hold_past_t0'] = Scenario('hold_past_t0', start, 70 * minute, [
+        held,
+        SyntheticLaunch('x2', 'Starlink Group 8-4', 'Falcon 9', start + 8 * hour),
+    ], "Hold at T-1m lasting 20 minutes past T-0, then a new T-0")
+
+    # Scrub: T-0 moves a day out while counting down
+    t0 = start + 15 * minute
+    scrub = SyntheticLaunch('s1', 'Electron | Owl Night Long', 'Electron', t0,
+                            provider='Rocket Lab', location='Mahia Peninsula, New Zealand')
+    scrub.at(t0 - 2 * minute, t0=t0 + 24 * hour, launch_description='To Be Determined', status_id=2)
+    scenarios['scrub'] = Scenario('scrub', start, 40 * minute, [
+        scrub,
+        SyntheticLaunch('s2', 'CRS-33', 'Falcon 9', start + 30 * hour),
+    ], "Scrubbed at T-2m, new T-0 24 hours later")
+
+    # Repeated small slips during the last hour
+    t0 = start + 30 * minute
+    slip = SyntheticLaunch('p1', 'Starlink Group 6-80', 'Falcon 9', t0)
+    for i in range(1, 4):
+        slip.at(start + i * 8 * minute, t0=t0 + i * 10 * minute)
+    final_t0 = t0 + 30 * minute
+    completed(slip, final_t0)
+    scenarios['slip'] = Scenario('slip', start, 80 * minute, [
+        slip,
+        SyntheticLaunch('p2', 'NROL-69', 'Falcon 9', start + 12 * hour),
+    ], "T-0 slips by 10 minutes three times")
+
+    # Start up while a launch is already in flight
+    t0 = start - 2 * minute
+    scenarios['in_flight'] = Scenario('in_flight', start, 30 * minute, [
+        completed(SyntheticLaunch('f1', 'Starship Flight 12', 'Starship', t0,
+                                  location='Starbase, TX, USA'), t0, flight_time=600),
+        SyntheticLaunch('f2', 'Crew-12', 'Falcon 9', start + 20 * hour),
+    ], "Display starts with a launch already in flight")
+
+    # API goes down right after liftoff, while the result is pending
+    t0 = start + 15 * minute
+    scenarios['post_launch_outage'] = Scenario('post_launch_outage', start, 45 * minute, [
+        completed(SyntheticLaunch('o1', 'Starlink Group 10-7', 'Falcon 9', t0), t0, flight_time=300),
+        SyntheticLaunch('o2', 'Cygnus NG-24', 'Falcon 9', start + 6 * hour, provider='Northrop Grumman'),
+    ], "API unreachable from T+5m to T+25m", outages=[(t0 + 5 * minute, t0 + 25 * minute)])
+
+    # Back-to-back launches minutes apart
+    t0s = [start + 10 * minute, start + 16 * minute, start + 24 * minute]
+    scenarios['back_to_back'] = Scenario('back_to_back', start, 50 * minute, [
+        completed(SyntheticLaunch('b1', 'Starlink Group 12-3', 'Falcon 9', t0s[0]), t0s[0], flight_time=240),
+        completed(SyntheticLaunch('b2', 'Kuiper KA-03', 'Atlas V 551', t0s[1], provider='ULA'), t0s[1], flight_time=240),
+        completed(SyntheticLaunch('b3', 'Owl For One', 'Electron', t0s[2], provider='Rocket Lab'), t0s[2], flight_time=240),
+        SyntheticLaunch('b4', 'Artemis III', 'SLS Block 1', start + 48 * hour, provider='NASA'),
+    ], "Three launches 6-8 minutes apart")
+
+    # The last launch in the list flies and nothing is scheduled after it
+    t0 = start + 15 * minute
+    scenarios['list_runs_dry'] = Scenario('list_runs_dry', start, 75 * minute, [
+        completed(SyntheticLaunch('d1', 'Starlink Group 11-2', 'Falcon 9', t0), t0),
+    ], "Only one launch listed; the list is empty after it completes")
+
+    return scenarios
+
+
+def make_counting_display(display_class):
+    """Subclass a display class so it counts lifecycle work."""
+
+    class CountingDisplay(display_class):
+        def __init__(self, *args, **kwargs):
+            self.counts = {'sign_redraws': 0, 'rocket_rebuilds': 0, 'launches_triggered': 0}
+            super().__init__(*args, **kwargs)
+
+        def redraw_info_sign(self):
+            self.counts['sign_redraws'] += 1
+            super().redraw_info_sign()
+
+        def draw_rocket_with_tag(self, *args, **kwargs):
+            self.counts['rocket_rebuilds'] += 1
+            return super().draw_rocket_with_tag(*args, **kwargs)
+
+        def trigger_launch(self):
+            if self.launch_animator and not self.launch_animator.is_launching:
+                self.counts['launches_triggered'] += 1
+            super().trigger_launch()
+
+    return CountingDisplay
+
+
+def run_scenario(scenario, seed=0):
+    """Replay a scenario and return its lifecycle cost report."""
+    from main import LaunchPadDisplay
+
+    rng.seed(seed)
+    sim_clock = clock.SimulatedClock(start=scenario.start, speed=0)
+    previous_clock = clock.set_clock(sim_clock)
+    previous_transport = api_client.set_transport(scenario.transport)
+    fetches_before = dict(api_client.fetch_counts)
+    started = wall_time.perf_counter()
+
+    try:
+        root = HeadlessRoot(sim_clock)
+        canvas = HeadlessCanvas(root)
+        display_class = make_counting_display(LaunchPadDisplay)
+        app = display_class(root, canvas=canvas, animate=False, work_budget_chunks=4)
+        root.run_for(scenario.duration)
+    finally:
+        api_client.set_transport(previous_transport)
+        clock.set_clock(previous_clock)
+
+    fetches = {
+        endpoint: count - fetches_before.get(endpoint, 0)
+        for endpoint, count in api_client.fetch_counts.items()
+    }
+    report = {
+        'scenario': scenario.name,
+        'description': scenario.description,
+        'simulated_minutes': round(scenario.duration / 60, 1),
+        'launch_fetches': fetches.get('launches', 0),
+        'weather_fetches': fetches.get('weather', 0),
+        'final_launch': app.launch_data.get('id') if app.launch_data else None,
+        'callbacks_run': root.callbacks_run,
+        'canvas_creates': canvas.ops['create'],
+        'canvas_items_at_end': canvas.item_count(),
+        'wall_seconds': round(wall_time.perf_counter() - started, 3),
+    }
+    report.update(app.counts)
+    return report
+
+
+def print_report(reports):
+    """Print scenario reports as a table."""
+    columns = ['scenario', 'launch_fetches', 'sign_redraws', 'rocket_rebuilds',
+               'launches_triggered', 'final_launch', 'canvas_creates', 'wall_seconds']
+    widths = [max(len(col), *(len(str(r[col])) for r in reports)) for col in columns]
+    print('  '.join(col.ljust(w) for col, w in zip(columns, widths)))
+    print('  '.join('-' * w for w in widths))
+    for report in reports:
+        print('  '.join(str(report[col]).ljust(w) for col, w in zip(columns, widths)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay synthetic launch-day scenarios")
+    parser.add_argument('names', nargs='*', help="Scenarios to run (default: all)")
+    parser.add_argument('--json', help="Write the report to this JSON file")
+    parser.add_argument('--verbose', action='store_true', help="Log the display's activity (DEBUG) to the console")
+    parser.add_argument('--seed', type=int, default=0, help="Run seed for the random streams (default 0)")
+    args = parser.parse_args(argv)
+    logs.setup_logging('DEBUG' if args.verbose else 'WARNING', log_path=None, console=args.verbose)
+
+    scenarios = build_scenarios()
+    names = args.names or list(scenarios)
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (choose from {', '.join(scenarios)})")
+
+    reports = [run_scenario(scenarios[name], seed=args.seed) for name in names]
+    print_report(reports)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(reports, f, indent=2)
+        print(f"\nReport saved to {args.json}")
+    return reports
+
+
+if __name__ == "__main__":
+    main()
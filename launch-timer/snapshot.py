@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Warm-start snapshot of the display state.
+
+The display writes a compact JSON snapshot whenever its launch queue or
+weather changes (and checks once a minute): the shown launch, the queue
+of upcoming launches, the countdown anchor, the last weather and the
+scene key. On boot the snapshot is restored before anything is fetched,
+so a kiosk that lost power comes back showing its countdown while the
+APIs are revalidated in the background.
+
+Writes go to a temporary file that is fsynced and renamed over the old
+snapshot, so a power cut leaves either the old or the new snapshot on
+disk, never half of one.
+"""
+
+import json
+import os
+
+import clock
+import logs
+from api_client import seconds_until
+from landscape import get_sky_colors
+from launch_diff import get_launch_time
+
+log = logs.get_logger('snapshot')
+
+
+SNAPSHOT_VERSION = 1
+
+
+def scene_key(weather_condition):
+    """Key of what the background depends on: the time-of-day palette and weather."""
+    return f"{get_sky_colors()['sky']}:{weather_condition}"
+
+
+def capture(app):
+    """Snapshot dict of a LaunchPadDisplay (without the save time)."""
+    return {
+        'version': SNAPSHOT_VERSION,
+        'launch': app.launch_data,
+        'launch_time': app.launch_time,  # countdown anchor (T-0 of the shown launch)
+        'launches': app.launches,
+        'weather': {
+            'current': app.weather.current_weather,
+            'condition': app.weather.weather_condition,
+        },
+        'scene_key': scene_key(app.weather.weather_condition),
+    }
+
+
+def write_snapshot(path, snapshot):
+    """Atomically replace the snapshot at `path`; returns True on success."""
+    return write_json(path, dict(snapshot, saved_at=clock.time()))
+
+
+def write_json(path, data):
+    """Atomically replace the JSON file at `path`; returns True on success."""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        log.warning("Could not write %s: %s", path, e)
+        return False
+    return True
+
+
+def _is_stale(launch, max_past_seconds):
+    seconds = seconds_until(get_launch_time(launch))
+    return seconds is not None and seconds <= -max_past_seconds
+
+
+def read_snapshot(path, max_past_seconds=3600):
+    """Load a snapshot, dropping launches whose T-0 is long past (None if unusable)."""
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        log.warning("Ignoring unreadable snapshot %s: %s", path, e)
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+        log.info("Ignoring snapshot %s from another version", path)
+        return None
+
+    snapshot['launches'] = [launch for launch in snapshot.get('launches') or []
+                            if not _is_stale(launch, max_past_seconds)]
+    launch = snapshot.get('launch')
+    if launch and _is_stale(launch, max_past_seconds):
+        snapshot['launch'] = None
+        snapshot['launch_time'] = None
+    if not snapshot.get('launch') and snapshot['launches']:
+        snapshot['launch'] = snapshot['launches'][0]
+        snapshot['launch_time'] = get_launch_time(snapshot['launch'])
+    return snapshot
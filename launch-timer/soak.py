@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Long-running soak harness with leak detection.
+
+Runs the full display (every animation loop enabled) on an accelerated
+clock through many day cycles, weather changes and launches, sampling:
+  - canvas item count (and the tags holding the most items)
+  - pending `after` jobs
+  - sizes of per-object particle / id lists
+  - tracemalloc current size and top allocators
+  - process RSS
+Any series that grows monotonically across the run is flagged.
+
+Headless mode (default) replays each simulated hour as a dense window of
+real-rate frames followed by a jump to the next hour, so a week of kiosk
+time runs in minutes. --tk runs the real Tk app (e.g. under xvfb-run) on
+a SimulatedClock at --speed instead.
+
+Usage:
+    python soak.py --days 3
+    xvfb-run python soak.py --tk --speed 600 --minutes 30
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+
+import api_client
+import clock
+import logs
+import rng
+from headless import HeadlessRoot, HeadlessCanvas
+from perf import pending_jobs, tag_census
+from scenarios import Scenario, SyntheticLaunch, WEATHER_PAYLOAD, completed
+
+
+# wttr.in weather codes cycled through during a soak (clear, cloudy,
+# light rain, thunderstorm, fog, heavy rain)
+WEATHER_CYCLE = ['113', '116', '296', '200', '248', '302']
+
+
+class SoakScenario(Scenario):
+    """Launch schedule plus weather that changes every few hours."""
+
+    def __init__(self, start, days, launch_every_hours=6, weather_every_hours=3):
+        hour = 3600
+        launches = []
+        t = start + 30
+        index = 0
+        while t < start + days * 24 * hour:
+            index += 1
+            launch = SyntheticLaunch(f"soak{index}", f"Soak Mission {index}",
+                                     ['Falcon 9', 'Atlas V', 'Electron', 'Starship'][index % 4], t)
+            launches.append(completed(launch, t, flight_time=20, linger=600))
+            t += launch_every_hours * hour
+        super().__init__('soak', start, days * 24 * hour, launches, "Soak schedule")
+        self.weather_every = weather_every_hours * hour
+
+    def transport(self, url, timeout=10, headers=None):
+        if 'wttr.in' in url:
+            slot = int((clock.time() - self.start) // self.weather_every)
+            payload = json.loads(json.dumps(WEATHER_PAYLOAD))
+            payload['current_condition'][0]['weatherCode'] = WEATHER_CYCLE[slot % len(WEATHER_CYCLE)]
+            return payload
+        return super().transport(url, timeout, headers)
+
+
+def rss_kb():
+    """Current resident set size in KB (peak RSS where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def collection_sizes(app):
+    """Sizes of the lists that animation objects grow and shrink."""
+    sizes = {
+        'rain_drops': len(app.weather.rain_drops),
+        'aircraft_ids': len(app.aircraft.aircraft_ids),
+        'trail_ids': len(app.aircraft.trail_ids),
+        'birds': len(app.birds),
+        'cars': len(app.traffic),   # on the road (pooled cars are reused, not counted)
+        'parked': app.traffic.parked(),
+    }
+    animator = app.launch_animator
+    if animator:
+        sizes['flame_ids'] = len(animator.flame_ids)
+        sizes['flame_particles'] = len(animator.flame_particles)
+        sizes['vent_particles'] = len(animator.vent_particles)
+    return sizes
+
+
+def take_sample(app, label):
+    snapshot = tracemalloc.take_snapshot()
+    top = snapshot.statistics('lineno')[:5]
+    current, _ = tracemalloc.get_traced_memory()
+    sample = {
+        'label': label,
+        'sim_time': clock.now().isoformat(timespec='minutes'),
+        'canvas_items': len(app.canvas.find_all()),
+        'pending_jobs': pending_jobs(app.root),
+        'traced_kb': current // 1024,
+        'rss_kb': rss_kb(),
+        'top_tags': tag_census(app.canvas, limit=6),
+        'top_allocators': [f"{stat.traceback[0].filename.rsplit(os.sep, 1)[-1]}:"
+                           f"{stat.traceback[0].lineno} {stat.size // 1024}KB" for stat in top],
+    }
+    sample.update(collection_sizes(app))
+    return sample
+
+
+def find_growth(samples, warmup=2, min_growth=5, min_ratio=0.1):
+    """Return metrics that grow monotonically across the samples."""
+    if len(samples) - warmup < 3:
+        return {}
+    window = samples[warmup:]
+    flagged = {}
+    for key, first in window[0].items():
+        if not isinstance(first, (int, float)) or key == 'rss_kb':
+            continue
+        series = [sample.get(key, 0) for sample in window]
+        if all(b >= a for a, b in zip(series, series[1:])):
+            growth = series[-1] - series[0]
+            if growth >= min_growth and growth >= abs(series[0]) * min_ratio:
+                flagged[key] = series
+    # RSS wobbles with the allocator; only flag large steady growth
+    rss = [sample['rss_kb'] for sample in window]
+    if rss[-1] - rss[0] > 20 * 1024 and sum(b >= a for a, b in zip(rss, rss[1:])) >= 0.8 * (len(rss) - 1):
+        flagged['rss_kb'] = rss
+    return flagged
+
+
+def soak_headless(days, dense_seconds, sample_hours, verbose=False, seed=0):
+    """Soak the display headless on a simulated clock."""
+    from main import LaunchPadDisplay
+
+    rng.seed(seed)
+
+    start = datetime(2026, 3, 14, 0, 0, tzinfo=timezone.utc).timestamp()
+    scenario = SoakScenario(start, days)
+    sim_clock = clock.SimulatedClock(start=start, speed=0)
+    previous_clock = clock.set_clock(sim_clock)
+    previous_transport = api_client.set_transport(scenario.transport)
+    samples = []
+    tracemalloc.start()
+    try:
+        output = io.StringIO()
+        with (contextlib.nullcontext() if verbose else contextlib.redirect_stdout(output)):
+            root = HeadlessRoot(sim_clock)
+            canvas = HeadlessCanvas(root)
+            app = LaunchPadDisplay(root, canvas=canvas, work_budget_chunks=4)
+            step = sample_hours * 3600
+            elapsed = 0
+            while elapsed < scenario.duration:
+                # Dense window at full frame rate, then jump to the next step
+                root.run_for(dense_seconds)
+                root.jump(start + elapsed + step - clock.time())
+                elapsed += step
+                samples.append(take_sample(app, f"+{elapsed / 3600:.0f}h"))
+                if not verbose:
+                    output.seek(0)
+                    output.truncate()
+                print(f"{samples[-1]['label']:>6}  items={samples[-1]['canvas_items']:<6} "
+                      f"jobs={samples[-1]['pending_jobs']:<4} traced={samples[-1]['traced_kb']}KB",
+                      file=sys.stderr)
+    finally:
+        tracemalloc.stop()
+        api_client.set_transport(previous_transport)
+        clock.set_clock(previous_clock)
+    return samples
+
+
+def soak_tk(minutes, speed, sample_seconds):
+    """Soak the real Tk display (needs a display, e.g. xvfb-run)."""
+    import tkinter as tk
+    from main import LaunchPadDisplay
+
+    clock.set_clock(clock.SimulatedClock(speed=speed))
+    tracemalloc.start()
+    root = tk.Tk()
+    app = LaunchPadDisplay(root)
+    samples = []
+    end_samples = int(minutes * 60 / sample_seconds)
+
+    def sample():
+        samples.append(take_sample(app, f"{len(samples) * sample_seconds}s"))
+        if len(samples) >= end_samples:
+            root.destroy()
+        else:
+            root.after(sample_seconds * 1000, sample)
+
+    root.after(sample_seconds * 1000, sample)
+    root.mainloop()
+    tracemalloc.stop()
+    return samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soak the display and look for leaks")
+    parser.add_argument('--days', type=float, default=2, help="Simulated days to soak (headless)")
+    parser.add_argument('--dense-seconds', type=float, default=20,
+                        help="Seconds of full-rate frames simulated per sample step (headless)")
+    parser.add_argument('--sample-hours', type=float, default=1, help="Simulated hours between samples")
+    parser.add_argument('--tk', action='store_true', help="Soak the real Tk app instead of headless")
+    parser.add_argument('--speed', type=float, default=600, help="Clock speed factor for --tk")
+    parser.add_argument('--minutes', type=float, default=30, help="Real minutes to run with --tk")
+    parser.add_argument('--json', help="Write all samples to this JSON file")
+    parser.add_argument('--seed', type=int, default=0, help="Run seed for the random streams (headless)")
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args(argv)
+    logs.setup_logging('DEBUG' if args.verbose else 'WARNING', log_path=None, console=args.verbose)
+
+    if args.tk:
+        samples = soak_tk(args.minutes, args.speed, sample_seconds=30)
+    else:
+        samples = soak_headless(args.days, args.dense_seconds, args.sample_hours, args.verbose, args.seed)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(samples, f, indent=2)
+
+    last = samples[-1] if samples else {}
+    print(f"\n{len(samples)} samples, final: {last.get('canvas_items')} canvas items, "
+          f"{last.get('pending_jobs')} pending jobs, {last.get('traced_kb')}KB traced")
+    print(f"Top tags: {last.get('top_tags')}")
+    print(f"Top allocators: {last.get('top_allocators')}")
+
+    flagged = find_growth(samples)
+    if flagged:
+        print("\nMonotonic growth detected:")
+        for key, series in flagged.items():
+            print(f"  {key}: {series[0]} -> {series[-1]} ({' '.join(str(v) for v in series[-8:])})")
+        return 1
+    print("\nNo monotonic growth detected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
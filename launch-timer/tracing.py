@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Chrome trace-event recorder.
+
+Records scheduler ticks, animation callbacks, network requests, heavy
+redraws and launch lifecycle events into a ring buffer. Dump it at any
+time to a JSON file that opens in chrome://tracing or ui.perfetto.dev.
+
+Timed display methods come from the perf registry (the recorder is added
+as a sink while recording), so nothing is wrapped when tracing is off.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import logs
+import perf
+
+log = logs.get_logger('trace')
+
+
+class TraceRecorder:
+    """Ring buffer of Chrome trace events."""
+
+    def __init__(self, capacity=200000):
+        self.enabled = False
+        self.events = deque(maxlen=capacity)
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self._last_tick = None
+        self._thread_names = {}
+
+    def _ts(self, perf_time):
+        """Microseconds since the recorder was created."""
+        return (perf_time - self.origin) * 1e6
+
+    def _tid(self):
+        thread = threading.current_thread()
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = thread.name
+        return tid
+
+    # --- recording control ---
+    def start(self):
+        """Start recording (wraps the perf-registered methods)."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._last_tick = None
+        perf.registry.add_sink(self._on_timed)
+        self.instant('trace.start', 'trace')
+
+    def stop(self):
+        """Stop recording and unwrap methods; the buffer is kept."""
+        if not self.enabled:
+            return
+        self.instant('trace.stop', 'trace')
+        self.enabled = False
+        perf.registry.remove_sink(self._on_timed)
+
+    def clear(self):
+        self.events.clear()
+
+    # --- events ---
+    def _on_timed(self, subsystem, started, ms):
+        category = subsystem.split('.', 1)[0] if '.' in subsystem else 'frame'
+        self.complete(subsystem, category, started, ms)
+
+    def complete(self, name, category, started, ms, **args):
+        """A finished span ('X' event) that began at perf_counter `started`."""
+        if not self.enabled:
+            return
+        event = {'name': name, 'cat': category, 'ph': 'X', 'ts': self._ts(started),
+                 'dur': ms * 1000, 'pid': self.pid, 'tid': self._tid()}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def instant(self, name, category='lifecycle', **args):
+        """A point-in-time event ('i'), e.g. a launch lifecycle transition."""
+        if not self.enabled:
+            return
+        event = {'name': name, 'cat': category, 'ph': 'i', 's': 'p',
+                 'ts': self._ts(time.perf_counter()), 'pid': self.pid, 'tid': self._tid()}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def counter(self, name, **values):
+        """A counter sample ('C'), drawn as a graph track."""
+        if not self.enabled:
+            return
+        self.events.append({'name': name, 'ph': 'C', 'ts': self._ts(time.perf_counter()),
+                            'pid': self.pid, 'args': values})
+
+    def tick(self):
+        """Mark a scheduler tick, with the interval since the previous one."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        interval = (now - self._last_tick) * 1000 if self._last_tick is not None else 0.0
+        self._last_tick = now
+        self.events.append({'name': 'tick', 'cat': 'scheduler', 'ph': 'i', 's': 't',
+                            'ts': self._ts(now), 'pid': self.pid, 'tid': self._tid(),
+                            'args': {'interval_ms': round(interval, 3)}})
+        self.counter('frame_interval_ms', interval=round(interval, 3))
+
+    @contextmanager
+    def _span(self, name, category, args):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, category, started, (time.perf_counter() - started) * 1000, **args)
+
+    def span(self, name, category='frame', **args):
+        """Context manager timing a block as a complete event."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name, category, args)
+
+    # --- export ---
+    def to_json(self):
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid,
+                     'args': {'name': 'launch-timer'}}]
+        for tid, thread_name in self._thread_names.items():
+            metadata.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                             'args': {'name': thread_name}})
+        return {'traceEvents': metadata + list(self.events), 'displayTimeUnit': 'ms'}
+
+    def dump(self, path=None):
+        """Write the buffer as trace-event JSON and return the path."""
+        if path is None:
+            path = time.strftime('trace-%Y%m%d-%H%M%S.json')
+        with open(path, 'w') as f:
+            json.dump(self.to_json(), f)
+        log.info("Trace with %d events written to %s", len(self.events), path)
+        return path
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+# Shared recorder used by the display and the API client
+recorder = TraceRecorder()
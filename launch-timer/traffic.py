@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Road traffic: the gate queue, visitor parking and departures.
+
+The road has two one-way lanes. Each Lane keeps its cars in order,
+front car first; cars never overtake, so the list stays sorted without
+re-sorting and a car's leader is simply the entry before it. Inbound
+cars (left to right) either turn into a visitor lot that wants cars or
+queue at the guard shack, where the gate lets one through every three
+seconds. Departing visitors leave the lots on the outbound lane.
+
+How full the lots are follows the launch-day crowd: a few staff cars
+on a quiet day, filling up over the twelve hours before T-0 and
+emptying in the two hours after launch. More cars arrive on the road
+while the lots fill.
+
+Nothing is created or deleted per tick. Road cars that leave the screen
+are hidden in a pool and reused for the next arrival, and every stall
+has a parked car sprite (draw_car_vertical) that is drawn once, hidden,
+and shown while the stall is taken.
+"""
+
+import clock
+import rng
+from entities import EntityStore
+from landscape import PARKING_LOTS, draw_car, draw_car_vertical, parking_entrance_x, parking_stalls
+
+_rng = rng.stream('cars')
+
+
+CAR_COLORS = ('#3a7bc8', '#d44444', '#f5f5f5', '#2a2a2a', '#ffd93d', '#4a9d5f')
+
+INBOUND_Y = 429    # Lower lane, towards the gate
+OUTBOUND_Y = 420   # Upper lane, away from the gate
+GATE_X = 490       # Guard shack
+GATE_INTERVAL = 3000
+SPACING = 15       # Stopped cars keep this far behind the car ahead (px)
+POOL_X = -200      # Where hidden cars wait
+
+QUIET_CROWD = 0.15   # Share of stalls taken on a quiet day
+CROWD_ARRIVALS = 3   # Extra inbound cars per base car at full crowd
+
+
+def crowd_level(seconds_to_launch):
+    """Launch-day crowd from QUIET_CROWD to 1 by the time to T-0 (None: no launch)."""
+    if seconds_to_launch is None:
+        return QUIET_CROWD
+    if seconds_to_launch > 0:
+        # Fill over the twelve hours before T-0, full for the final hour
+        ramp = (12 * 3600 - seconds_to_launch) / (11 * 3600)
+    else:
+        # Empty over the two hours after T-0
+        ramp = 1 + seconds_to_launch / (2 * 3600)
+    return QUIET_CROWD + (1 - QUIET_CROWD) * min(1, max(0, ramp))
+
+
+class Lane:
+    """Rows of the cars in one lane, front car first."""
+
+    def __init__(self, y, direction):
+        self.y = y
+        self.direction = direction   # 1: left to right, -1: right to left
+        self.rows = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def insert(self, cars, row):
+        """Add a car at its place in the queue (usually the back)."""
+        ahead = cars.x[row] * self.direction
+        index = len(self.rows)
+        while index and cars.x[self.rows[index - 1]] * self.direction < ahead:
+            index -= 1
+        self.rows.insert(index, row)
+
+    def clear_at(self, cars, x, clearance=20):
+        """True if no car in the lane is within clearance of x."""
+        return all(abs(cars.x[row] - x) >= clearance for row in self.rows)
+
+
+class ParkingLot:
+    """A visitor lot: one hidden car sprite per stall, shown while it is taken."""
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.stalls = parking_stalls(spec)
+        _rng.shuffle(self.stalls)  # Fill in a scattered order, not row by row
+        self.entrance_x = parking_entrance_x(spec)
+        self.sprites = []    # group tag per built stall
+        self.taken = []      # indices into sprites, in the order they were taken
+        self.last_departure = 0
+
+    def free(self):
+        return len(self.sprites) - len(self.taken)
+
+    def target(self, crowd):
+        return round(len(self.sprites) * crowd)
+
+    def build_steps(self, canvas):
+        """Draw the stall sprites hidden, a row's worth per step."""
+        for index, (x, y) in enumerate(self.stalls):
+            tag = f"parked_{self.name}_{index}"
+            for item in draw_car_vertical(canvas, x, y, _rng.choice(CAR_COLORS)):
+                canvas.addtag_withtag(tag, item)
+            canvas.itemconfig(tag, state='hidden')
+            self.sprites.append(tag)
+            if index % 16 == 15:
+                yield
+
+    def park(self, canvas):
+        taken = set(self.taken)
+        index = _rng.choice([i for i in range(len(self.sprites)) if i not in taken])
+        canvas.itemconfig(self.sprites[index], state='normal')
+        self.taken.append(index)
+
+    def leave(self, canvas):
+        index = self.taken.pop(_rng.randrange(len(self.taken)))
+        canvas.itemconfig(self.sprites[index], state='hidden')
+
+
+class Traffic:
+    """Cars on the road and in the visitor lots."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.cars = EntityStore(canvas, 'car', ('base_speed', 'color', 'state', 'wait_start'))
+        self.inbound = Lane(INBOUND_Y, 1)
+        self.outbound = Lane(OUTBOUND_Y, -1)
+        self.pool = []
+        self.lots = [ParkingLot(f"lot{number}", spec) for number, spec in enumerate(PARKING_LOTS)]
+        self.last_gate_open = 0
+        self.crowd = QUIET_CROWD
+
+    def __len__(self):
+        """Cars on the road."""
+        return len(self.inbound) + len(self.outbound)
+
+    def parked(self):
+        return sum(len(lot.taken) for lot in self.lots)
+
+    def build_lots(self):
+        """Work-queue job drawing every lot's stall sprites."""
+        for lot in self.lots:
+            yield from lot.build_steps(self.canvas)
+
+    def spawn(self, count):
+        """Line up the first inbound cars off screen to the left."""
+        for i in range(count):
+            self.add_car(self.inbound, -50 - i * 80, 'approaching')
+
+    def add_car(self, lane, x, state):
+        """Put a car on a lane at x, reusing a pooled car if there is one."""
+        speed = _rng.uniform(0.8, 1.2)
+        if self.pool:
+            row = self.pool.pop()
+            self.cars.move_to(row, x, lane.y)
+            self.canvas.itemconfig(self.cars.handle[row], state='normal')
+            self.cars.base_speed[row] = speed
+            self.cars.state[row] = state
+        else:
+            color = _rng.choice(CAR_COLORS)
+            row = self.cars.add(x, lane.y, items=draw_car(self.canvas, x, lane.y, color),
+                                base_speed=speed, color=color, state=state, wait_start=0)
+        self.cars.vx[row] = 0
+        lane.insert(self.cars, row)
+        return row
+
+    def retire(self, lane, row):
+        """Take a car off its lane and hide it in the pool."""
+        lane.rows.remove(row)
+        self.cars.vx[row] = 0
+        self.canvas.itemconfig(self.cars.handle[row], state='hidden')
+        self.cars.move_to(row, POOL_X, self.cars.y[row])
+        self.pool.append(row)
+
+    def tick(self, scale=1, seconds_to_launch=None, road_cars=6):
+        """Advance one frame (`scale` frames' worth at a slowed frame rate)."""
+        current_time = clock.time_ms()
+        cars = self.cars
+        self.crowd = crowd_level(seconds_to_launch)
+
+        # Gate opens every 3 seconds for the car waiting at it
+        if current_time - self.last_gate_open >= GATE_INTERVAL:
+            self.last_gate_open = current_time
+            for row in self.inbound.rows:
+                if cars.state[row] == 'waiting':
+                    cars.state[row] = 'entering'
+                    cars.wait_start[row] = current_time
+                    break
+
+        self.steer_inbound(current_time, scale)
+        self.steer_outbound(scale)
+        cars.advance(scale)
+        self.turn_into_lots(scale)
+
+        # Front cars that left the screen
+        while self.inbound.rows and cars.x[self.inbound.rows[0]] > 850:
+            self.retire(self.inbound, self.inbound.rows[0])
+        while self.outbound.rows and cars.x[self.outbound.rows[0]] < -60:
+            self.retire(self.outbound, self.outbound.rows[0])
+
+        # New arrivals on the left, more of them while the lots fill
+        target = round(road_cars * (1 + CROWD_ARRIVALS * (self.crowd - QUIET_CROWD) / (1 - QUIET_CROWD)))
+        back = self.inbound.rows[-1] if self.inbound.rows else None
+        if len(self.inbound) < target and (back is None or cars.x[back] > -50 + 30):
+            self.add_car(self.inbound, -50, 'approaching')
+
+        # Departures, at most one per lot per second, when the lane has room
+        for lot in self.lots:
+            if (len(lot.taken) > lot.target(self.crowd)
+                    and current_time - lot.last_departure >= 1000
+                    and self.outbound.clear_at(cars, lot.entrance_x)):
+                lot.last_departure = current_time
+                lot.leave(self.canvas)
+                self.add_car(self.outbound, lot.entrance_x, 'leaving')
+
+    def steer_inbound(self, current_time, scale):
+        cars = self.cars
+        gate_stop = GATE_X - 20
+        leader_x = None
+        for row in self.inbound.rows:
+            x = cars.x[row]
+            state = cars.state[row]
+            if state == 'approaching':
+                # Drive up to the gate, or to SPACING behind the car ahead
+                stop_x = gate_stop if leader_x is None else min(gate_stop, leader_x - SPACING)
+                if x >= gate_stop:
+                    cars.state[row] = 'waiting'
+                    cars.vx[row] = 0
+                else:
+                    # Never step past the stop point, even at a slowed frame rate
+                    cars.vx[row] = min(cars.base_speed[row], max(stop_x - x, 0) / scale)
+            elif state == 'waiting':
+                cars.vx[row] = 0
+            else:
+                # Entering through the gate for 2 seconds, then driving on
+                if state == 'entering' and current_time - cars.wait_start[row] >= 2000:
+                    cars.state[row] = 'driving'
+                cars.vx[row] = cars.base_speed[row]
+            leader_x = x
+
+    def steer_outbound(self, scale):
+        cars = self.cars
+        leader_x = None
+        for row in self.outbound.rows:
+            x = cars.x[row]
+            speed = cars.base_speed[row]
+            if leader_x is not None:
+                # Close up to SPACING behind the car ahead, no further
+                speed = min(speed, max(x - leader_x - SPACING, 0) / scale)
+            cars.vx[row] = -speed
+            leader_x = x
+
+    def turn_into_lots(self, scale):
+        """Inbound cars that just drove past a lot that wants cars park in it."""
+        cars = self.cars
+        for lot in self.lots:
+            if not lot.free() or len(lot.taken) >= lot.target(self.crowd):
+                continue
+            for row in self.inbound.rows:
+                x = cars.x[row]
+                if cars.state[row] == 'approaching' and x - cars.vx[row] * scale < lot.entrance_x <= x:
+                    self.retire(self.inbound, row)
+                    lot.park(self.canvas)
+                    break
@@ -4,6 +4,10 @@ UI elements for the launch display including countdown, info sign, and animation
 """
 
 import random
+import clock
+import logs
+
+log = logs.get_logger('ui')
 
 def draw_info_sign(canvas, launch_data, vehicle_name):
     """Draw launch info sign extending from the right edge of the screen."""
@@ -155,8 +159,7 @@ def draw_info_sign(canvas, launch_data, vehicle_name):
     canvas.create_text(sign_x-sign_width/2, y_offset+8, text=status_text.upper(),
                        font=('Courier', 9, 'bold'), fill='#00ff88', 
                        anchor='center', tags='info_sign')
-    print(status_text)
-    print(launch_desc)
+    log.debug("Info sign status: %s (%s)", status_text, launch_desc)
 
 
 def draw_countdown_display(canvas, countdown, launch_data):
@@ -207,7 +210,7 @@ def draw_countdown_display(canvas, countdown, launch_data):
                            font=('Courier', 12, 'bold'), fill='#ffd93d', tags="countdown")
 
 
-def draw_smoke_effect(canvas, smoke_frame, launch_data, pad_x=620, pad_y=340, is_launching=False):
+def draw_smoke_effect(canvas, smoke_frame, launch_data, pad_x=620, pad_y=340, is_launching=False, puffs=12):
     """Draw slow horizontal white venting from left side of rocket that expands as it drifts."""
     canvas.delete("smoke")
     
@@ -221,9 +224,10 @@ def draw_smoke_effect(canvas, smoke_frame, launch_data, pad_x=620, pad_y=340, is
         vent_x_start = pad_x - 12  # Left side of rocket
         
         # Left side venting only - slow billowing cloud
-        for i in range(12):  # More particles for continuous cloud
+        spacing = 72 / puffs if puffs else 0  # Fewer puffs spread over the same plume
+        for i in range(puffs):  # More particles for continuous cloud
             # Slow horizontal movement to the left
-            distance = (smoke_frame * 0.5 + i * 6) % 100  # Slower movement
+            distance = (smoke_frame * 0.5 + i * spacing) % 100  # Slower movement
             smoke_x = vent_x_start - distance
             
             # Slight vertical drift - less random jitter
@@ -260,36 +264,39 @@ def draw_smoke_effect(canvas, smoke_frame, launch_data, pad_x=620, pad_y=340, is
 def draw_attribution(canvas):
     """Draw the data source attribution at the bottom."""
     canvas.create_text(400, 580, text="Data: RocketLaunch.Live",
-                       font=('Courier', 7), fill='#666666')
+                       font=('Courier', 7), fill='#666666', tags='attribution')
     
 def draw_update_notification(canvas, offset_x=0):
     """Draw update notification that slides in from right.
     
     Args:
         offset_x: Horizontal offset (0 = fully visible, positive = offscreen to right)
+        
+    Returns:
+        Item ids: box, indicator dot, title text, timestamp text
     """
     # Position
-    notif_x = 800 - offset_x  # Starts offscreen (800+), slides to edge (800)
+    notif_x = 800 + offset_x  # Starts offscreen (800+), slides to edge (800)
     notif_y = 10
     notif_width = 140
     notif_height = 30
     
     # Notification box
-    canvas.create_rectangle(
+    box_id = canvas.create_rectangle(
         notif_x - notif_width, notif_y,
         notif_x, notif_y + notif_height,
         fill='#2a2a2a', outline='#4a90e2', width=2, tags='update_notification'
     )
     
     # Icon (small dot indicator)
-    canvas.create_oval(
+    dot_id = canvas.create_oval(
         notif_x - notif_width + 8, notif_y + 11,
         notif_x - notif_width + 16, notif_y + 19,
         fill='#00ff88', outline='', tags='update_notification'
     )
     
     # Text
-    canvas.create_text(
+    title_id = canvas.create_text(
         notif_x - notif_width/2 + 6, notif_y + 10,
         text="DATA UPDATED",
         font=('Courier', 8, 'bold'), fill='#ffffff',
@@ -297,11 +304,84 @@ def draw_update_notification(canvas, offset_x=0):
     )
     
     # Timestamp
-    from datetime import datetime
-    time_str = datetime.now().strftime("%H:%M:%S")
-    canvas.create_text(
+    time_str = clock.now().strftime("%H:%M:%S")
+    time_id = canvas.create_text(
         notif_x - notif_width/2 + 6, notif_y + 22,
         text=time_str,
         font=('Courier', 7), fill='#aaaaaa',
         anchor='center', tags='update_notification'
-    )
\ No newline at end of file
+    )
+    
+    return [box_id, dot_id, title_id, time_id]
+
+
+class UpdateBanner:
+    """"Data updated" banner that slides in from the right edge.
+    
+    The banner is drawn once with draw_update_notification and then only
+    moved (one move per frame along an eased path), re-labelled and
+    shown/hidden with its state.
+    """
+    
+    OFFSCREEN = 150  # Offset that puts the whole banner past the right edge
+    
+    def __init__(self, canvas, slide_ms=450, hold_ms=4000, frame_ms=30):
+        self.canvas = canvas
+        self.slide_ms = slide_ms
+        self.hold_ms = hold_ms
+        self.frame_ms = frame_ms
+        self.box_id, self.dot_id, self.title_id, self.time_id = draw_update_notification(
+            canvas, offset_x=self.OFFSCREEN)
+        canvas.itemconfig('update_notification', state='hidden')
+        self.offset = self.OFFSCREEN
+        self.phase = 'hidden'  # hidden, in, hold, out
+        self.elapsed = 0
+        self.job = None
+    
+    def show(self, title="DATA UPDATED"):
+        """Slide the banner in (or keep it up longer if already showing)."""
+        self.canvas.itemconfig(self.title_id, text=title)
+        self.canvas.itemconfig(self.time_id, text=clock.now().strftime("%H:%M:%S"))
+        if self.phase == 'hidden':
+            self.canvas.itemconfig('update_notification', state='normal')
+            self.canvas.tag_raise('update_notification')
+        if self.phase in ('hidden', 'out'):
+            # Slide in from wherever the banner currently is
+            self.phase = 'in'
+            self.elapsed = int(self.slide_ms * (1 - self.offset / self.OFFSCREEN))
+        elif self.phase == 'hold':
+            # Restart the hold time
+            self.canvas.after_cancel(self.job)
+            self.job = self.canvas.after(self.hold_ms, self.animate)
+        if self.job is None:
+            self.job = self.canvas.after(self.frame_ms, self.animate)
+    
+    def slide_to(self, offset):
+        """Move the banner to an offset with a single canvas move."""
+        dx = offset - self.offset
+        if dx:
+            self.canvas.move('update_notification', dx, 0)
+            self.offset = offset
+    
+    def animate(self):
+        self.job = None
+        self.elapsed += self.frame_ms
+        progress = min(1.0, self.elapsed / self.slide_ms)
+        if self.phase == 'in':
+            ease_out = 1 - (1 - progress) ** 3
+            self.slide_to(round(self.OFFSCREEN * (1 - ease_out)))
+            if progress >= 1:
+                # Sit still until the hold time is up
+                self.phase = 'hold'
+                self.job = self.canvas.after(self.hold_ms, self.animate)
+                return
+        elif self.phase == 'hold':
+            self.phase, self.elapsed = 'out', 0
+        elif self.phase == 'out':
+            ease_in = progress ** 3
+            self.slide_to(round(self.OFFSCREEN * ease_in))
+            if progress >= 1:
+                self.phase = 'hidden'
+                self.canvas.itemconfig('update_notification', state='hidden')
+                return
+        self.job = self.canvas.after(self.frame_ms, self.animate)
\ No newline at end of file
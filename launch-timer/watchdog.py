@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Main-thread stall watchdog.
+
+The display beats a heartbeat on every frame tick. A daemon thread checks
+the heartbeat and, when it is older than the threshold, dumps the main
+thread's stack together with the launch phase and pending work to a
+rotating log. Each stall is logged once, classified by what the main
+thread was doing (network, redraw or other), and logged again with its
+total length when the heartbeat resumes.
+
+The watchdog thread never calls into Tk: the context it reports is
+published by the main thread from beat() about once a second. Stall
+reports also include the newest records from the in-memory log buffer.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from logging.handlers import RotatingFileHandler
+
+import logs
+
+
+# Stack markers used to classify a stall (file basename or function name)
+NETWORK_FILES = {'socket.py', 'ssl.py', 'connection.py', 'connectionpool.py',
+                 'sessions.py', 'adapters.py', 'api_client.py'}
+NETWORK_FUNCTIONS = {'get_json', 'http_get_json', 'fetch_launches', 'fetch_weather', 'request_weather'}
+REDRAW_FILES = {'landscape.py', 'rockets.py', 'ui_elements.py'}
+
+
+def classify_stack(frames):
+    """Return 'network', 'redraw' or 'other' for a list of (file, function)."""
+    for filename, function in frames:
+        if filename in NETWORK_FILES or function in NETWORK_FUNCTIONS:
+            return 'network'
+    for filename, function in frames:
+        if filename in REDRAW_FILES or function.startswith(('draw_', 'redraw')):
+            return 'redraw'
+    return 'other'
+
+
+class Watchdog:
+    """Detects missed main-loop heartbeats and logs what the loop was doing."""
+
+    def __init__(self, app, threshold=2.0, interval=0.25, log_path='watchdog.log',
+                 max_bytes=512 * 1024, backup_count=3):
+        self.app = app
+        self.threshold = threshold
+        self.interval = interval
+        self.main_thread_id = threading.main_thread().ident
+        self.last_beat = time.monotonic()
+        self.context = {}
+        self.stalls = {'network': 0, 'redraw': 0, 'other': 0}
+        self.longest_stall = 0.0
+        self._published = 0.0
+        self._stop = threading.Event()
+        self.thread = None
+
+        self.logger = logs.get_logger('watchdog')
+        if log_path and not self.logger.handlers:
+            handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count)
+            handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+            self.logger.addHandler(handler)
+
+    # --- main thread ---
+    def beat(self):
+        """Heartbeat from the main loop (called once per frame tick)."""
+        now = time.monotonic()
+        self.last_beat = now
+        if now - self._published >= 1.0:
+            self._published = now
+            self.context = self.collect_context()
+
+    def collect_context(self):
+        """Phase and pending work, gathered on the main thread."""
+        from perf import pending_jobs
+
+        app = self.app
+        return {
+            'phase': app.get_launch_phase(),
+            'launch': app.launch_data.get('id') if app.launch_data else None,
+            'pending_jobs': pending_jobs(app.root),
+            'refresh_pending': app.refresh_job is not None,
+            'status_check_pending': app.status_check_job is not None or app.status_fetch_pending,
+            'canvas_items': len(app.canvas.find_all()),
+        }
+
+    # --- watchdog thread ---
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name='watchdog', daemon=True)
+        self.thread.start()
+        self.logger.info("Watchdog started (threshold %.1fs)", self.threshold)
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        stalled_since = None
+        while not self._stop.wait(self.interval):
+            late = time.monotonic() - self.last_beat
+            if late > self.threshold:
+                if stalled_since is None:
+                    stalled_since = self.last_beat
+                    self.report_stall(late)
+            elif stalled_since is not None:
+                self.report_recovery(stalled_since)
+                stalled_since = None
+
+    def main_stack(self):
+        """[(file, function)] and formatted text of the main thread stack."""
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return [], ''
+        summary = traceback.extract_stack(frame)
+        frames = [(os.path.basename(entry.filename), entry.name) for entry in reversed(summary)]
+        return frames, ''.join(traceback.format_list(summary))
+
+    def report_stall(self, late):
+        frames, stack_text = self.main_stack()
+        cause = classify_stack(frames)
+        self.stalls[cause] += 1
+        context = dict(self.context)
+        recent = '\n'.join(f"  {r['time']} {r['level']} {r['logger']}: {r['msg']}"
+                           for r in logs.ring_buffer.recent(10))
+        self.logger.warning(
+            "Main loop stalled for %.2fs (cause=%s, phase=%s, context=%s)\n"
+            "Main thread stack (most recent call last):\n%s"
+            "Recent log records:\n%s",
+            late, cause, context.get('phase'), context, stack_text, recent,
+            extra={'stall_cause': cause, 'stall_seconds': round(late, 2)}
+        )
+
+    def report_recovery(self, stalled_since):
+        length = time.monotonic() - stalled_since
+        self.longest_stall = max(self.longest_stall, length)
+        self.logger.info("Main loop recovered after %.2fs (stalls so far: %s)", length, self.stalls)
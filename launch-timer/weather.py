@@ -4,9 +4,15 @@ Weather system for Cape Canaveral, Florida.
 Fetches real weather data and provides visual effects.
 """
 
-import requests
-import random
-from datetime import datetime
+import clock
+import logs
+import quality
+import rng
+from entities import EntityStore
+from api_client import get_json
+
+log = logs.get_logger('weather')
+_rng = rng.stream('weather')
 
 
 class WeatherSystem:
@@ -16,22 +22,28 @@ class WeatherSystem:
         self.canvas = canvas
         self.current_weather = None
         self.weather_condition = "clear"  # clear, cloudy, rain, thunderstorm, fog
-        self.rain_drops = []
+        self.rain_drops = EntityStore(canvas, 'rain')
         self.lightning_flash = False
         self.lightning_timer = 0
         
     def fetch_weather(self):
-        """Fetch current weather from Cape Canaveral, FL using wttr.in API."""
+        """Fetch and apply the current weather in one go (blocks on the network)."""
+        return self.apply_weather(self.request_weather())
+    
+    def request_weather(self):
+        """Fetch current weather from Cape Canaveral, FL using wttr.in API.
+        
+        Only returns the parsed conditions (None on error), so it can run
+        on a worker thread; apply_weather() updates the state on the Tk thread.
+        """
         try:
             # Using wttr.in - free, no API key needed
             # Cape Canaveral coordinates: 28.3922° N, 80.6077° W
             url = "https://wttr.in/Cape_Canaveral,Florida?format=j1"
             
-            response = requests.get(url, timeout=15, headers={
+            data = get_json('weather', url, timeout=15, headers={
                 'User-Agent': 'Mozilla/5.0 (compatible; LaunchPad/1.0)'
             })
-            response.raise_for_status()
-            data = response.json()
             
             # Extract current conditions
             current = data['current_condition'][0]
@@ -48,33 +60,29 @@ class WeatherSystem:
                 'cloud_cover': current['cloudcover']
             }
             
-            self.current_weather = weather_info
-            self.determine_weather_condition(weather_info)
-            
-            print(f"\n=== WEATHER UPDATE ===")
-            print(f"Location: Cape Canaveral, FL")
-            print(f"Condition: {weather_info['condition']}")
-            print(f"Temperature: {weather_info['temp_f']}°F ({weather_info['temp_c']}°C)")
-            print(f"Humidity: {weather_info['humidity']}%")
-            print(f"Wind: {weather_info['wind_speed']} mph {weather_info['wind_dir']}")
-            print(f"Cloud Cover: {weather_info['cloud_cover']}%")
-            print(f"======================\n")
+            log.info("Weather update for Cape Canaveral, FL: %s, %s°F (%s°C), humidity %s%%, "
+                     "wind %s mph %s, cloud cover %s%%",
+                     weather_info['condition'], weather_info['temp_f'], weather_info['temp_c'],
+                     weather_info['humidity'], weather_info['wind_speed'], weather_info['wind_dir'],
+                     weather_info['cloud_cover'], extra={'weather': weather_info})
             
             return weather_info
             
-        except requests.exceptions.Timeout:
-            print(f"Weather API timeout - using default clear weather")
-            self.weather_condition = "clear"
-            return None
-        except requests.exceptions.ConnectionError as e:
-            print(f"Weather API connection error - using default clear weather")
-            self.weather_condition = "clear"
+        except OSError as e:  # requests' Timeout and ConnectionError derive from IOError
+            log.warning("Weather API %s - using default clear weather: %s", type(e).__name__, e)
             return None
         except Exception as e:
-            print(f"Error fetching weather: {e}")
-            print("Using default clear weather")
+            log.error("Error fetching weather, using default clear weather: %s", e)
+            return None
+    
+    def apply_weather(self, weather_info):
+        """Show fetched conditions (clear weather when the fetch failed)."""
+        if weather_info is None:
             self.weather_condition = "clear"
             return None
+        self.current_weather = weather_info
+        self.determine_weather_condition(weather_info)
+        return weather_info
     
     def determine_weather_condition(self, weather_info):
         """Determine visual weather condition from weather data."""
@@ -108,11 +116,11 @@ class WeatherSystem:
         else:
             self.weather_condition = "clear"
         
-        print(f"Visual weather condition set to: {self.weather_condition}")
+        log.debug("Visual weather condition set to: %s", self.weather_condition)
     
     def get_weather_sky_color(self):
         """Get sky color based on current weather and time of day."""
-        hour = datetime.now().hour
+        hour = clock.now().hour
         
         # Base colors for time of day
         if 10 <= hour < 16:  # Day
@@ -142,7 +150,7 @@ class WeatherSystem:
     
     def should_show_stars(self):
         """Determine if stars should be visible."""
-        hour = datetime.now().hour
+        hour = clock.now().hour
         is_night = hour >= 18 or hour < 6
         
         # Hide stars if cloudy/rainy/foggy
@@ -151,69 +159,58 @@ class WeatherSystem:
         
         return is_night
     
-    def create_rain_drop(self):
-        """Create a single rain drop."""
-        x = random.randint(0, 800)
-        y = random.randint(-20, 0)
-        length = random.randint(8, 15)
-        speed = random.uniform(12, 18)
-        
+    def rain_speed(self):
+        speed = _rng.uniform(12, 18)
         # Lighter rain for light_rain
         if self.weather_condition == "light_rain":
             speed *= 0.6
+        return speed
+    
+    def create_rain_drop(self):
+        """Create a single rain drop."""
+        x = _rng.randint(0, 800)
+        y = _rng.randint(-20, 0)
+        length = _rng.randint(8, 15)
         
         drop_id = self.canvas.create_line(
             x, y,
             x - 2, y + length,
             fill='#a8b8c8', width=1, tags='rain'
         )
-        
-        self.rain_drops.append({
-            'id': drop_id,
-            'x': x,
-            'y': y,
-            'speed': speed
-        })
+        self.rain_drops.add(x, y, vy=self.rain_speed(), items=drop_id)
     
     def update_rain(self):
         """Update rain drop positions."""
         if self.weather_condition not in ["rain", "light_rain", "thunderstorm"]:
             # Clear rain if weather changed
-            self.canvas.delete('rain')
-            self.rain_drops = []
+            if self.rain_drops:
+                self.rain_drops.clear()
             return
         
-        # Spawn new rain drops
-        spawn_rate = 3 if self.weather_condition == "light_rain" else 8
-        for _ in range(spawn_rate):
-            if len(self.rain_drops) < 150:
-                self.create_rain_drop()
+        drops = self.rain_drops
+        spawn_rate = (3 if self.weather_condition == "light_rain" else 8) * quality.settings['rain_spawn']
+        # Spawn the fractional part of the rate as a chance
+        spawn_count = int(spawn_rate) + (_rng.random() < spawn_rate % 1)
         
-        # Update existing drops
-        drops_to_remove = []
-        for drop in self.rain_drops:
-            drop['y'] += drop['speed']
-            
-            # Remove if off screen
-            if drop['y'] > 600:
-                self.canvas.delete(drop['id'])
-                drops_to_remove.append(drop)
+        # Drops that fell off screen are reused as this frame's new drops
+        # (back to the top with a new speed); the rest are deleted
+        for row in drops.rows_beyond('y', 600):
+            if spawn_count and len(drops) <= quality.settings['rain_cap']:
+                spawn_count -= 1
+                drops.move_to(row, _rng.randint(0, 800), _rng.randint(-20, 0))
+                drops.vy[row] = self.rain_speed()
             else:
-                # Move drop
-                self.canvas.coords(
-                    drop['id'],
-                    drop['x'], drop['y'],
-                    drop['x'] - 2, drop['y'] + random.randint(8, 15)
-                )
+                drops.remove(row)
+        for _ in range(spawn_count):
+            if len(drops) < quality.settings['rain_cap']:
+                self.create_rain_drop()
         
-        # Clean up off-screen drops
-        for drop in drops_to_remove:
-            self.rain_drops.remove(drop)
+        drops.advance()
     
     def trigger_lightning(self):
         """Trigger a lightning flash."""
         if self.weather_condition == "thunderstorm":
-            if random.random() < 0.02:  # 2% chance per frame
+            if _rng.random() < 0.02:  # 2% chance per frame
                 self.lightning_flash = True
                 self.lightning_timer = 0
     
@@ -259,8 +256,8 @@ class WeatherSystem:
     
     def update(self):
         """Update all weather effects (call every frame)."""
-        # Update rain
-        if self.weather_condition in ["rain", "light_rain", "thunderstorm"]:
+        # Update rain (and clear what is left of it once the rain stops)
+        if self.weather_condition in ["rain", "light_rain", "thunderstorm"] or self.rain_drops:
             self.update_rain()
         
         # Update lightning
@@ -287,7 +284,7 @@ class WeatherSystem:
     
     def get_cloud_color(self):
         """Get cloud color based on weather."""
-        hour = datetime.now().hour
+        hour = clock.now().hour
         
         if self.weather_condition in ["rain", "thunderstorm"]:
             return '#606060'  # Dark gray
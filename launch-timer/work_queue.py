@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Cooperative, time-sliced work queue for expensive redraws.
+
+Bulk canvas work (the background scene, the staged rocket, info sign
+redraws) is submitted as a job and run in idle time, a few chunks per
+frame, instead of inside one long Tk callback:
+
+    queue = WorkQueue(root)
+    queue.submit(draw_background_steps(canvas), BULK, on_done=set_clouds)
+
+A job is a generator (each `yield` ends one chunk) or a plain callable
+(one chunk). Each slice runs from after_idle, so the frame's timers
+(countdown, animation loops) always go first, and stops once the frame
+budget is spent (or, with budget_chunks, after that many chunks, which
+the headless tools use so runs repeat exactly); the rest waits for the
+next frame. Jobs run in priority order, oldest first within a priority.
+Submitting a job with the name of a pending one replaces it, so a burst
+of redraw requests collapses into a single redraw. A job that raises is
+logged and dropped; the jobs behind it still run.
+"""
+
+import heapq
+import itertools
+import time
+
+import logs
+import tracing
+
+log = logs.get_logger('work')
+
+
+# Priorities (lower runs first)
+NORMAL = 1   # visible updates such as the info sign
+BULK = 2     # scene building and pre-staging
+
+
+class Job:
+    """A submitted piece of work."""
+
+    def __init__(self, work, priority, name, on_done):
+        self.priority = priority
+        self.name = name
+        self.on_done = on_done
+        self.cancelled = False
+        self.done = False
+        self.chunks = 0
+        if callable(work):
+            self.steps = None
+            self.work = work
+        else:
+            self.steps = work
+            self.work = None
+
+    def cancel(self):
+        self.cancelled = True
+
+    def step(self):
+        """Run one chunk; returns True when the job has finished."""
+        self.chunks += 1
+        if self.steps is None:
+            self.finish(self.work())
+            return True
+        try:
+            next(self.steps)
+        except StopIteration as stop:
+            self.finish(stop.value)
+            return True
+        return False
+
+    def finish(self, result):
+        self.done = True
+        if self.on_done:
+            self.on_done(result)
+
+
+class WorkQueue:
+    """Runs submitted jobs in budgeted slices, one slice per frame."""
+
+    def __init__(self, root, budget_ms=8, frame_ms=16, budget_chunks=None):
+        self.root = root
+        self.budget_ms = budget_ms
+        self.budget_chunks = budget_chunks
+        self.frame_ms = frame_ms
+        self._heap = []
+        self._order = itertools.count()
+        self._named = {}
+        self._slice_job = None
+        self.slices = 0
+        self.chunks = 0
+
+    def __len__(self):
+        return sum(1 for _, _, job in self._heap if not job.cancelled)
+
+    def submit(self, work, priority=NORMAL, name=None, on_done=None):
+        """Queue a generator or callable; replaces a pending job with the same name."""
+        if name is not None and name in self._named:
+            self._named[name].cancel()
+        job = Job(work, priority, name, on_done)
+        if name is not None:
+            self._named[name] = job
+        heapq.heappush(self._heap, (priority, next(self._order), job))
+        if self._slice_job is None:
+            self._slice_job = self.root.after_idle(self.run_slice)
+        return job
+
+    def cancel(self, name):
+        job = self._named.pop(name, None)
+        if job:
+            job.cancel()
+
+    def run_slice(self):
+        """Run chunks until the budget is spent, then yield to the next frame."""
+        self._slice_job = None
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000
+        chunks = 0
+        with tracing.recorder.span('work.slice', 'queue'):
+            while self._heap:
+                job = self._heap[0][2]
+                if job.cancelled:
+                    heapq.heappop(self._heap)
+                    continue
+                if self._step(job):
+                    heapq.heappop(self._heap)
+                    if self._named.get(job.name) is job:
+                        del self._named[job.name]
+                self.chunks += 1
+                chunks += 1
+                if self.budget_chunks is not None:
+                    if chunks >= self.budget_chunks:
+                        break
+                elif time.perf_counter() >= deadline:
+                    break
+        self.slices += 1
+        if self._heap:
+            log.debug("Work slice ran %.1fms, %d jobs left",
+                      (time.perf_counter() - started) * 1000, len(self))
+            self._slice_job = self.root.after(self.frame_ms, self._next_slice)
+
+    def _step(self, job):
+        """Run one chunk of a job; True when it has finished (or failed)."""
+        try:
+            return job.step()
+        except Exception:
+            log.exception("Work job %s failed - dropping it", job.name or job.work or job.steps)
+            job.cancel()
+            return True
+
+    def _next_slice(self):
+        self._slice_job = self.root.after_idle(self.run_slice)
+
+    def flush(self):
+        """Run everything now (used where the result is needed immediately)."""
+        if self._slice_job is not None:
+            self.root.after_cancel(self._slice_job)
+            self._slice_job = None
+        while self._heap:
+            _, _, job = heapq.heappop(self._heap)
+            if job.cancelled:
+                continue
+            while not self._step(job):
+                pass
+        self._named.clear()